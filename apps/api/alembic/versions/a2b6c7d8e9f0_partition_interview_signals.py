@@ -0,0 +1,86 @@
+"""partition interview_signals by month on created_at
+
+Revision ID: a2b6c7d8e9f0
+Revises: f1a5b6c7d8e9
+Create Date: 2026-10-18 11:30:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a2b6c7d8e9f0'
+down_revision = 'f1a5b6c7d8e9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Move the plain table aside; its indexes are recreated on the partitioned parent
+    op.execute("ALTER TABLE interview_signals RENAME TO interview_signals_legacy")
+    op.execute("DROP INDEX IF EXISTS ix_signals_interview_kind_created")
+    op.execute("DROP INDEX IF EXISTS ix_sig_focus_meta")
+    op.execute("ALTER TABLE interview_signals_legacy DROP CONSTRAINT IF EXISTS interview_signals_pkey")
+
+    op.execute(
+        """
+        CREATE TABLE interview_signals (
+            id INTEGER NOT NULL DEFAULT nextval('interview_signals_id_seq'),
+            interview_id INTEGER NOT NULL REFERENCES interviews(id) ON DELETE CASCADE,
+            kind signal_kind NOT NULL,
+            meta JSONB,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            CONSTRAINT interview_signals_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at);
+        """
+    )
+    # One partition per month from the oldest existing row through three months ahead
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            m date := date_trunc('month', COALESCE((SELECT min(created_at) FROM interview_signals_legacy), now()))::date;
+            last_m date := (date_trunc('month', now()) + interval '3 months')::date;
+        BEGIN
+            WHILE m <= last_m LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF interview_signals FOR VALUES FROM (%L) TO (%L)',
+                    'interview_signals_' || to_char(m, 'YYYY_MM'), m, (m + interval '1 month')::date
+                );
+                m := (m + interval '1 month')::date;
+            END LOOP;
+        END $$;
+        """
+    )
+    # Created on the parent, so every partition gets its own local index
+    op.execute("CREATE INDEX ix_signals_interview_kind_created ON interview_signals (interview_id, kind, created_at)")
+    op.execute("CREATE INDEX ix_sig_focus_meta ON interview_signals USING gin (meta) WHERE kind = 'focus_lost'")
+
+    op.execute("INSERT INTO interview_signals (id, interview_id, kind, meta, created_at) SELECT id, interview_id, kind, meta, created_at FROM interview_signals_legacy")
+    op.execute("ALTER SEQUENCE interview_signals_id_seq OWNED BY interview_signals.id")
+    op.execute("DROP TABLE interview_signals_legacy")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE interview_signals RENAME TO interview_signals_partitioned")
+    op.execute("DROP INDEX IF EXISTS ix_signals_interview_kind_created")
+    op.execute("DROP INDEX IF EXISTS ix_sig_focus_meta")
+    # The PK keeps its name across the rename; free it for the plain table
+    op.execute("ALTER TABLE interview_signals_partitioned DROP CONSTRAINT IF EXISTS interview_signals_pkey")
+    op.execute(
+        """
+        CREATE TABLE interview_signals (
+            id INTEGER NOT NULL DEFAULT nextval('interview_signals_id_seq'),
+            interview_id INTEGER NOT NULL REFERENCES interviews(id) ON DELETE CASCADE,
+            kind signal_kind NOT NULL,
+            meta JSONB,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            CONSTRAINT interview_signals_pkey PRIMARY KEY (id)
+        );
+        """
+    )
+    op.execute("INSERT INTO interview_signals (id, interview_id, kind, meta, created_at) SELECT id, interview_id, kind, meta, created_at FROM interview_signals_partitioned")
+    op.execute("ALTER SEQUENCE interview_signals_id_seq OWNED BY interview_signals.id")
+    op.execute("DROP TABLE interview_signals_partitioned")
+    op.execute("CREATE INDEX ix_signals_interview_kind_created ON interview_signals (interview_id, kind, created_at)")
+    op.execute("CREATE INDEX ix_sig_focus_meta ON interview_signals USING gin (meta) WHERE kind = 'focus_lost'")
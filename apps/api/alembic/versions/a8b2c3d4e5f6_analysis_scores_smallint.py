@@ -0,0 +1,43 @@
+"""store interview_analyses scores as smallint hundredths
+
+Revision ID: a8b2c3d4e5f6
+Revises: f7a1b2c3d4e5
+Create Date: 2026-10-18 13:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8b2c3d4e5f6'
+down_revision = 'f7a1b2c3d4e5'
+branch_labels = None
+depends_on = None
+
+
+_COLUMNS = ('overall_score', 'communication_score', 'technical_score', 'cultural_fit_score')
+
+
+def upgrade() -> None:
+    for col in _COLUMNS:
+        op.alter_column(
+            'interview_analyses',
+            col,
+            type_=sa.SmallInteger(),
+            existing_type=sa.Float(),
+            existing_nullable=True,
+            postgresql_using=f'round({col} * 100)::smallint',
+        )
+
+
+def downgrade() -> None:
+    for col in _COLUMNS:
+        op.alter_column(
+            'interview_analyses',
+            col,
+            type_=sa.Float(),
+            existing_type=sa.SmallInteger(),
+            existing_nullable=True,
+            postgresql_using=f'{col} / 100.0',
+        )
@@ -0,0 +1,37 @@
+"""add BRIN indexes on append-only timestamp columns
+
+Revision ID: b3c7d8e9f0a1
+Revises: a2b6c7d8e9f0
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3c7d8e9f0a1'
+down_revision = 'a2b6c7d8e9f0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_interview_signals_created_brin',
+        'interview_signals',
+        ['created_at'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32},
+    )
+    op.create_index(
+        'ix_candidate_consents_accepted_brin',
+        'candidate_consents',
+        ['accepted_at'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_candidate_consents_accepted_brin', table_name='candidate_consents')
+    op.drop_index('ix_interview_signals_created_brin', table_name='interview_signals')
@@ -0,0 +1,57 @@
+"""add indexes on hot filter columns
+
+Revision ID: b7c1d2e3f4a5
+Revises: company_001
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7c1d2e3f4a5'
+down_revision = 'company_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_consents_interview', 'candidate_consents', ['interview_id'])
+    op.create_index('ix_consents_candidate', 'candidate_consents', ['candidate_id'])
+    op.create_index('ix_signals_interview_kind_created', 'interview_signals', ['interview_id', 'kind', 'created_at'])
+    # Refuse to run (rather than pick a credential to delete) if duplicates exist
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            dupes text;
+        BEGIN
+            SELECT string_agg(user_id::text || '/' || provider, ', ') INTO dupes
+            FROM (
+                SELECT user_id, provider FROM oauth_credentials
+                GROUP BY user_id, provider HAVING count(*) > 1
+            ) d;
+            IF dupes IS NOT NULL THEN
+                RAISE EXCEPTION 'oauth_credentials has duplicate (user_id, provider) rows: %. Remove the stale ones before upgrading.', dupes;
+            END IF;
+        END $$;
+        """
+    )
+    op.create_unique_constraint('uq_oauth_user_provider', 'oauth_credentials', ['user_id', 'provider'])
+    op.create_index(
+        'ix_users_owner',
+        'users',
+        ['owner_user_id'],
+        postgresql_where=sa.text('owner_user_id IS NOT NULL'),
+    )
+    op.create_index('ix_jobs_user_created', 'jobs', ['user_id', 'created_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_user_created', table_name='jobs')
+    op.drop_index('ix_users_owner', table_name='users')
+    op.drop_constraint('uq_oauth_user_provider', 'oauth_credentials', type_='unique')
+    op.drop_index('ix_signals_interview_kind_created', table_name='interview_signals')
+    op.drop_index('ix_consents_candidate', table_name='candidate_consents')
+    op.drop_index('ix_consents_interview', table_name='candidate_consents')
@@ -0,0 +1,48 @@
+"""store jobs.extra_questions as text[] instead of a newline-separated blob
+
+Revision ID: b9c3d4e5f6a7
+Revises: a8b2c3d4e5f6
+Create Date: 2026-10-18 13:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'b9c3d4e5f6a7'
+down_revision = 'a8b2c3d4e5f6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # ALTER ... USING cannot contain a subquery, so go through a temp column
+    op.add_column('jobs', sa.Column('extra_questions_arr', postgresql.ARRAY(sa.Text()), nullable=True))
+    op.execute(
+        """
+        UPDATE jobs SET extra_questions_arr = NULLIF(
+            ARRAY(
+                SELECT btrim(q)
+                FROM unnest(regexp_split_to_array(extra_questions, E'\\r?\\n')) AS q
+                WHERE btrim(q) <> ''
+            ),
+            '{}'
+        )
+        WHERE extra_questions IS NOT NULL
+        """
+    )
+    op.drop_column('jobs', 'extra_questions')
+    op.alter_column('jobs', 'extra_questions_arr', new_column_name='extra_questions')
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'jobs',
+        'extra_questions',
+        type_=sa.Text(),
+        existing_type=postgresql.ARRAY(sa.Text()),
+        existing_nullable=True,
+        postgresql_using="array_to_string(extra_questions, E'\\n')",
+    )
@@ -0,0 +1,27 @@
+"""add users.updated_at
+
+Revision ID: c0d4e5f6a7b8
+Revises: b9c3d4e5f6a7
+Create Date: 2026-10-18 13:50:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c0d4e5f6a7b8'
+down_revision = 'b9c3d4e5f6a7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'users',
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'updated_at')
@@ -0,0 +1,29 @@
+"""add partial index on oauth_credentials.expires_at
+
+Revision ID: c4d8e9f0a1b2
+Revises: b3c7d8e9f0a1
+Create Date: 2026-10-18 12:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4d8e9f0a1b2'
+down_revision = 'b3c7d8e9f0a1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_oauth_expiring',
+        'oauth_credentials',
+        ['expires_at'],
+        postgresql_where=sa.text('expires_at IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_oauth_expiring', table_name='oauth_credentials')
@@ -0,0 +1,56 @@
+"""convert jobs.rubric_json from text to jsonb
+
+Revision ID: c8d2e3f4a5b6
+Revises: b7c1d2e3f4a5, aabbccddeeff_add_job_rubric_json
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'c8d2e3f4a5b6'
+# Merge with the rubric_json head so the column exists before it is converted
+down_revision = ('b7c1d2e3f4a5', 'aabbccddeeff_add_job_rubric_json')
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Blank strings cannot be cast to jsonb; treat them as "no rubric"
+    op.execute("UPDATE jobs SET rubric_json = NULL WHERE rubric_json IS NOT NULL AND btrim(rubric_json) = ''")
+    # Other legacy client strings may not be JSON at all; they never held a
+    # usable rubric (the API now requires a JSON object), so they become NULL
+    # instead of aborting the whole cast (cf. d9e3f4a5b6c7)
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION pg_temp.try_jsonb_or_null(t text) RETURNS jsonb AS $$
+        BEGIN
+            RETURN t::jsonb;
+        EXCEPTION WHEN others THEN
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql IMMUTABLE;
+        """
+    )
+    op.alter_column(
+        'jobs',
+        'rubric_json',
+        type_=postgresql.JSONB(),
+        existing_type=sa.Text(),
+        existing_nullable=True,
+        postgresql_using='pg_temp.try_jsonb_or_null(rubric_json)',
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'jobs',
+        'rubric_json',
+        type_=sa.Text(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using='rubric_json::text',
+    )
@@ -0,0 +1,36 @@
+"""store jobs.default_invite_expiry_days as smallint
+
+Revision ID: d5e9f0a1b2c3
+Revises: c4d8e9f0a1b2
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5e9f0a1b2c3'
+down_revision = 'c4d8e9f0a1b2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'jobs',
+        'default_invite_expiry_days',
+        type_=sa.SmallInteger(),
+        existing_type=sa.Integer(),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'jobs',
+        'default_invite_expiry_days',
+        type_=sa.Integer(),
+        existing_type=sa.SmallInteger(),
+        existing_nullable=False,
+    )
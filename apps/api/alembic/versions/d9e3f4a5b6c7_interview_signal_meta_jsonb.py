@@ -0,0 +1,59 @@
+"""convert interview_signals.meta from text to jsonb
+
+Revision ID: d9e3f4a5b6c7
+Revises: c8d2e3f4a5b6
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'd9e3f4a5b6c7'
+down_revision = 'c8d2e3f4a5b6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Legacy rows may hold plain strings; keep them as JSON strings instead of failing the cast
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION pg_temp.try_jsonb(t text) RETURNS jsonb AS $$
+        BEGIN
+            RETURN t::jsonb;
+        EXCEPTION WHEN others THEN
+            RETURN to_jsonb(t);
+        END;
+        $$ LANGUAGE plpgsql IMMUTABLE;
+        """
+    )
+    op.alter_column(
+        'interview_signals',
+        'meta',
+        type_=postgresql.JSONB(),
+        existing_type=sa.Text(),
+        existing_nullable=True,
+        postgresql_using='pg_temp.try_jsonb(meta)',
+    )
+    op.create_index(
+        'ix_sig_focus_meta',
+        'interview_signals',
+        ['meta'],
+        postgresql_using='gin',
+        postgresql_where=sa.text("kind = 'focus_lost'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_sig_focus_meta', table_name='interview_signals')
+    op.alter_column(
+        'interview_signals',
+        'meta',
+        type_=sa.Text(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using='meta::text',
+    )
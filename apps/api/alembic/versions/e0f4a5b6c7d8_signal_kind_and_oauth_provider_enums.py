@@ -0,0 +1,104 @@
+"""store interview_signals.kind and oauth_credentials.provider as enums
+
+Revision ID: e0f4a5b6c7d8
+Revises: d9e3f4a5b6c7
+Create Date: 2026-10-18 10:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'e0f4a5b6c7d8'
+down_revision = 'd9e3f4a5b6c7'
+branch_labels = None
+depends_on = None
+
+SIGNAL_KINDS = ('focus_lost', 'tab_hidden', 'mic_muted')
+OAUTH_PROVIDERS = ('google', 'zoom')
+
+
+def _abort_on_unknown(table: str, column: str, allowed: tuple) -> None:
+    """Fail the migration, listing the offending values, if any row falls outside the enum."""
+    allowed_sql = ", ".join(f"'{v}'" for v in allowed)
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            bad text;
+        BEGIN
+            SELECT string_agg(DISTINCT {column}, ', ') INTO bad
+            FROM {table} WHERE {column} NOT IN ({allowed_sql});
+            IF bad IS NOT NULL THEN
+                RAISE EXCEPTION '{table}.{column} has values outside the enum: %. Map or remove them before upgrading.', bad;
+            END IF;
+        END $$;
+        """
+    )
+
+
+def upgrade() -> None:
+    # Refuse to run (rather than lose rows) if legacy data does not fit the enums
+    _abort_on_unknown('interview_signals', 'kind', SIGNAL_KINDS)
+    _abort_on_unknown('oauth_credentials', 'provider', OAUTH_PROVIDERS)
+
+    op.execute("CREATE TYPE signal_kind AS ENUM ('focus_lost', 'tab_hidden', 'mic_muted')")
+    op.execute("CREATE TYPE oauth_provider AS ENUM ('google', 'zoom')")
+
+    # The partial index predicate references kind; rebuild it against the enum column
+    op.drop_index('ix_sig_focus_meta', table_name='interview_signals')
+    op.alter_column(
+        'interview_signals',
+        'kind',
+        type_=postgresql.ENUM(*SIGNAL_KINDS, name='signal_kind', create_type=False),
+        existing_type=sa.String(length=50),
+        existing_nullable=False,
+        postgresql_using='kind::signal_kind',
+    )
+    op.create_index(
+        'ix_sig_focus_meta',
+        'interview_signals',
+        ['meta'],
+        postgresql_using='gin',
+        postgresql_where=sa.text("kind = 'focus_lost'"),
+    )
+
+    op.alter_column(
+        'oauth_credentials',
+        'provider',
+        type_=postgresql.ENUM(*OAUTH_PROVIDERS, name='oauth_provider', create_type=False),
+        existing_type=sa.String(length=20),
+        existing_nullable=False,
+        postgresql_using='provider::oauth_provider',
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'oauth_credentials',
+        'provider',
+        type_=sa.String(length=20),
+        existing_type=postgresql.ENUM(*OAUTH_PROVIDERS, name='oauth_provider', create_type=False),
+        existing_nullable=False,
+        postgresql_using='provider::text',
+    )
+    op.drop_index('ix_sig_focus_meta', table_name='interview_signals')
+    op.alter_column(
+        'interview_signals',
+        'kind',
+        type_=sa.String(length=50),
+        existing_type=postgresql.ENUM(*SIGNAL_KINDS, name='signal_kind', create_type=False),
+        existing_nullable=False,
+        postgresql_using='kind::text',
+    )
+    op.create_index(
+        'ix_sig_focus_meta',
+        'interview_signals',
+        ['meta'],
+        postgresql_using='gin',
+        postgresql_where=sa.text("kind = 'focus_lost'"),
+    )
+    op.execute("DROP TYPE oauth_provider")
+    op.execute("DROP TYPE signal_kind")
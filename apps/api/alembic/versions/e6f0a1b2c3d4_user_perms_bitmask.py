@@ -0,0 +1,41 @@
+"""pack users.can_* permission booleans into a perms bitmask
+
+Revision ID: e6f0a1b2c3d4
+Revises: d5e9f0a1b2c3
+Create Date: 2026-10-18 13:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6f0a1b2c3d4'
+down_revision = 'd5e9f0a1b2c3'
+branch_labels = None
+depends_on = None
+
+
+# Bit order must match the CAN_* constants in src/db/models/user.py
+_FLAGS = (
+    ('can_manage_jobs', 0),
+    ('can_manage_candidates', 1),
+    ('can_view_interviews', 2),
+    ('can_manage_members', 3),
+)
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('perms', sa.Integer(), nullable=False, server_default='0'))
+    packed = ' | '.join(f'(COALESCE({col}, false)::int << {bit})' for col, bit in _FLAGS)
+    op.execute(f'UPDATE users SET perms = {packed}')
+    for col, _ in _FLAGS:
+        op.drop_column('users', col)
+
+
+def downgrade() -> None:
+    for col, _ in _FLAGS:
+        op.add_column('users', sa.Column(col, sa.Boolean(), nullable=False, server_default='false'))
+    assignments = ', '.join(f'{col} = (perms & {1 << bit}) <> 0' for col, bit in _FLAGS)
+    op.execute(f'UPDATE users SET {assignments}')
+    op.drop_column('users', 'perms')
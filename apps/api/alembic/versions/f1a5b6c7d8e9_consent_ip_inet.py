@@ -0,0 +1,48 @@
+"""convert candidate_consents.ip to inet
+
+Revision ID: f1a5b6c7d8e9
+Revises: e0f4a5b6c7d8
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1a5b6c7d8e9'
+down_revision = 'e0f4a5b6c7d8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Non-address values (e.g. "testclient") cannot be cast; clear them first
+    op.execute(
+        """
+        UPDATE candidate_consents SET ip = NULL
+        WHERE ip IS NOT NULL
+          AND ip !~ '^[0-9.]+$'
+          AND ip !~ '^[0-9a-fA-F:.]+$';
+        """
+    )
+    op.alter_column(
+        'candidate_consents',
+        'ip',
+        type_=postgresql.INET(),
+        existing_type=sa.String(length=64),
+        existing_nullable=True,
+        postgresql_using='ip::inet',
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'candidate_consents',
+        'ip',
+        type_=sa.String(length=64),
+        existing_type=postgresql.INET(),
+        existing_nullable=True,
+        postgresql_using='host(ip)',
+    )
@@ -0,0 +1,50 @@
+"""encrypt oauth_credentials tokens and store them as bytea
+
+Revision ID: f7a1b2c3d4e5
+Revises: e6f0a1b2c3d4
+Create Date: 2026-10-18 13:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from src.core.encryption import encryption_manager
+
+
+# revision identifiers, used by Alembic.
+revision = 'f7a1b2c3d4e5'
+down_revision = 'e6f0a1b2c3d4'
+branch_labels = None
+depends_on = None
+
+
+_COLUMNS = ('access_token', 'refresh_token')
+
+
+def _swap_columns(new_type, convert) -> None:
+    """Copy each token column into a temp column of new_type, converting row by row."""
+    bind = op.get_bind()
+    for col in _COLUMNS:
+        op.add_column('oauth_credentials', sa.Column(f'{col}_new', new_type, nullable=True))
+    rows = bind.execute(sa.text('SELECT id, access_token, refresh_token FROM oauth_credentials')).fetchall()
+    for row in rows:
+        bind.execute(
+            sa.text('UPDATE oauth_credentials SET access_token_new = :a, refresh_token_new = :r WHERE id = :id'),
+            {
+                'a': convert(row.access_token),
+                'r': convert(row.refresh_token) if row.refresh_token is not None else None,
+                'id': row.id,
+            },
+        )
+    for col in _COLUMNS:
+        op.drop_column('oauth_credentials', col)
+        op.alter_column('oauth_credentials', f'{col}_new', new_column_name=col)
+    op.alter_column('oauth_credentials', 'access_token', existing_type=new_type, nullable=False)
+
+
+def upgrade() -> None:
+    _swap_columns(sa.LargeBinary(), encryption_manager.encrypt_bytes)
+
+
+def downgrade() -> None:
+    _swap_columns(sa.Text(), encryption_manager.decrypt_bytes)
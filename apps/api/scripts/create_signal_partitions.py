@@ -0,0 +1,40 @@
+# pyright: reportMissingImports=false, reportMissingModuleSource=false
+"""Create upcoming monthly partitions of interview_signals.
+
+Run daily from cron; it is idempotent. Retention is handled by detaching and
+dropping old partitions (ALTER TABLE interview_signals DETACH PARTITION ...).
+"""
+import asyncio
+import datetime as dt
+
+from sqlalchemy import text
+
+from src.db.session import engine
+
+MONTHS_AHEAD = 3
+
+
+def _add_month(d: dt.date) -> dt.date:
+    return dt.date(d.year + (d.month // 12), d.month % 12 + 1, 1)
+
+
+async def main() -> None:
+    month = dt.date.today().replace(day=1)
+    created = []
+    async with engine.begin() as conn:
+        for _ in range(MONTHS_AHEAD + 1):
+            nxt = _add_month(month)
+            name = f"interview_signals_{month:%Y_%m}"
+            await conn.execute(
+                text(
+                    f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF interview_signals '
+                    f"FOR VALUES FROM ('{month.isoformat()}') TO ('{nxt.isoformat()}')"
+                )
+            )
+            created.append(name)
+            month = nxt
+    print(f"Partitions ensured: {', '.join(created)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
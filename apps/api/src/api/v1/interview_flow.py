@@ -72,14 +72,8 @@ async def next_question(req: NextQuestionRequest, session: AsyncSession = Depend
             if job:
                 if job.description:
                     job_desc = job.description
-                # Parse extra recruiter-provided questions (one per line)
-                extra_list = []
-                try:
-                    extra_raw = getattr(job, "extra_questions", None)
-                    if isinstance(extra_raw, str) and extra_raw.strip():
-                        extra_list = [q.strip() for q in extra_raw.splitlines() if q.strip()]
-                except Exception:
-                    pass
+                # Extra recruiter-provided questions (stored pre-split as text[])
+                extra_list = list(job.extra_questions or [])
                 try:
                     req_cfg = job.requirements_config  # type: ignore[attr-defined]
                 except Exception:
@@ -1092,7 +1086,7 @@ async def next_turn(body: NextTurnIn, session: AsyncSession = Depends(get_sessio
                     job_context = job.description[:2000]
             
             # Analyze weaknesses and generate targeted question
-            weakness_analysis = await analyze_response_weaknesses(history, job_context)
+            weakness_analysis = await analyze_response_weaknesses(history, job_context, body.interview_id)
             
             if weakness_analysis.get("weak_areas"):
                 priority_area = weakness_analysis["weak_areas"][0]  # Get highest priority weakness
@@ -16,7 +16,7 @@ from src.db.models.candidate import Candidate
 from src.db.models.interview import Interview
 from src.db.models.candidate_profile import CandidateProfile
 from src.db.models.conversation import InterviewAnalysis
-from src.core.s3 import put_object_bytes, generate_presigned_put_url_at_key, generate_presigned_get_url
+from src.core.s3 import put_object_bytes_async, generate_presigned_put_url_at_key, generate_presigned_get_url
 from fastapi import Body
 from datetime import datetime, timedelta
 from uuid import uuid4
@@ -33,6 +33,27 @@ from src.services.comprehensive_analyzer import ComprehensiveAnalyzer
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
 
+def _parse_rubric_json(raw: Optional[str]) -> Optional[dict]:
+    """Parse the client-supplied rubric JSON string for the JSONB column."""
+    if not raw or not raw.strip():
+        return None
+    try:
+        cfg = json.loads(raw)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="rubric_json must be valid JSON")
+    if not isinstance(cfg, dict):
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="rubric_json must be a JSON object")
+    return cfg
+
+
+def _split_extra_questions(raw: Optional[str]) -> Optional[list[str]]:
+    """Split the newline-separated questions from the client into the text[] column."""
+    if not raw:
+        return None
+    questions = [q.strip() for q in raw.splitlines() if q.strip()]
+    return questions or None
+
+
 def create_name_slug(name: str, candidate_id: int) -> str:
     """Create URL-safe slug from candidate name for S3 paths."""
     name_for_path = (name or "unknown").lower()
@@ -118,8 +139,8 @@ async def create_job(
     job = Job(
         title=job_in.title,
         description=job_in.description,
-        extra_questions=(job_in.extra_questions or None),
-        rubric_json=(job_in.rubric_json or None),
+        extra_questions=_split_extra_questions(job_in.extra_questions),
+        rubric_json=_parse_rubric_json(job_in.rubric_json),
         user_id=get_effective_owner_id(current_user),
         created_by_user_id=current_user.id,
         default_invite_expiry_days=expiry,
@@ -138,8 +159,7 @@ async def create_job(
                 {"label": "İletişim", "weight": float(weights.get("communication", 0.2))},
                 {"label": "Kültür/İş Uygunluğu", "weight": float(weights.get("culture", 0.2))},
             ]
-            import json as _json
-            job.rubric_json = _json.dumps({"criteria": crit}, ensure_ascii=False)
+            job.rubric_json = {"criteria": crit}
             await session.commit()
             await session.refresh(job)
     except Exception:
@@ -174,7 +194,11 @@ async def update_job(
     for field, value in job_in.dict(exclude_unset=True).items():
         if field == "expires_in_days" and value is not None:
             job.default_invite_expiry_days = value
-        elif field in {"title", "description", "extra_questions", "rubric_json"}:
+        elif field == "rubric_json":
+            job.rubric_json = _parse_rubric_json(value)
+        elif field == "extra_questions":
+            job.extra_questions = _split_extra_questions(value)
+        elif field in {"title", "description"}:
             setattr(job, field, value)
     await session.commit()
     await session.refresh(job)
@@ -305,7 +329,7 @@ async def bulk_upload_candidates(
             s3_available = bool(settings.s3_bucket)
             if s3_available:
                 try:
-                    resume_url = put_object_bytes(temp_key, content, f.content_type or "application/octet-stream")
+                    resume_url = await put_object_bytes_async(temp_key, content, f.content_type or "application/octet-stream")
                 except Exception:
                     # Treat as dev fallback if S3 write fails
                     resume_url = None
@@ -377,8 +401,8 @@ async def bulk_upload_candidates(
                 final_key = f"resumes/job-{job.id}/{name_slug}.{file_ext}"
                 temp_s3_key = temp_key
                 try:
-                    from src.core.s3 import move_object
-                    final_url = move_object(temp_s3_key, final_key)
+                    from src.core.s3 import move_object_async
+                    final_url = await move_object_async(temp_s3_key, final_key)
                     cand.resume_url = final_url  # Update with final clean URL
                 except Exception as e:
                     print(f"Failed to move resume to clean path: {e}")
@@ -13,7 +13,6 @@ from src.db.models.candidate import Candidate
 from src.db.models.job import Job
 from src.core.s3 import upsert_lifecycle_rule
 from src.core.config import settings
-import json as _json
 
 
 router = APIRouter(prefix="/metrics", tags=["metrics"])
@@ -94,7 +93,7 @@ async def rubric_breakdown(job_id: int, session: AsyncSession = Depends(get_sess
         return {"job_id": job_id, "criteria": []}
     try:
         if job.rubric_json:
-            cfg = _json.loads(job.rubric_json)
+            cfg = job.rubric_json
             arr = cfg.get("criteria") if isinstance(cfg, dict) else []
             if isinstance(arr, list):
                 return {"job_id": job_id, "criteria": arr}
@@ -2,7 +2,9 @@ from datetime import datetime
 from typing import Optional, List, Any, Dict
 from enum import Enum
 
-from pydantic import BaseModel, Field, EmailStr
+import json
+
+from pydantic import BaseModel, Field, EmailStr, field_validator
 
 
 # ---- Conversation ----
@@ -98,6 +100,22 @@ class JobRead(JobBase):
         "from_attributes": True,
     }
 
+    @field_validator("rubric_json", mode="before")
+    @classmethod
+    def _rubric_to_str(cls, v: Any) -> Any:
+        # Column is JSONB (dict); the API keeps exposing it as a JSON string
+        if isinstance(v, (dict, list)):
+            return json.dumps(v, ensure_ascii=False)
+        return v
+
+    @field_validator("extra_questions", mode="before")
+    @classmethod
+    def _extra_questions_to_str(cls, v: Any) -> Any:
+        # Column is text[]; the API keeps the newline-separated form
+        if isinstance(v, list):
+            return "\n".join(v)
+        return v
+
 
 # ---- Candidate ----
 
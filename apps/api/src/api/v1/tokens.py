@@ -3,6 +3,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timezone
 from pydantic import BaseModel
+import ipaddress
 import re
 import unicodedata
 
@@ -49,6 +50,8 @@ async def record_consent(body: ConsentBody, request: Request, session: AsyncSess
         ip = None
         try:
             ip = request.client.host if request and request.client else None
+            # Column is INET; hostnames/placeholders (e.g. "testclient") are not storable
+            ip = str(ipaddress.ip_address(ip)) if ip else None
         except Exception:
             ip = None
         consent = CandidateConsent(candidate_id=cand.id, interview_id=interview.id, ip=ip, text_version=body.text_version)
@@ -10,6 +10,7 @@ from fastapi_users.password import PasswordHelper
 from fastapi_users import IntegerIDMixin
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.auth.user_cache import user_cache
 from src.core.config import settings
 from src.db.models.user import User
 from src.db.session import get_session
@@ -56,8 +57,31 @@ class UserUpdate(fu_schemas.BaseUserUpdate):
 
 # Database dependency ----------------------------------------------
 
+class CachedUserDatabase(SQLAlchemyUserDatabase):
+    """Serves get(id) from the Redis user cache; the auth hot path skips the DB on a hit."""
+
+    async def get(self, id):
+        cached = await user_cache.get(id)
+        if cached is not None:
+            return user_cache.to_user(cached, self.session.sync_session)
+        user = await super().get(id)
+        if user is not None:
+            await user_cache.put(user)
+        return user
+
+    async def update(self, user, update_dict):
+        user = await super().update(user, update_dict)
+        await user_cache.invalidate(user.id)
+        return user
+
+    async def delete(self, user):
+        user_id = user.id
+        await super().delete(user)
+        await user_cache.invalidate(user_id)
+
+
 async def get_user_db(session: AsyncSession = Depends(get_session)):
-    yield SQLAlchemyUserDatabase(session, User)
+    yield CachedUserDatabase(session, User)
 
 
 # User manager ------------------------------------------------------
@@ -74,6 +98,11 @@ class UserManager(IntegerIDMixin, BaseUserManager[User, int]):
     ):
         print(f"User {user.id} forgot password. Reset token: {token}")
 
+    async def reset_password(self, token: str, password: str, request: Optional[Request] = None) -> User:
+        # Checks the token against hashed_password, which the user cache never holds
+        with user_cache.bypass():
+            return await super().reset_password(token, password, request)
+
 
 async def get_user_manager(user_db=Depends(get_user_db)):
     yield UserManager(user_db)
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import datetime as dt
+import json
+import logging
+from typing import Any, Iterable, Iterator, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from src.core.config import settings
+from src.db.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Never written to Redis; on a cache hit these attributes stay unloaded
+_SECRET_COLUMNS = frozenset({"hashed_password"})
+
+_bypass: contextvars.ContextVar[bool] = contextvars.ContextVar("user_cache_bypass", default=False)
+
+
+class UserCache:
+    """Short-TTL Redis cache of User rows for the auth dependency.
+
+    Disabled (every call is a miss) when REDIS_URL is not configured, so a
+    single process never serves a row another worker has already changed.
+    Secret columns are not cached; flows that read them (password reset)
+    must run inside bypass().
+
+    Invalidation covers user_db update/delete and ORM unit-of-work changes
+    (see the Session hooks below). Core/bulk update(User) or delete(User)
+    statements bypass the unit of work; callers must report the affected
+    ids with mark_users_changed() or the stale row lives out its TTL.
+    Commit-time invalidations run as tasks; until one finishes, get() misses
+    for that user in this process.
+    """
+
+    def __init__(self) -> None:
+        self._redis = None
+        if settings.redis_url:
+            try:
+                import redis.asyncio as aioredis  # type: ignore
+                self._redis = aioredis.from_url(settings.redis_url, encoding="utf-8", decode_responses=True)
+            except Exception:
+                self._redis = None
+        self._columns = [attr.key for attr in inspect(User).column_attrs if attr.key not in _SECRET_COLUMNS]
+        self._datetime_columns = {
+            attr.key for attr in inspect(User).column_attrs if _is_datetime_type(attr.columns[0].type)
+        }
+        # Scheduled invalidations (strong refs so they are not collected) and
+        # the user ids they cover
+        self._tasks: set[asyncio.Task] = set()
+        self._pending: dict[Any, int] = {}
+
+    @staticmethod
+    def _key(user_id: Any) -> str:
+        return f"u:{user_id}"
+
+    @staticmethod
+    @contextlib.contextmanager
+    def bypass() -> Iterator[None]:
+        """Serve get() misses from the database for the duration of the block."""
+        token = _bypass.set(True)
+        try:
+            yield
+        finally:
+            _bypass.reset(token)
+
+    async def get(self, user_id: Any) -> Optional[dict[str, Any]]:
+        if self._redis is None or _bypass.get() or user_id in self._pending:
+            return None
+        try:
+            raw = await self._redis.get(self._key(user_id))
+            return json.loads(raw) if raw else None
+        except Exception:
+            return None
+
+    async def put(self, user: User) -> None:
+        if self._redis is None:
+            return
+        try:
+            data = {}
+            for key in self._columns:
+                value = getattr(user, key)
+                data[key] = value.isoformat() if isinstance(value, dt.datetime) else value
+            await self._redis.set(self._key(user.id), json.dumps(data), ex=settings.user_cache_ttl_seconds)
+        except Exception:
+            pass
+
+    async def invalidate(self, user_id: Any) -> None:
+        if self._redis is None:
+            return
+        try:
+            await self._redis.delete(self._key(user_id))
+        except Exception:
+            logger.warning("User cache invalidation failed for user %s", user_id, exc_info=True)
+
+    def invalidate_later(self, loop: asyncio.AbstractEventLoop, user_id: Any) -> None:
+        """Schedule invalidate() from sync code (e.g. a Session event)."""
+        self._pending[user_id] = self._pending.get(user_id, 0) + 1
+        task = loop.create_task(self.invalidate(user_id))
+        self._tasks.add(task)
+        task.add_done_callback(lambda done: self._invalidated(done, user_id))
+
+    def _invalidated(self, task: asyncio.Task, user_id: Any) -> None:
+        self._tasks.discard(task)
+        remaining = self._pending.pop(user_id, 1) - 1
+        if remaining:
+            self._pending[user_id] = remaining
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("User cache invalidation failed for user %s", user_id, exc_info=task.exception())
+
+    def to_user(self, data: dict[str, Any], session: Session) -> User:
+        """Rebuild a clean, persistent User from a cached payload without a SELECT.
+
+        Merged without loading, so a session already holding this identity
+        returns its own instance instead of raising.
+        """
+        values = {
+            key: dt.datetime.fromisoformat(value) if key in self._datetime_columns and value else value
+            for key, value in data.items()
+        }
+        user = User()
+        for key, value in values.items():
+            setattr(user, key, value)
+        make_transient_to_detached(user)
+        return session.merge(user, load=False)
+
+
+def _is_datetime_type(type_: Any) -> bool:
+    try:
+        return issubclass(type_.python_type, dt.datetime)
+    except NotImplementedError:
+        return False
+
+
+user_cache = UserCache()
+
+
+def mark_users_changed(session: Any, user_ids: Iterable[Any]) -> None:
+    """Queue cache invalidation (on commit) for users changed outside the ORM unit of work.
+
+    Accepts a Session or AsyncSession; both share the same info dict.
+    """
+    session.info.setdefault("changed_user_ids", set()).update(user_ids)
+
+
+# Invalidate on any committed ORM change to a User (team edits, admin tools, ...)
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session: Session, flush_context: Any) -> None:
+    changed = session.info.setdefault("changed_user_ids", set())
+    for obj in list(session.dirty) + list(session.deleted):
+        if isinstance(obj, User) and obj.id is not None:
+            changed.add(obj.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_users(session: Session) -> None:
+    changed = session.info.pop("changed_user_ids", None)
+    if not changed:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    for user_id in changed:
+        user_cache.invalidate_later(loop, user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session: Session) -> None:
+    session.info.pop("changed_user_ids", None)
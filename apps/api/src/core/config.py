@@ -23,6 +23,11 @@ class Settings:
         """Enable LLM response caching"""
         return os.getenv("ENABLE_LLM_CACHING", "true").lower() == "true"
     
+    @property
+    def llm_deterministic(self) -> bool:
+        """Pin temperature 0 and a prompt-derived seed for question-engine calls"""
+        return os.getenv("LLM_DETERMINISTIC", "false").lower() in {"1", "true", "yes"}
+    
     @property  
     def llm_cache_ttl_hours(self) -> int:
         """LLM cache TTL in hours"""
@@ -31,6 +36,14 @@ class Settings:
         except ValueError:
             return 1
     
+    @property
+    def openai_max_concurrency(self) -> int:
+        """Maximum concurrent OpenAI requests per fan-out (adaptive questions)"""
+        try:
+            return int(os.getenv("OPENAI_MAX_CONCURRENCY", "10"))
+        except ValueError:
+            return 10
+
     @property
     def max_parallel_llm_calls(self) -> int:
         """Maximum parallel LLM calls"""
@@ -64,6 +77,25 @@ class Settings:
             f"@{self.db_host}:{self.db_port}/{self.db_name}"
         )
 
+    @property
+    def pg_bouncer_mode(self) -> str:
+        """Set to "transaction" when connecting through PgBouncer transaction pooling."""
+        return os.getenv("PG_BOUNCER_MODE", "").lower()
+
+    @property
+    def db_pool_size(self) -> int:
+        try:
+            return int(os.getenv("DB_POOL_SIZE", "20"))
+        except ValueError:
+            return 20
+
+    @property
+    def db_max_overflow(self) -> int:
+        try:
+            return int(os.getenv("DB_MAX_OVERFLOW", "40"))
+        except ValueError:
+            return 40
+
     @property
     def gemini_api_key(self) -> str | None:
         return os.getenv("GEMINI_API_KEY")
@@ -131,6 +163,22 @@ class Settings:
         val = os.getenv("REDIS_URL", "").strip()
         return val or None
 
+    @property
+    def user_cache_ttl_seconds(self) -> int:
+        """TTL for cached User rows used by the auth dependency"""
+        try:
+            return int(os.getenv("USER_CACHE_TTL_SECONDS", "30"))
+        except ValueError:
+            return 30
+
+    @property
+    def llm_cache_ttl_seconds(self) -> int:
+        """TTL for cached question-engine LLM responses"""
+        try:
+            return int(os.getenv("LLM_CACHE_TTL_SECONDS", "86400"))
+        except ValueError:
+            return 86400
+
     # Mail (Resend)
     @property
     def resend_api_key(self) -> str | None:
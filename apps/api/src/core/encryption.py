@@ -6,7 +6,7 @@ GDPR/KVKK compliance for data protection
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from sqlalchemy import TypeDecorator, String, Text
+from sqlalchemy import TypeDecorator, String, Text, LargeBinary
 from sqlalchemy.types import UserDefinedType
 import base64
 import os
@@ -73,6 +73,20 @@ class EncryptionManager:
         cipher = self._get_cipher()
         return cipher.decrypt(ciphertext.encode("utf-8")).decode("utf-8")
 
+    def encrypt_bytes(self, plaintext: str) -> bytes:
+        """
+        Encrypt plaintext string to raw token bytes (no base64 text wrapper)
+        """
+        cipher = self._get_cipher()
+        return base64.urlsafe_b64decode(cipher.encrypt(plaintext.encode("utf-8")))
+
+    def decrypt_bytes(self, ciphertext: bytes) -> str:
+        """
+        Decrypt raw token bytes produced by encrypt_bytes
+        """
+        cipher = self._get_cipher()
+        return cipher.decrypt(base64.urlsafe_b64encode(bytes(ciphertext))).decode("utf-8")
+
 
 # Global encryption manager instance
 encryption_manager = EncryptionManager()
@@ -113,6 +127,34 @@ class EncryptedType(TypeDecorator):
         return encryption_manager.decrypt(value)
 
 
+class EncryptedBinary(TypeDecorator):
+    """
+    SQLAlchemy custom type for encrypted secrets stored as bytea
+    Keeps the raw Fernet token, about 25% smaller than its base64 text form
+    """
+    
+    impl = LargeBinary
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        """
+        Encrypt value before storing in database
+        """
+        if value is None:
+            return value
+        
+        return encryption_manager.encrypt_bytes(str(value))
+    
+    def process_result_value(self, value, dialect):
+        """
+        Decrypt value after loading from database
+        """
+        if value is None:
+            return value
+        
+        return encryption_manager.decrypt_bytes(value)
+
+
 class HashType(TypeDecorator):
     """
     SQLAlchemy custom type for hashed fields (one-way)
@@ -543,8 +543,13 @@ class GDPRManager:
         from src.db.models.candidate import Candidate
         from sqlalchemy import delete
         
-        # Delete user record
-        await session.execute(delete(User).where(text("email = :email")).params(email=subject_email))
+        from src.auth.user_cache import mark_users_changed
+        
+        # Delete user record (bulk delete skips the ORM hooks; report ids for auth-cache invalidation)
+        deleted_users = await session.execute(
+            delete(User).where(text("email = :email")).params(email=subject_email).returning(User.id)
+        )
+        mark_users_changed(session, deleted_users.scalars().all())
         
         # Delete candidate records (cascading will handle related data)
         await session.execute(delete(Candidate).where(text("email = :email")).params(email=subject_email))
@@ -1,9 +1,22 @@
+import asyncio
+import random
 import uuid
 from datetime import datetime
+from functools import partial
 import logging
+from typing import Any, Callable
 
 import boto3
+from anyio import to_thread
 from botocore.client import Config
+from botocore.exceptions import (
+    BotoCoreError,
+    ClientError,
+    ConnectionClosedError,
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    ReadTimeoutError,
+)
 
 from src.core.config import settings
 
@@ -18,23 +31,45 @@ _client = boto3.client(
     config=Config(signature_version="s3v4"),
 )
 
+# Client for the async helpers below: botocore's own retries are disabled so
+# backoff happens in the event loop (asyncio.sleep) instead of blocking a
+# threadpool worker between attempts.
+_async_client = boto3.client(
+    "s3",
+    region_name=region,
+    aws_access_key_id=settings.aws_access_key_id,
+    aws_secret_access_key=settings.aws_secret_access_key,
+    config=Config(signature_version="s3v4", retries={"mode": "standard", "max_attempts": 1}),
+)
+
 
 logger = logging.getLogger(__name__)
 
+# Bucket is fixed for the process lifetime; bind it once instead of resolving
+# it through settings on every call. Missing bucket stays a per-call error so
+# the app can still boot in environments without S3.
+_BUCKET = settings.s3_bucket
+_URL_PREFIX = f"s3://{_BUCKET}/" if _BUCKET else ""
+
+
+def _require_bucket() -> str:
+    if not _BUCKET:
+        raise RuntimeError("S3_BUCKET not configured")
+    return _BUCKET
+
 
 def generate_presigned_put_url(file_name: str, content_type: str, expires: int = 600, prefix: str = "uploads") -> dict:
     """Generate a presigned PUT URL for uploading to S3.
 
     prefix: top-level folder to place the object under (e.g., "media" or "cvs").
     """
-    if not settings.s3_bucket:
-        raise RuntimeError("S3_BUCKET not configured")
+    bucket = _require_bucket()
     folder = datetime.utcnow().strftime('%Y%m%d')
     key = f"{prefix}/{folder}/{uuid.uuid4()}_{file_name}"
     url = _client.generate_presigned_url(
         "put_object",
         Params={
-            "Bucket": settings.s3_bucket,
+            "Bucket": bucket,
             "Key": key,
             "ContentType": content_type,
         },
@@ -50,12 +85,11 @@ def generate_presigned_put_url_at_key(key: str, content_type: str, expires: int
 
     This is useful when the caller wants full control of the path, e.g., media/{job_id}/... or cvs/{job_id}/...
     """
-    if not settings.s3_bucket:
-        raise RuntimeError("S3_BUCKET not configured")
+    bucket = _require_bucket()
     url = _client.generate_presigned_url(
         "put_object",
         Params={
-            "Bucket": settings.s3_bucket,
+            "Bucket": bucket,
             "Key": key,
             "ContentType": content_type,
         },
@@ -68,57 +102,140 @@ def generate_presigned_put_url_at_key(key: str, content_type: str, expires: int
 
 def put_object_bytes(key: str, body: bytes, content_type: str) -> str:
     """Upload raw bytes to S3 at the given key and return an s3:// URL."""
-    if not settings.s3_bucket:
-        raise RuntimeError("S3_BUCKET not configured")
+    bucket = _require_bucket()
     _client.put_object(
-        Bucket=settings.s3_bucket,
+        Bucket=bucket,
         Key=key,
         Body=body,
         ContentType=content_type or "application/octet-stream",
     )
-    url = f"s3://{settings.s3_bucket}/{key}"
+    url = _URL_PREFIX + key
     logger.info("[S3 PUT] uploaded %d bytes to %s", len(body), url)
     return url
 
 
+def _delete_temp_object(client: Any, bucket: str, source_key: str) -> None:
+    """Best-effort removal of a temp object after it has been copied."""
+    try:
+        client.delete_object(
+            Bucket=bucket,
+            Key=source_key
+        )
+        logger.info("[S3 DELETE] Cleaned up temp file: %s", source_key)
+    except Exception as del_error:
+        # Check if it's just a permission issue (which is expected and harmless)
+        error_str = str(del_error)
+        if "AccessDenied" in error_str and "s3:DeleteObject" in error_str:
+            logger.debug("[S3 DELETE] Temp file cleanup skipped due to permissions (expected): %s", source_key)
+        else:
+            logger.warning("[S3 DELETE] Could not delete temp file %s: %s", source_key, del_error)
+        # Continue anyway - we have the file in the right place
+
+
 def move_object(source_key: str, dest_key: str) -> str:
     """Copy S3 object to clean path. Returns new s3:// URL."""
-    if not settings.s3_bucket:
-        raise RuntimeError("S3_BUCKET not configured")
+    bucket = _require_bucket()
     
     try:
         # Copy object to new location
         _client.copy_object(
-            Bucket=settings.s3_bucket,
-            CopySource={'Bucket': settings.s3_bucket, 'Key': source_key},
+            Bucket=bucket,
+            CopySource={'Bucket': bucket, 'Key': source_key},
             Key=dest_key
         )
         
-        new_url = f"s3://{settings.s3_bucket}/{dest_key}"
+        new_url = _URL_PREFIX + dest_key
         logger.info("[S3 COPY] %s -> %s", source_key, dest_key)
         
         # Try to delete original (optional - ignore if fails due to permissions)
-        try:
-            _client.delete_object(
-                Bucket=settings.s3_bucket,
-                Key=source_key
-            )
-            logger.info("[S3 DELETE] Cleaned up temp file: %s", source_key)
-        except Exception as del_error:
-            # Check if it's just a permission issue (which is expected and harmless)
-            error_str = str(del_error)
-            if "AccessDenied" in error_str and "s3:DeleteObject" in error_str:
-                logger.debug("[S3 DELETE] Temp file cleanup skipped due to permissions (expected): %s", source_key)
-            else:
-                logger.warning("[S3 DELETE] Could not delete temp file %s: %s", source_key, del_error)
-            # Continue anyway - we have the file in the right place
+        _delete_temp_object(_client, bucket, source_key)
         
         return new_url
         
     except Exception as e:
         logger.error("[S3 COPY] Failed to copy %s -> %s: %s", source_key, dest_key, e)
         # Return original URL if copy fails
-        return f"s3://{settings.s3_bucket}/{source_key}"
+        return _URL_PREFIX + source_key
+
+
+_RETRYABLE_ERROR_CODES = frozenset({
+    "RequestTimeout",
+    "RequestTimeTooSkewed",
+    "SlowDown",
+    "InternalError",
+    "ServiceUnavailable",
+    "Throttling",
+    "ThrottlingException",
+    "RequestLimitExceeded",
+})
+
+# Transport failures; other BotoCoreErrors (missing credentials, invalid
+# parameters, ...) are configuration problems that a retry will not fix
+_RETRYABLE_TRANSPORT_ERRORS = (
+    EndpointConnectionError,
+    ConnectionClosedError,
+    ReadTimeoutError,
+    ConnectTimeoutError,
+)
+
+
+def _retryable(exc: Exception) -> bool:
+    """Transport errors and throttling/5xx responses are worth another attempt."""
+    if isinstance(exc, ClientError):
+        code = (exc.response.get("Error") or {}).get("Code")
+        status = (exc.response.get("ResponseMetadata") or {}).get("HTTPStatusCode") or 0
+        return code in _RETRYABLE_ERROR_CODES or status >= 500
+    return isinstance(exc, _RETRYABLE_TRANSPORT_ERRORS)
+
+
+async def _with_retry(fn: Callable[..., Any], *args: Any, attempts: int = 3, base: float = 0.2, **kwargs: Any) -> Any:
+    """Run a blocking S3 call in a worker thread with exponential backoff + jitter.
+
+    The sleep between attempts happens on the event loop, so the worker thread
+    is released while waiting.
+    """
+    for i in range(attempts):
+        try:
+            return await to_thread.run_sync(partial(fn, *args, **kwargs))
+        except (BotoCoreError, ClientError) as e:
+            if i == attempts - 1 or not _retryable(e):
+                raise
+            delay = base * (2 ** i) + random.random() * base
+            logger.warning("[S3 RETRY] attempt %d/%d failed (%s); retrying in %.2fs", i + 1, attempts, e, delay)
+            await asyncio.sleep(delay)
+
+
+async def put_object_bytes_async(key: str, body: bytes, content_type: str) -> str:
+    """Async variant of put_object_bytes with jittered retries."""
+    bucket = _require_bucket()
+    await _with_retry(
+        _async_client.put_object,
+        Bucket=bucket,
+        Key=key,
+        Body=body,
+        ContentType=content_type or "application/octet-stream",
+    )
+    url = _URL_PREFIX + key
+    logger.info("[S3 PUT] uploaded %d bytes to %s", len(body), url)
+    return url
+
+
+async def move_object_async(source_key: str, dest_key: str) -> str:
+    """Async variant of move_object; only the copy is retried."""
+    bucket = _require_bucket()
+    try:
+        await _with_retry(
+            _async_client.copy_object,
+            Bucket=bucket,
+            CopySource={'Bucket': bucket, 'Key': source_key},
+            Key=dest_key,
+        )
+    except Exception as e:
+        logger.error("[S3 COPY] Failed to copy %s -> %s: %s", source_key, dest_key, e)
+        return _URL_PREFIX + source_key
+    logger.info("[S3 COPY] %s -> %s", source_key, dest_key)
+    await to_thread.run_sync(_delete_temp_object, _async_client, bucket, source_key)
+    return _URL_PREFIX + dest_key
 
 
 def generate_presigned_get_url(
@@ -131,10 +248,9 @@ def generate_presigned_get_url(
 
     Optionally set response content headers to encourage inline rendering.
     """
-    if not settings.s3_bucket:
-        raise RuntimeError("S3_BUCKET not configured")
+    bucket = _require_bucket()
     params = {
-        "Bucket": settings.s3_bucket,
+        "Bucket": bucket,
         "Key": key,
     }
     if response_content_disposition:
@@ -150,19 +266,18 @@ def generate_presigned_get_url(
 
 
 def object_exists(key: str) -> bool:
-    if not settings.s3_bucket:
+    if not _BUCKET:
         return False
     try:
-        _client.head_object(Bucket=settings.s3_bucket, Key=key)
+        _client.head_object(Bucket=_BUCKET, Key=key)
         return True
     except Exception:
         return False
 
 
 def get_object_bytes(key: str) -> tuple[bytes, str]:
-    if not settings.s3_bucket:
-        raise RuntimeError("S3_BUCKET not configured")
-    obj = _client.get_object(Bucket=settings.s3_bucket, Key=key)
+    bucket = _require_bucket()
+    obj = _client.get_object(Bucket=bucket, Key=key)
     body = obj["Body"].read()
     content_type = obj.get("ContentType") or "application/octet-stream"
     return body, content_type
@@ -173,9 +288,7 @@ def upsert_lifecycle_rule(prefix: str, expire_days: int) -> dict:
 
     Returns the resulting lifecycle configuration dict.
     """
-    if not settings.s3_bucket:
-        raise RuntimeError("S3_BUCKET not configured")
-    bucket = settings.s3_bucket
+    bucket = _require_bucket()
     rules = []
     try:
         existing = _client.get_bucket_lifecycle_configuration(Bucket=bucket)
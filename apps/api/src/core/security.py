@@ -5,6 +5,7 @@ Comprehensive security middleware and utilities for production deployment
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 import hashlib
+import logging
 import secrets
 import time
 from typing import Dict, Optional, Any
@@ -139,10 +140,25 @@ class InputSanitizer:
         return email.lower()
 
 
+_AUTH_LOG_KEYS = (
+    "event_type", "user_id", "email", "success", "ip_address",
+    "user_agent", "timestamp", "failure_reason",
+)
+_DATA_ACCESS_LOG_KEYS = (
+    "event_type", "user_id", "resource_type", "resource_id", "action",
+    "ip_address", "success", "timestamp",
+)
+_SECURITY_EVENT_LOG_KEYS = (
+    "event_type", "severity", "user_id", "ip_address", "details", "timestamp",
+)
+
+
 class SecurityAuditLogger:
     """
     Security event logging for compliance and monitoring
     """
+
+    __slots__ = ()
     
     @staticmethod
     def log_authentication_attempt(
@@ -156,25 +172,22 @@ class SecurityAuditLogger:
         """
         Log authentication attempts for security monitoring
         """
-        import logging
-        
         logger = logging.getLogger("security.auth")
-        
-        log_data = {
-            "event_type": "authentication_attempt",
-            "user_id": user_id,
-            "email": email,
-            "success": success,
-            "ip_address": ip_address,
-            "user_agent": user_agent,
-            "timestamp": time.time(),
-            "failure_reason": failure_reason
-        }
-        
-        if success:
-            logger.info("Authentication successful", extra=log_data)
-        else:
-            logger.warning("Authentication failed", extra=log_data)
+        level = logging.INFO if success else logging.WARNING
+        # Skip building the payload entirely when the level is filtered out
+        if not logger.isEnabledFor(level):
+            return
+        
+        log_data = dict(zip(_AUTH_LOG_KEYS, (
+            "authentication_attempt", user_id, email, success, ip_address,
+            user_agent, time.time(), failure_reason,
+        )))
+        
+        logger.log(
+            level,
+            "Authentication successful" if success else "Authentication failed",
+            extra=log_data,
+        )
     
     @staticmethod
     def log_data_access(
@@ -188,20 +201,14 @@ class SecurityAuditLogger:
         """
         Log data access for GDPR compliance
         """
-        import logging
-        
         logger = logging.getLogger("security.data_access")
+        if not logger.isEnabledFor(logging.INFO):
+            return
         
-        log_data = {
-            "event_type": "data_access",
-            "user_id": user_id,
-            "resource_type": resource_type,
-            "resource_id": resource_id,
-            "action": action,
-            "ip_address": ip_address,
-            "success": success,
-            "timestamp": time.time()
-        }
+        log_data = dict(zip(_DATA_ACCESS_LOG_KEYS, (
+            "data_access", user_id, resource_type, resource_id, action,
+            ip_address, success, time.time(),
+        )))
         
         logger.info("Data access event", extra=log_data)
     
@@ -216,23 +223,16 @@ class SecurityAuditLogger:
         """
         Log security events (suspicious activity, violations, etc.)
         """
-        import logging
-        
         logger = logging.getLogger("security.events")
+        level = logging.ERROR if severity in ("HIGH", "CRITICAL") else logging.WARNING
+        if not logger.isEnabledFor(level):
+            return
         
-        log_data = {
-            "event_type": event_type,
-            "severity": severity,
-            "user_id": user_id,
-            "ip_address": ip_address,
-            "details": details,
-            "timestamp": time.time()
-        }
+        log_data = dict(zip(_SECURITY_EVENT_LOG_KEYS, (
+            event_type, severity, user_id, ip_address, details, time.time(),
+        )))
         
-        if severity in ["HIGH", "CRITICAL"]:
-            logger.error("Security event", extra=log_data)
-        else:
-            logger.warning("Security event", extra=log_data)
+        logger.log(level, "Security event", extra=log_data)
 
 
 class RateLimitStore:
@@ -1,6 +1,7 @@
 import datetime as dt
 
-from sqlalchemy import String, DateTime, ForeignKey, func
+from sqlalchemy import String, DateTime, ForeignKey, Index, func
+from sqlalchemy.dialects.postgresql import INET
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.db.base import Base
@@ -8,12 +9,22 @@ from src.db.base import Base
 
 class CandidateConsent(Base):
     __tablename__ = "candidate_consents"
+    __table_args__ = (
+        Index("ix_consents_interview", "interview_id"),
+        Index("ix_consents_candidate", "candidate_id"),
+        Index(
+            "ix_candidate_consents_accepted_brin",
+            "accepted_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     candidate_id: Mapped[int] = mapped_column(ForeignKey("candidates.id", ondelete="CASCADE"), nullable=False)
     interview_id: Mapped[int] = mapped_column(ForeignKey("interviews.id", ondelete="CASCADE"), nullable=False)
     accepted_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
-    ip: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    ip: Mapped[str | None] = mapped_column(INET, nullable=True)
     text_version: Mapped[str | None] = mapped_column(String(32), nullable=True)
 
 
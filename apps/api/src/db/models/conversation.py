@@ -1,7 +1,7 @@
 import datetime as dt
 from enum import Enum
 
-from sqlalchemy import String, Text, func, ForeignKey, Enum as SQLEnum, UniqueConstraint, Index
+from sqlalchemy import String, Text, SmallInteger, TypeDecorator, func, ForeignKey, Enum as SQLEnum, UniqueConstraint, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.base import Base
@@ -13,6 +13,23 @@ class MessageRole(str, Enum):
     SYSTEM = "system"       # Sistem mesajları
 
 
+class ScaledScore(TypeDecorator):
+    """0-100 score stored as smallint hundredths; reads back as float."""
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return int(round(float(value) * 100))
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return value / 100.0
+
+
 class ConversationMessage(Base):
     __tablename__ = "conversation_messages"
     __table_args__ = (
@@ -40,14 +57,14 @@ class InterviewAnalysis(Base):
     interview_id: Mapped[int] = mapped_column(ForeignKey("interviews.id", ondelete="CASCADE"), nullable=False, unique=True)
     
     # AI Analysis Results
-    overall_score: Mapped[float | None] = mapped_column(nullable=True)  # 0-100 score
+    overall_score: Mapped[float | None] = mapped_column(ScaledScore(), nullable=True)  # 0-100 score
     summary: Mapped[str | None] = mapped_column(Text, nullable=True)
     strengths: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON array or text
     weaknesses: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON array or text
     technical_assessment: Mapped[str | None] = mapped_column(Text, nullable=True)
-    communication_score: Mapped[float | None] = mapped_column(nullable=True)  # 0-100
-    technical_score: Mapped[float | None] = mapped_column(nullable=True)  # 0-100
-    cultural_fit_score: Mapped[float | None] = mapped_column(nullable=True)  # 0-100
+    communication_score: Mapped[float | None] = mapped_column(ScaledScore(), nullable=True)  # 0-100
+    technical_score: Mapped[float | None] = mapped_column(ScaledScore(), nullable=True)  # 0-100
+    cultural_fit_score: Mapped[float | None] = mapped_column(ScaledScore(), nullable=True)  # 0-100
     
     # Metadata
     analysis_prompt: Mapped[str | None] = mapped_column(Text, nullable=True)  # What prompt was used
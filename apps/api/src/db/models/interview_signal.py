@@ -1,18 +1,53 @@
 import datetime as dt
+from enum import Enum
 
-from sqlalchemy import String, Text, DateTime, ForeignKey, func
+from sqlalchemy import DateTime, ForeignKey, Index, func, text, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.db.base import Base
 
 
+class SignalKind(str, Enum):
+    FOCUS_LOST = "focus_lost"
+    TAB_HIDDEN = "tab_hidden"
+    MIC_MUTED = "mic_muted"
+
+
 class InterviewSignal(Base):
     __tablename__ = "interview_signals"
+    __table_args__ = (
+        # Equality columns first, range column (created_at) last
+        Index("ix_signals_interview_kind_created", "interview_id", "kind", "created_at"),
+        Index(
+            "ix_sig_focus_meta",
+            "meta",
+            postgresql_using="gin",
+            postgresql_where=text("kind = 'focus_lost'"),
+        ),
+        # Insert order follows time, so a BRIN range summary serves "last N hours" scans
+        Index(
+            "ix_interview_signals_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        # Monthly RANGE partitions (interview_signals_YYYY_MM); see
+        # scripts/create_signal_partitions.py for the rolling creation job
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
+    # Partition key must be part of the primary key
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     interview_id: Mapped[int] = mapped_column(ForeignKey("interviews.id", ondelete="CASCADE"), nullable=False)
-    kind: Mapped[str] = mapped_column(String(50), nullable=False)  # e.g., focus_lost, tab_hidden, mic_muted
-    meta: Mapped[str | None] = mapped_column(Text, nullable=True)
-    created_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    # Closed set stored as a PG enum (4 bytes, O(1) equality); new kinds need ALTER TYPE ... ADD VALUE
+    kind: Mapped[SignalKind] = mapped_column(
+        SQLEnum(SignalKind, name="signal_kind", values_callable=lambda e: [m.value for m in e]),
+        nullable=False,
+    )
+    meta: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    created_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True, server_default=func.now(), nullable=False
+    )
 
 
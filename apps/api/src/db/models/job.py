@@ -1,28 +1,38 @@
 import datetime as dt
 
-from sqlalchemy import String, Text, func, ForeignKey, Integer
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, Text, func, ForeignKey, Index, SmallInteger
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.ext.mutable import MutableList
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.base import Base
 
 
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_user_created", "user_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     created_by_user_id: Mapped[int | None] = mapped_column(ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(Text())
-    # Optional extra questions entered by the recruiter (newline-separated)
-    extra_questions: Mapped[str | None] = mapped_column(Text(), nullable=True)
-    default_invite_expiry_days: Mapped[int] = mapped_column(Integer, nullable=False, default=7)
-    # Optional rubric configuration stored as JSON string (criteria + weights)
-    rubric_json: Mapped[str | None] = mapped_column(Text(), nullable=True)
+    # Optional extra questions entered by the recruiter, one element per question.
+    # MutableList so in-place edits (append/reorder) are flushed.
+    extra_questions: Mapped[list[str] | None] = mapped_column(MutableList.as_mutable(ARRAY(Text())), nullable=True)
+    # API bounds this to 1-365 days, so 2 bytes suffice
+    default_invite_expiry_days: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=7)
+    # Optional rubric configuration (criteria + weights), stored as JSONB.
+    # Only read whole today. If a query starts filtering on a key, add a
+    # functional btree on that path in the same migration, e.g.
+    # Index("ix_jobs_rubric_<key>", text("(rubric_json->>'<key>')")).
+    rubric_json: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     # Removed manual requirements configuration (now derived dynamically)
-    created_at: Mapped[dt.datetime] = mapped_column(
-        default=func.now(), nullable=False, server_default=func.now()
-    )
-    updated_at: Mapped[dt.datetime] = mapped_column(
-        default=func.now(), onupdate=func.now(), server_default=func.now()
-    ) 
\ No newline at end of file
+    # Server defaults only; SQLAlchemy fetches them via RETURNING on insert
+    created_at: Mapped[dt.datetime] = mapped_column(nullable=False, server_default=func.now())
+    updated_at: Mapped[dt.datetime] = mapped_column(onupdate=func.now(), server_default=func.now())
+
+    # Relationships (lazy="raise" forces an explicit loader option at call sites)
+    user = relationship("User", back_populates="jobs", foreign_keys=[user_id], lazy="raise")
@@ -1,18 +1,36 @@
 import datetime as dt
-from sqlalchemy import String, Text, DateTime, Integer, ForeignKey
+from enum import Enum
+
+from sqlalchemy import Text, DateTime, Integer, ForeignKey, Index, UniqueConstraint, Enum as SQLEnum, text
 from sqlalchemy.orm import Mapped, mapped_column
 
+from src.core.encryption import EncryptedBinary
 from src.db.base import Base
 
 
+class OAuthProvider(str, Enum):
+    GOOGLE = "google"
+    ZOOM = "zoom"
+
+
 class OAuthCredential(Base):
     __tablename__ = "oauth_credentials"
+    __table_args__ = (
+        # One credential per (user, provider); the unique index also serves lookups
+        UniqueConstraint("user_id", "provider", name="uq_oauth_user_provider"),
+        # For token refresh scans ("expires_at BETWEEN now() AND now() + interval '5 min'")
+        Index("ix_oauth_expiring", "expires_at", postgresql_where=text("expires_at IS NOT NULL")),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    provider: Mapped[str] = mapped_column(String(20), nullable=False)  # 'google' | 'zoom'
-    access_token: Mapped[str] = mapped_column(Text, nullable=False)
-    refresh_token: Mapped[str | None] = mapped_column(Text, nullable=True)
+    provider: Mapped[OAuthProvider] = mapped_column(
+        SQLEnum(OAuthProvider, name="oauth_provider", values_callable=lambda e: [m.value for m in e]),
+        nullable=False,
+    )
+    # Encrypted at rest; attributes still read and write plain strings
+    access_token: Mapped[str] = mapped_column(EncryptedBinary(), nullable=False)
+    refresh_token: Mapped[str | None] = mapped_column(EncryptedBinary(), nullable=True)
     expires_at: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     scope: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), default=dt.datetime.now, nullable=False)
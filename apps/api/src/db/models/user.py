@@ -4,32 +4,67 @@ from typing import Optional
 from fastapi_users_db_sqlalchemy import SQLAlchemyBaseUserTable
 
 from src.db.base import Base
-from sqlalchemy import String, Integer, Boolean, func, ForeignKey
+from sqlalchemy import String, Integer, Boolean, func, ForeignKey, Index, text
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 
+# Permission bits stored in User.perms
+CAN_MANAGE_JOBS = 1 << 0
+CAN_MANAGE_CANDIDATES = 1 << 1
+CAN_VIEW_INTERVIEWS = 1 << 2
+CAN_MANAGE_MEMBERS = 1 << 3
+
+
+def _perm_flag(bit: int) -> hybrid_property:
+    """Boolean view over one bit of ``perms`` (usable in queries and as a kwarg)."""
+
+    def _get(self) -> bool:
+        return bool((self.perms or 0) & bit)
+
+    def _set(self, value: bool) -> None:
+        current = self.perms or 0
+        self.perms = (current | bit) if value else (current & ~bit)
+
+    def _expr(cls):
+        return cls.perms.op("&")(bit) != 0
+
+    return hybrid_property(_get, _set, expr=_expr)
+
+
 class User(SQLAlchemyBaseUserTable[int], Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Most users are owners (NULL owner); index only team members
+        Index("ix_users_owner", "owner_user_id", postgresql_where=text("owner_user_id IS NOT NULL")),
+    )
 
     # Explicit PK to satisfy SQLAlchemy mapper in Alembic env
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)  # type: ignore[override]
 
     first_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     last_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
-    created_at: Mapped[dt.datetime] = mapped_column(
-        default=func.now(), nullable=False, server_default=func.now()
-    )
+    created_at: Mapped[dt.datetime] = mapped_column(nullable=False, server_default=func.now())
+    # Bumped on every ORM update (audit only; the auth cache relies on invalidation, not this)
+    updated_at: Mapped[dt.datetime] = mapped_column(onupdate=func.now(), server_default=func.now())
     is_admin: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="false", default=False)
     # Tenant ownership: if set, this user belongs to the account owned by owner_user_id
     owner_user_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     role: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
-    # Simple permission toggles for assistants
-    can_manage_jobs: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="false", default=False)
-    can_manage_candidates: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="false", default=False)
-    can_view_interviews: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="false", default=False)
-    can_manage_members: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="false", default=False)
+    # Simple permission toggles for assistants, packed as CAN_* bit flags
+    perms: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0", default=0)
+    can_manage_jobs = _perm_flag(CAN_MANAGE_JOBS)
+    can_manage_candidates = _perm_flag(CAN_MANAGE_CANDIDATES)
+    can_view_interviews = _perm_flag(CAN_VIEW_INTERVIEWS)
+    can_manage_members = _perm_flag(CAN_MANAGE_MEMBERS)
     # Company information for AI context
     company_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     
+    # lazy="raise": callers must choose a loader (e.g. selectinload(User.jobs))
+    # instead of silently issuing one query per user
+    jobs = relationship(
+        "Job", back_populates="user", foreign_keys="Job.user_id", lazy="raise", passive_deletes=True
+    )
+
     # Relationships for RBAC (late import to avoid circular imports)
     # The relationship will be added by RBAC module during initialization
\ No newline at end of file
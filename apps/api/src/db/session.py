@@ -1,4 +1,4 @@
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
@@ -7,9 +7,58 @@ from sqlalchemy.pool import NullPool
 from src.db.base import Base
 
 # Async engine & sessionmaker
-engine = create_async_engine(settings.database_url, echo=False, future=True, poolclass=NullPool)
+# insertmanyvalues_page_size: batched ORM flushes / executemany inserts are sent
+# as multi-row INSERT ... VALUES statements of up to 1000 rows each
+# query_cache_size: SQLAlchemy's compiled-SQL cache (default 500) is shared by
+# every ORM statement shape; sized so hot point lookups are never evicted
+_engine_kwargs: dict[str, Any] = {
+    "echo": False,
+    "future": True,
+    "insertmanyvalues_page_size": 1000,
+    "query_cache_size": 1200,
+}
+if settings.pg_bouncer_mode == "transaction":
+    # PgBouncer owns the pooling, and prepared statements do not survive
+    # transaction-level connection reuse
+    _engine_kwargs.update(
+        poolclass=NullPool,
+        connect_args={"statement_cache_size": 0, "prepared_statement_cache_size": 0},
+    )
+else:
+    # Reuse connections (and their prepared-statement caches) across requests.
+    # JIT only pays off for long analytic queries; for our small OLTP reads its
+    # compile cost dominates. (PgBouncer rejects server_settings, hence here only.)
+    _engine_kwargs.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        connect_args={
+            "statement_cache_size": 2048,
+            "prepared_statement_cache_size": 2048,
+            "server_settings": {"jit": "off"},
+        },
+    )
+engine = create_async_engine(settings.database_url, **_engine_kwargs)
 async_session_factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
+# Pooled asyncpg connections are bound to the event loop that opened them, so
+# code that runs each job in its own loop (asyncio.run in the SQS worker and
+# the thread fallback of enqueue_process_interview) must not share the pool
+# above. This engine opens and closes a connection per session instead.
+worker_engine = create_async_engine(
+    settings.database_url,
+    echo=False,
+    future=True,
+    poolclass=NullPool,
+    connect_args=(
+        {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+        if settings.pg_bouncer_mode == "transaction"
+        else {}
+    ),
+)
+worker_session_factory = async_sessionmaker(worker_engine, expire_on_commit=False, class_=AsyncSession)
+
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """FastAPI dependency that provides a DB session."""
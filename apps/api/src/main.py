@@ -138,6 +138,20 @@ except Exception:
     # Do not crash app if IAM lacks permissions or S3 not configured
     pass
 
+@app.on_event("startup")
+async def _warm_shared_http_clients() -> None:
+    # In the background so a slow or unreachable upstream never delays startup
+    import asyncio
+    from src.services.adaptive_questions import warmup
+    app.state.openai_warmup = asyncio.create_task(warmup())
+
+
+@app.on_event("shutdown")
+async def _close_shared_http_clients() -> None:
+    from src.services.adaptive_questions import aclose_client
+    await aclose_client()
+
+
 # Instrument frameworks after app fully configured
 try:
     instrument_frameworks(app)
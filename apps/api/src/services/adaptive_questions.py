@@ -2,25 +2,194 @@
 Adaptive Interview Question Generation
 Analyzes candidate responses in real-time and generates targeted follow-up questions
 """
-from typing import Dict, List, Any
+import asyncio
+import functools
+import importlib.util
+import logging
+import random
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Tuple
 import httpx
+import orjson
 from src.core.config import settings
+from src.services.llm_cache import SemanticCache, prompt_key
+from src.services.llm_client import CircuitBreakerState
+from src.services.memory_enricher import build_rolling_summary
 
 
-async def analyze_response_weaknesses(conversation_history: List[Dict], job_requirements: str) -> Dict[str, Any]:
+logger = logging.getLogger(__name__)
+
+# One pooled client for all OpenAI calls in this module: keeps TCP+TLS
+# connections alive between turns instead of re-handshaking per request.
+# With h2 installed (httpx[http2]) concurrent calls multiplex over one
+# connection instead of each holding its own.
+_CLIENT: httpx.AsyncClient | None = None
+_HTTP2 = importlib.util.find_spec("h2") is not None
+_HTTP_VERSION_LOGGED = False
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            http2=_HTTP2,
+            timeout=httpx.Timeout(30.0, connect=5.0, pool=5.0),
+            limits=httpx.Limits(max_connections=256, max_keepalive_connections=128, keepalive_expiry=60),
+        )
+    return _CLIENT
+
+
+def _log_http_version(resp: httpx.Response) -> None:
+    """Log the negotiated protocol once per worker (confirms HTTP/2 in production)."""
+    global _HTTP_VERSION_LOGGED
+    if not _HTTP_VERSION_LOGGED:
+        _HTTP_VERSION_LOGGED = True
+        logger.info("OpenAI client negotiated %s", resp.http_version)
+
+
+async def aclose_client() -> None:
+    """Close the shared client (called on app shutdown)."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+
+async def warmup() -> None:
+    """Open a pooled TLS connection to OpenAI ahead of the first live turn.
+
+    Any HTTP status is fine (only the handshake matters); errors are ignored.
+    Chat and embedding calls share this client, so both benefit.
     """
-    Enhanced competency gap detection with detailed evidence tracking
+    if not settings.openai_api_key:
+        return
+    try:
+        await _get_client().get(
+            "https://api.openai.com/v1/models",
+            headers={"Authorization": f"Bearer {settings.openai_api_key}"},
+            timeout=10,
+        )
+    except Exception:
+        pass
+
+
+# Bounds concurrent OpenAI requests when a caller fans out
+_SEM = asyncio.Semaphore(max(1, settings.openai_max_concurrency))
+
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# Opens after 5 consecutive failed calls (retries exhausted); while open,
+# callers go straight to their fallback without touching the network
+_BREAKER = CircuitBreakerState()
+_BREAKER_MAX_FAILURES = 5
+_BREAKER_RESET_SECONDS = 30.0
+
+
+class CircuitOpenError(RuntimeError):
+    """OpenAI calls are short-circuited after repeated failures."""
+
+
+def _breaker_check() -> None:
+    if _BREAKER.is_open:
+        if time.time() < _BREAKER.next_attempt_time:
+            raise CircuitOpenError("OpenAI circuit open")
+        _BREAKER.is_open = False
+        _BREAKER.failure_count = 0
+
+
+def _breaker_record(ok: bool) -> None:
+    if ok:
+        _BREAKER.failure_count = 0
+        _BREAKER.is_open = False
+        return
+    _BREAKER.failure_count += 1
+    _BREAKER.last_failure_time = time.time()
+    if _BREAKER.failure_count >= _BREAKER_MAX_FAILURES:
+        _BREAKER.is_open = True
+        _BREAKER.next_attempt_time = _BREAKER.last_failure_time + _BREAKER_RESET_SECONDS
+
+
+def _retry_delay(attempt: int, resp: httpx.Response | None, base: float, cap: float) -> float:
+    """Exponential backoff with jitter, or the server's Retry-After when it sends one."""
+    if resp is not None:
+        try:
+            return min(cap, float(resp.headers["retry-after"]))
+        except (KeyError, ValueError):
+            pass
+    return min(cap, base * (2 ** attempt)) + random.random() * base
+
+
+async def _post_chat(
+    body: Dict[str, Any], timeout: float, attempts: int = 4, base: float = 0.5, cap: float = 8.0
+) -> Dict[str, Any]:
+    """POST a chat completion under _SEM.
+
+    Retries transport errors and 429/5xx with jittered backoff (honouring
+    Retry-After) and feeds the module circuit breaker.
     """
-    if not (settings.openai_api_key and conversation_history):
-        return {"weak_areas": [], "follow_up_strategy": "standard"}
-    
-    # Build conversation context with turn tracking
-    conversation_text = ""
-    for i, turn in enumerate(conversation_history):
-        role = "Mülakatçı" if turn.get("role") == "assistant" else "Aday"
-        conversation_text += f"[Turn {i+1}] {role}: {turn.get('text', '')}\n\n"
-    
-    prompt = f"""Sen deneyimli bir mülakat analisti ve behavioural interviewer'sın. Konuşma akışını detaylı analiz et.
+    _breaker_check()
+    headers = {"Authorization": f"Bearer {settings.openai_api_key}", "Content-Type": "application/json"}
+    payload = orjson.dumps(body)
+    client = _get_client()
+    for i in range(attempts):
+        resp = None
+        try:
+            async with _SEM:
+                resp = await client.post("https://api.openai.com/v1/chat/completions", content=payload, headers=headers, timeout=timeout)
+            _log_http_version(resp)
+        except httpx.TransportError:
+            if i == attempts - 1:
+                _breaker_record(False)
+                raise
+        else:
+            if resp.status_code not in _RETRYABLE_STATUS:
+                # Any non-5xx answer means the service is reachable
+                _breaker_record(resp.status_code < 500)
+                resp.raise_for_status()
+                return orjson.loads(resp.content)
+            if i == attempts - 1:
+                _breaker_record(False)
+                resp.raise_for_status()
+        await asyncio.sleep(_retry_delay(i, resp, base, cap))
+    raise RuntimeError("unreachable")
+
+
+# Weak-area results by exact prompt hash. There is deliberately no
+# near-duplicate tier: each turn adds an answer the analysis must react to.
+_WEAKNESS_CACHE = SemanticCache(maxsize=512, ttl_seconds=3600)
+
+
+async def embed(text: str) -> List[float] | None:
+    """Small embedding for semantic cache lookups; None on any failure.
+
+    Shares _SEM and the circuit breaker with chat calls, so an outage
+    short-circuits embeddings too.
+    """
+    headers = {"Authorization": f"Bearer {settings.openai_api_key}", "Content-Type": "application/json"}
+    body = {"model": "text-embedding-3-small", "input": text[:8000], "dimensions": 256}
+    try:
+        _breaker_check()
+        client = _get_client()
+        async with _SEM:
+            resp = await client.post("https://api.openai.com/v1/embeddings", content=orjson.dumps(body), headers=headers, timeout=10)
+        _breaker_record(resp.status_code < 500)
+        resp.raise_for_status()
+        return orjson.loads(resp.content)["data"][0]["embedding"]
+    except httpx.TransportError:
+        _breaker_record(False)
+        return None
+    except Exception:
+        return None
+
+
+# Static instructions go in the system message and the per-call data in the
+# user message, so consecutive requests share a byte-identical prefix that the
+# provider can serve from its prompt cache.
+_WEAKNESS_SYSTEM_PROMPT = """Sen deneyimli bir mülakat analisti ve behavioural interviewer'sın. Konuşma akışını detaylı analiz et.
 
 ANALIZ HEDEFLERİ:
 1. Eksik kompetans alanlarını tespit et
@@ -35,9 +204,9 @@ WEAKNESS LEVELS:
 - low: Minör endişe, onaylatma amaçlı
 
 ZORUNLU JSON FORMAT:
-{{
+{
   "weak_areas": [
-    {{
+    {
       "area": "Spesifik kompetans alanı",
       "weakness_level": "critical|high|medium|low",
       "evidence": "Hangi yanıtta ne eksikliği gözlemlendi",
@@ -45,65 +214,189 @@ ZORUNLU JSON FORMAT:
       "suggested_follow_up": "Hedeft soru önerisi",
       "probing_strategy": "scenario|behavioral|technical|clarifying",
       "importance_score": 0.9
-    }}
+    }
   ],
   "follow_up_strategy": "deep_dive|challenge|clarify|scenario_based|standard",
   "priority_area": "En kritik eksik alan",
   "interview_momentum": "strong|moderate|weak|stalled",
   "suggested_next_moves": ["Önerilen sıradaki adımlar"],
   "confidence_score": 0.85,
-  "competency_coverage": {{
+  "competency_coverage": {
     "technical": 0.7,
     "behavioral": 0.6,
     "cultural": 0.5
-  }}
-}}
+  }
+}"""
 
-İŞ GEREKSİNİMLERİ:
+
+_TARGETED_SYSTEM_PROMPT = """Sen master-level bir behavioral interviewer'sın. Tespit edilen zayıflık için stratejik takip sorusu geliştir.
+
+SORU STRATEJİLERİ:
+- scenario: Zorlayıcı durum senaryoları
+- behavioral: STAR formatında gerçek deneyim
+- technical: Derinlemesine teknik bilgi
+- clarifying: Netleştirme ve detay alma
+
+ZORLUK SEVİYELERİ:
+- critical: Max zorluk, yüksek stakes senaryo
+- high: Zorlayıcı, gerçekçi durumlar  
+- medium: Orta seviye detay talebi
+- low: Basit netleştirme
+
+SORU KRİTERLERİ:
+✓ Spesifik ve hedefli (generic değil)
+✓ STAR metodunu teşvik eder
+✓ Ölçülebilir cevap bekler
+✓ İş bağlamına uygun
+✓ Adil ama zorlayıcı
+✓ Maksimum 2 cümle
+
+SADECE SORUYU DÖNDÜR (açıklama yok)."""
+
+
+_COMPETENCY_SYSTEM_PROMPT = """Sen competency-based interview uzmanısın. Eksik bulunan yetkinlik için hedefli soru oluştur.
+
+Şu formatta soru tasarla:
+
+ZORUNLU JSON FORMAT:
+{
+  "questions": [
+    {
+      "competency": "Spesifik yetkinlik adı",
+      "question": "STAR formatını teşvik eden açık uçlu soru",
+      "difficulty": "junior|mid|senior",
+      "follow_up_probes": [
+        "Detay alma sorusu 1",
+        "Derinleştirme sorusu 2"
+      ],
+      "evaluation_criteria": [
+        "Değerlendirme kriteri 1",
+        "Değerlendirme kriteri 2"
+      ],
+      "red_flags": ["Kırmızı bayrak işaretleri"],
+      "ideal_response_indicators": ["Güçlü cevap göstergeleri"]
+    }
+  ]
+}"""
+
+
+# interview_id -> formatted "[Turn n] ..." parts for the history seen so far;
+# each call formats only the turns appended since the previous one
+_CONV_CACHE: "OrderedDict[int, List[str]]" = OrderedDict()
+_CONV_CACHE_MAX = 1024
+
+
+def _format_turn(i: int, turn: Dict) -> str:
+    role = "Mülakatçı" if turn.get("role") == "assistant" else "Aday"
+    return f"[Turn {i+1}] {role}: {turn.get('text', '')}\n\n"
+
+
+# Input budget for the transcript part of the weakness-analysis prompt.
+# Older turns beyond it are replaced by a compact extractive summary.
+MAX_CONV_TOKENS = 2000
+# Q/A exchanges from those older turns kept in the summary
+_SUMMARY_PAIRS = 8
+
+
+def _approx_tokens(text: str) -> int:
+    # ~3 chars/token is a conservative estimate for Turkish text with gpt-4o-mini
+    return len(text) // 3 + 1
+
+
+def _turn_parts(conversation_history: List[Dict], interview_id: int | None) -> List[str]:
+    if interview_id is None:
+        return [_format_turn(i, t) for i, t in enumerate(conversation_history)]
+    parts = _CONV_CACHE.get(interview_id)
+    n = len(conversation_history)
+    # Reuse the cached prefix only if the history grew and its last cached turn is unchanged
+    if not parts or len(parts) > n or parts[-1] != _format_turn(len(parts) - 1, conversation_history[len(parts) - 1]):
+        parts = []
+    parts.extend(_format_turn(i, conversation_history[i]) for i in range(len(parts), n))
+    _CONV_CACHE[interview_id] = parts
+    _CONV_CACHE.move_to_end(interview_id)
+    while len(_CONV_CACHE) > _CONV_CACHE_MAX:
+        _CONV_CACHE.popitem(last=False)
+    return parts
+
+
+def _conversation_text(conversation_history: List[Dict], interview_id: int | None) -> str:
+    parts = _turn_parts(conversation_history, interview_id)
+    # Keep the most recent turns that fit the budget (always at least the last one)
+    start, budget = len(parts), MAX_CONV_TOKENS
+    while start > 0:
+        cost = _approx_tokens(parts[start - 1])
+        if cost > budget and start < len(parts):
+            break
+        budget -= cost
+        start -= 1
+    if start == 0:
+        return "".join(parts)
+    summary = build_rolling_summary(conversation_history[:start], max_last_pairs=_SUMMARY_PAIRS, max_len=1200)
+    return f"[Turn 1-{start}, last {_SUMMARY_PAIRS} Q/A pairs] {summary}\n\n" + "".join(parts[start:])
+
+
+async def analyze_response_weaknesses(
+    conversation_history: List[Dict], job_requirements: str, interview_id: int | None = None
+) -> Dict[str, Any]:
+    """
+    Enhanced competency gap detection with detailed evidence tracking.
+    Pass interview_id to reuse the formatted transcript across turns.
+    """
+    if not (settings.openai_api_key and conversation_history):
+        return {"weak_areas": [], "follow_up_strategy": "standard"}
+    
+    # Build conversation context with turn tracking
+    conversation_text = _conversation_text(conversation_history, interview_id)
+    
+    prompt = f"""İŞ GEREKSİNİMLERİ:
 {job_requirements}
 
 MÜLAKAT KONUŞMASI:
 {conversation_text}"""
     
-    headers = {"Authorization": f"Bearer {settings.openai_api_key}"}
+    cache_key = prompt_key(prompt)
+    cached = _WEAKNESS_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    
     body = {
         "model": "gpt-4o-mini",
-        "messages": [{"role": "user", "content": prompt}],
+        "messages": [
+            {"role": "system", "content": _WEAKNESS_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt},
+        ],
         "temperature": 0.2,
+        "max_tokens": 700,
         "response_format": {"type": "json_object"}
     }
     
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.post("https://api.openai.com/v1/chat/completions", json=body, headers=headers)
-            resp.raise_for_status()
-            data = resp.json()
-            
-            import json
-            result = json.loads(data["choices"][0]["message"]["content"])
-            
-            # Validate and set defaults
-            for area in result.get("weak_areas", []):
-                area.setdefault("importance_score", 0.5)
-                area.setdefault("gap_type", "shallow_response")
-                area.setdefault("probing_strategy", "clarifying")
-            
-            result.setdefault("interview_momentum", "moderate")
-            result.setdefault("competency_coverage", {"technical": 0.5, "behavioral": 0.5, "cultural": 0.5})
-            
-            return result
-    except Exception as e:
-        print(f"Adaptive analysis failed: {e}")
+        data = await _post_chat(body, timeout=30)
+    except Exception:
+        logger.warning("Adaptive analysis request failed", exc_info=True)
+        return {"weak_areas": [], "follow_up_strategy": "standard"}
+    
+    try:
+        result = orjson.loads(data["choices"][0]["message"]["content"])
+        
+        # Validate and set defaults
+        for area in result.get("weak_areas", []):
+            area.setdefault("importance_score", 0.5)
+            area.setdefault("gap_type", "shallow_response")
+            area.setdefault("probing_strategy", "clarifying")
+        
+        result.setdefault("interview_momentum", "moderate")
+        result.setdefault("competency_coverage", {"technical": 0.5, "behavioral": 0.5, "cultural": 0.5})
+        
+        _WEAKNESS_CACHE.put(cache_key, result)
+        return result
+    except (ValueError, KeyError, IndexError, TypeError, AttributeError):
+        logger.warning("Adaptive analysis returned unusable JSON", exc_info=True)
         return {"weak_areas": [], "follow_up_strategy": "standard"}
 
 
-async def generate_targeted_question(weak_area: Dict[str, Any], job_context: str) -> str:
-    """
-    Generate strategically targeted follow-up questions with dynamic difficulty adjustment
-    """
-    if not (settings.openai_api_key and weak_area):
-        return ""
-    
+def _targeted_body(weak_area: Dict[str, Any], job_context: str) -> Dict[str, Any]:
+    """Chat-completions request body for a targeted follow-up (shared by both variants)."""
     area = weak_area.get("area", "")
     weakness_level = weak_area.get("weakness_level", "medium")
     evidence = weak_area.get("evidence", "")
@@ -111,9 +404,7 @@ async def generate_targeted_question(weak_area: Dict[str, Any], job_context: str
     probing_strategy = weak_area.get("probing_strategy", "clarifying")
     importance_score = weak_area.get("importance_score", 0.5)
     
-    prompt = f"""Sen master-level bir behavioral interviewer'sın. Tespit edilen zayıflık için stratejik takip sorusu geliştir.
-
-ZAYIFLIK DETAYI:
+    prompt = f"""ZAYIFLIK DETAYI:
 - Alan: {area}
 - Seviye: {weakness_level}
 - Gap Tipi: {gap_type}
@@ -121,58 +412,120 @@ ZAYIFLIK DETAYI:
 - Önem: {importance_score}
 - Kanıt: {evidence}
 
-SORU STRATEJİLERİ:
-- scenario: Zorlayıcı durum senaryoları
-- behavioral: STAR formatında gerçek deneyim
-- technical: Derinlemesine teknik bilgi
-- clarifying: Netleştirme ve detay alma
-
-ZORLUK SEVİYELERİ:
-- critical: Max zorluk, yüksek stakes senaryo
-- high: Zorlayıcı, gerçekçi durumlar  
-- medium: Orta seviye detay talebi
-- low: Basit netleştirme
-
-SORU KRİTERLERİ:
-✓ Spesifik ve hedefli (generic değil)
-✓ STAR metodunu teşvik eder
-✓ Ölçülebilir cevap bekler
-✓ İş bağlamına uygun
-✓ Adil ama zorlayıcı
-✓ Maksimum 2 cümle
-
 İŞ BAĞLAMI:
-{job_context[:1200]}
-
-SADECE SORUYU DÖNDÜR (açıklama yok):"""
+{job_context[:1200]}"""
     
-    headers = {"Authorization": f"Bearer {settings.openai_api_key}"}
-    body = {
+    return {
         "model": "gpt-4o-mini",
-        "messages": [{"role": "user", "content": prompt}],
+        "messages": [
+            {"role": "system", "content": _TARGETED_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt},
+        ],
         "temperature": 0.3,
-        "max_tokens": 150
+        # Plain-text answer of at most 2 sentences; stop before any trailing explanation
+        "max_tokens": 120,
+        "stop": ["\n\n"]
     }
+
+
+def clean_targeted_question(question: str) -> str:
+    """Normalize model output into a single question ending with '?'."""
+    question = question.strip().replace('"', '').replace("'", "'")
+    if question.endswith('.'):
+        question = question[:-1] + '?'
+    elif not question.endswith('?'):
+        question += '?'
+    return question
+
+
+async def generate_targeted_question(weak_area: Dict[str, Any], job_context: str) -> str:
+    """
+    Generate strategically targeted follow-up questions with dynamic difficulty adjustment
+    """
+    if not (settings.openai_api_key and weak_area):
+        return ""
     
     try:
-        async with httpx.AsyncClient(timeout=20) as client:
-            resp = await client.post("https://api.openai.com/v1/chat/completions", json=body, headers=headers)
-            resp.raise_for_status()
-            data = resp.json()
-            
-            question = data["choices"][0]["message"]["content"].strip()
-            
-            # Clean up the question
-            question = question.replace('"', '').replace("'", "'")
-            if question.endswith('.'):
-                question = question[:-1] + '?'
-            elif not question.endswith('?'):
-                question += '?'
-                
-            return question
-    except Exception as e:
-        print(f"Targeted question generation failed: {e}")
-        return get_fallback_adaptive_question(area, weakness_level)
+        data = await _post_chat(_targeted_body(weak_area, job_context), timeout=20)
+        return clean_targeted_question(data["choices"][0]["message"]["content"])
+    except Exception:
+        logger.warning("Targeted question generation failed", exc_info=True)
+        return get_fallback_adaptive_question(weak_area.get("area", ""), weak_area.get("weakness_level", "medium"))
+
+
+# Keyword matchers, compiled once: one regex scan per response instead of one
+# substring scan per keyword. Patterns are lowercase; match against lowered text.
+_VAGUE_INDICATORS = ("bilmiyorum", "emin değilim", "tam hatırlamıyorum", "sanırım", "belki")
+_CONFIDENCE_WORDS = ("kesinlikle", "eminim", "deneyimim var", "uzmanım", "başarıyla")
+_UNCERTAINTY_WORDS = ("sanırım", "belki", "tam emin değilim", "çok bilmiyorum", "deneyimim yok")
+_TECHNICAL_TERMS = ("api", "database", "algorithm", "framework", "architecture", "performance", "scalability")
+
+
+def _matcher(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    return re.compile("|".join(map(re.escape, patterns)))
+
+
+_VAGUE_RE = _matcher(_VAGUE_INDICATORS)
+_CONFIDENCE_RE = _matcher(_CONFIDENCE_WORDS)
+_UNCERTAINTY_RE = _matcher(_UNCERTAINTY_WORDS)
+_TECHNICAL_RE = _matcher(_TECHNICAL_TERMS)
+
+
+def _any_hit(matcher: re.Pattern[str], text: str) -> bool:
+    return matcher.search(text) is not None
+
+
+# str.lower() maps "İ" to "i" + combining dot (U+0307), which would keep
+# "EMİN DEĞİLİM" from matching "emin değilim". "I" is left alone so English
+# terms like "API" still lower to "api".
+_TR_LOWER = str.maketrans({"İ": "i"})
+
+
+def _lower(text: str) -> str:
+    """Lowercase once per response; the translate pass runs only when needed."""
+    if "İ" in text:
+        text = text.translate(_TR_LOWER)
+    return text.lower()
+
+
+@dataclass(frozen=True, slots=True)
+class ResponseStats:
+    """Per-history counters shared by should_adapt_interview and the difficulty adjustment."""
+    count: int
+    avg_chars: float
+    avg_words: float
+    vague: int
+    confidence: int
+    uncertainty: int
+    technical: int
+
+
+def _user_texts(conversation_history: List[Dict]) -> tuple[str, ...]:
+    return tuple(turn.get("text", "") for turn in conversation_history if turn.get("role") == "user")
+
+
+@functools.lru_cache(maxsize=256)
+def _response_stats(texts: tuple[str, ...]) -> ResponseStats:
+    """One pass over the user responses, lowering each text once (memoized per snapshot)."""
+    chars = words = vague = confidence = uncertainty = technical = 0
+    for text in texts:
+        chars += len(text)
+        words += len(text.split())
+        lowered = _lower(text)
+        vague += _any_hit(_VAGUE_RE, lowered)
+        confidence += _any_hit(_CONFIDENCE_RE, lowered)
+        uncertainty += _any_hit(_UNCERTAINTY_RE, lowered)
+        technical += _any_hit(_TECHNICAL_RE, lowered)
+    n = len(texts)
+    return ResponseStats(
+        count=n,
+        avg_chars=chars / n if n else 0,
+        avg_words=words / n if n else 0,
+        vague=vague,
+        confidence=confidence,
+        uncertainty=uncertainty,
+        technical=technical,
+    )
 
 
 async def should_adapt_interview(conversation_history: List[Dict], asked_count: int) -> bool:
@@ -183,47 +536,53 @@ async def should_adapt_interview(conversation_history: List[Dict], asked_count:
     if asked_count < 3:
         return False
     
-    # Look for signs that adaptation is needed
-    user_responses = [turn for turn in conversation_history if turn.get("role") == "user"]
-    
-    # Check for consistently short responses
-    avg_response_length = sum(len(r.get("text", "")) for r in user_responses) / len(user_responses) if user_responses else 0
-    
-    # Check for vague responses
-    vague_indicators = ["bilmiyorum", "emin değilim", "tam hatırlamıyorum", "sanırım", "belki"]
-    vague_responses = sum(1 for r in user_responses if any(indicator in r.get("text", "").lower() for indicator in vague_indicators))
-    
-    # Adapt if responses are too short or too vague
-    return avg_response_length < 50 or vague_responses >= 2
+    # Look for signs that adaptation is needed: consistently short or vague responses
+    stats = _response_stats(_user_texts(conversation_history))
+    return stats.avg_chars < 50 or stats.vague >= 2
+
+
+# Built once at import; read-only so callers cannot mutate shared state
+_FALLBACK_TEMPLATES: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "teknik": MappingProxyType({
+        "high": "En karmaşık teknik problemi çözdüğünüz bir durumu STAR metoduyla anlatır mısınız? Hangi teknolojileri kullandınız ve neden?",
+        "medium": "Teknik bir zorluğu nasıl çözdüğünüz somut bir örnek verebilir misiniz?",
+        "low": "Kullandığınız teknolojiler hakkında biraz daha detay verebilir misiniz?"
+    }),
+    "liderlik": MappingProxyType({
+        "high": "Ekibinizde ciddi bir çatışma yaşandığı ve projeyi tehlikeye attığı bir durumda nasıl müdahale ettiniz?",
+        "medium": "Zorlu bir projede ekibinizi nasıl motive ettiğinizi anlatır mısınız?",
+        "low": "Takım çalışmasında hangi rolü tercih ediyorsunuz?"
+    }),
+    "problem_solving": MappingProxyType({
+        "high": "Hiç karşılaşmadığınız bir problemle başbaşa kaldığınızda hangi adımları izlersiniz? Somut örnek verebilir misiniz?",
+        "medium": "Karmaşık bir problemi nasıl parçalara ayırıp çözdüğünüz bir örnek paylaşır mısınız?",
+        "low": "Problem çözme yaklaşımınızı nasıl tanımlarsınız?"
+    }),
+})
+_DEFAULT_FALLBACK = "Bu konuda daha detaylı bilgi verebilir misiniz?"
+_EMPTY: Mapping[str, str] = MappingProxyType({})
 
 
 def get_fallback_adaptive_question(area: str, level: str = "medium") -> str:
     """
     Fallback adaptive questions when API fails
     """
-    question_templates = {
-        "teknik": {
-            "high": "En karmaşık teknik problemi çözdüğünüz bir durumu STAR metoduyla anlatır mısınız? Hangi teknolojileri kullandınız ve neden?",
-            "medium": "Teknik bir zorluğu nasıl çözdüğünüz somut bir örnek verebilir misiniz?",
-            "low": "Kullandığınız teknolojiler hakkında biraz daha detay verebilir misiniz?"
-        },
-        "liderlik": {
-            "high": "Ekibinizde ciddi bir çatışma yaşandığı ve projeyi tehlikeye attığı bir durumda nasıl müdahale ettiniz?",
-            "medium": "Zorlu bir projede ekibinizi nasıl motive ettiğinizi anlatır mısınız?",
-            "low": "Takım çalışmasında hangi rolü tercih ediyorsunuz?"
-        },
-        "problem_solving": {
-            "high": "Hiç karşılaşmadığınız bir problemle başbaşa kaldığınızda hangi adımları izlersiniz? Somut örnek verebilir misiniz?",
-            "medium": "Karmaşık bir problemi nasıl parçalara ayırıp çözdüğünüz bir örnek paylaşır mısınız?",
-            "low": "Problem çözme yaklaşımınızı nasıl tanımlarsınız?"
-        }
-    }
-    
-    return question_templates.get(area, {}).get(level, "Bu konuda daha detaylı bilgi verebilir misiniz?")
+    return _FALLBACK_TEMPLATES.get(area, _EMPTY).get(level, _DEFAULT_FALLBACK)
 
 
 # --- PHASE 3: ADVANCED ADAPTIVE FEATURES ---
 
+def _difficulty_decision(stats: ResponseStats, avg_performance: float) -> Tuple[str, str]:
+    """Difficulty level and reason from response stats (pure threshold logic)."""
+    if avg_performance > 0.8 and stats.avg_words > 80 and stats.confidence > stats.uncertainty:
+        return "high", "strong_performance_increase_challenge"
+    if avg_performance < 0.4 or stats.uncertainty > stats.confidence * 2:
+        return "low", "struggling_reduce_pressure"
+    if stats.technical >= stats.count * 0.6:
+        return "high", "technical_competence_detected"
+    return "medium", "balanced_approach"
+
+
 async def calculate_interview_difficulty_adjustment(conversation_history: List[Dict], candidate_performance: Dict[str, float]) -> Dict[str, Any]:
     """
     Dynamically adjust interview difficulty based on candidate performance patterns
@@ -231,44 +590,19 @@ async def calculate_interview_difficulty_adjustment(conversation_history: List[D
     if not conversation_history:
         return {"difficulty_level": "medium", "adjustment_reason": "insufficient_data"}
     
-    user_responses = [turn for turn in conversation_history if turn.get("role") == "user"]
-    if len(user_responses) < 2:
+    stats = _response_stats(_user_texts(conversation_history))
+    if stats.count < 2:
         return {"difficulty_level": "medium", "adjustment_reason": "insufficient_responses"}
     
-    # Analyze response quality indicators
-    total_words = sum(len(response.get("text", "").split()) for response in user_responses)
-    avg_response_length = total_words / len(user_responses)
-    
-    # Check for confidence indicators
-    confidence_words = ["kesinlikle", "eminim", "deneyimim var", "uzmanım", "başarıyla"]
-    uncertainty_words = ["sanırım", "belki", "tam emin değilim", "çok bilmiyorum", "deneyimim yok"]
-    
-    confidence_count = sum(1 for response in user_responses 
-                          if any(word in response.get("text", "").lower() for word in confidence_words))
-    uncertainty_count = sum(1 for response in user_responses 
-                           if any(word in response.get("text", "").lower() for word in uncertainty_words))
-    
-    # Calculate technical depth (presence of technical terms)
-    technical_terms = ["api", "database", "algorithm", "framework", "architecture", "performance", "scalability"]
-    technical_mentions = sum(1 for response in user_responses 
-                            if any(term in response.get("text", "").lower() for term in technical_terms))
+    avg_response_length = stats.avg_words
+    confidence_count = stats.confidence
+    uncertainty_count = stats.uncertainty
+    technical_mentions = stats.technical
     
     # Performance-based scoring
     avg_performance = sum(candidate_performance.values()) / len(candidate_performance) if candidate_performance else 0.5
     
-    # Decision logic
-    if avg_performance > 0.8 and avg_response_length > 80 and confidence_count > uncertainty_count:
-        difficulty = "high"
-        reason = "strong_performance_increase_challenge"
-    elif avg_performance < 0.4 or uncertainty_count > confidence_count * 2:
-        difficulty = "low"
-        reason = "struggling_reduce_pressure"
-    elif technical_mentions >= len(user_responses) * 0.6:
-        difficulty = "high"
-        reason = "technical_competence_detected"
-    else:
-        difficulty = "medium"
-        reason = "balanced_approach"
+    difficulty, reason = _difficulty_decision(stats, avg_performance)
     
     return {
         "difficulty_level": difficulty,
@@ -276,79 +610,72 @@ async def calculate_interview_difficulty_adjustment(conversation_history: List[D
         "performance_indicators": {
             "avg_response_length": avg_response_length,
             "confidence_ratio": confidence_count / max(1, uncertainty_count),
-            "technical_density": technical_mentions / len(user_responses),
+            "technical_density": technical_mentions / stats.count,
             "avg_performance_score": avg_performance
         },
         "suggested_approach": _get_difficulty_approach(difficulty)
     }
 
 
+_DIFFICULTY_APPROACHES: Mapping[str, str] = MappingProxyType({
+    "high": "Zorlayıcı senaryolar, derinlemesine teknik sorular, karmaşık problemler",
+    "medium": "Dengeli yaklaşım, STAR örnekleri, orta seviye detay",
+    "low": "Destekleyici sorular, temel kavramlar, güven artırıcı yaklaşım"
+})
+
+
 def _get_difficulty_approach(difficulty: str) -> str:
     """Return interview approach based on difficulty level"""
-    approaches = {
-        "high": "Zorlayıcı senaryolar, derinlemesine teknik sorular, karmaşık problemler",
-        "medium": "Dengeli yaklaşım, STAR örnekleri, orta seviye detay",
-        "low": "Destekleyici sorular, temel kavramlar, güven artırıcı yaklaşım"
-    }
-    return approaches.get(difficulty, approaches["medium"])
+    return _DIFFICULTY_APPROACHES.get(difficulty, _DIFFICULTY_APPROACHES["medium"])
 
 
 async def generate_competency_focused_questions(missing_competencies: List[str], job_requirements: str) -> List[Dict[str, Any]]:
     """
-    Generate a sequence of questions specifically targeting missing competencies
+    Generate a sequence of questions specifically targeting missing competencies.
+    One smaller request per competency, issued concurrently (bounded by _SEM).
     """
     if not (settings.openai_api_key and missing_competencies):
         return []
     
-    competencies_text = ", ".join(missing_competencies)
-    
-    prompt = f"""Sen competency-based interview uzmanısın. Eksik bulunan yetkinlikler için hedefli soru dizisi oluştur.
-
-EKSİK YETKİNLİKLER: {competencies_text}
+    results = await asyncio.gather(
+        *[_competency_questions(c, job_requirements) for c in missing_competencies]
+    )
+    return [q for questions in results for q in questions]
 
-Her yetkinlik için şu formatta soru tasarla:
 
-ZORUNLU JSON FORMAT:
-{{
-  "questions": [
-    {{
-      "competency": "Spesifik yetkinlik adı",
-      "question": "STAR formatını teşvik eden açık uçlu soru",
-      "difficulty": "junior|mid|senior",
-      "follow_up_probes": [
-        "Detay alma sorusu 1",
-        "Derinleştirme sorusu 2"
-      ],
-      "evaluation_criteria": [
-        "Değerlendirme kriteri 1",
-        "Değerlendirme kriteri 2"
-      ],
-      "red_flags": ["Kırmızı bayrak işaretleri"],
-      "ideal_response_indicators": ["Güçlü cevap göstergeleri"]
-    }}
-  ]
-}}
+def _competency_body(competency: str, job_requirements: str) -> Dict[str, Any]:
+    """Chat-completions request body for one competency."""
+    prompt = f"""EKSİK YETKİNLİK: {competency}
 
 İŞ GEREKSİNİMLERİ:
 {job_requirements[:2000]}"""
     
-    headers = {"Authorization": f"Bearer {settings.openai_api_key}"}
-    body = {
+    return {
         "model": "gpt-4o-mini",
-        "messages": [{"role": "user", "content": prompt}],
+        "messages": [
+            {"role": "system", "content": _COMPETENCY_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt},
+        ],
         "temperature": 0.2,
         "response_format": {"type": "json_object"}
     }
+
+
+async def _competency_questions(competency: str, job_requirements: str) -> List[Dict[str, Any]]:
+    body = _competency_body(competency, job_requirements)
     
     try:
-        async with httpx.AsyncClient(timeout=35) as client:
-            resp = await client.post("https://api.openai.com/v1/chat/completions", json=body, headers=headers)
-            resp.raise_for_status()
-            data = resp.json()
-            
-            import json
-            result = json.loads(data["choices"][0]["message"]["content"])
-            return result.get("questions", [])
-    except Exception as e:
-        print(f"Competency question generation failed: {e}")
+        data = await _post_chat(body, timeout=35)
+        
+        result = orjson.loads(data["choices"][0]["message"]["content"])
+        return result.get("questions", [])
+    except Exception:
+        logger.warning("Competency question generation failed", exc_info=True)
         return []
+
+
+async def generate_targeted_questions_batch(weak_areas: List[Dict[str, Any]], job_context: str) -> List[str]:
+    """
+    Generate targeted follow-ups for several weak areas concurrently (order preserved)
+    """
+    return list(await asyncio.gather(*[generate_targeted_question(w, job_context) for w in weak_areas]))
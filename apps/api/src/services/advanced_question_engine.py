@@ -5,14 +5,32 @@ Focus: LLM-generated questions that naturally extract STAR components without as
 """
 
 from __future__ import annotations
-import json
+import asyncio
+import dataclasses
+import functools
+import itertools
 import random
-from typing import Dict, Any, List, Optional, Tuple
+import re
+import time
+from collections import Counter, OrderedDict
+from typing import Awaitable, Callable, Dict, Any, List, Mapping, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 
-from src.services.llm_client import get_llm_client, LLMRequest
-from src.services.prompt_registry import generic_question_prompt, situational_prompt_base, build_role_guidance_block as PR_ROLE_BLOCK
+import orjson
+
+from src.core.config import settings
+from src.services.adaptive_questions import embed
+from src.services.llm_cache import PartitionedSemanticCache, SemanticCache, prompt_key
+from src.services.llm_client import get_llm_client, LLMProvider, LLMRequest, LLMResponse
+from src.services.prompt_registry import (
+    GENERIC_QUESTION_SYSTEM,
+    SITUATIONAL_QUESTION_SYSTEM,
+    generic_question_user_message,
+    situational_user_message,
+    build_role_guidance_block as PR_ROLE_BLOCK,
+)
 
 
 class QuestionType(str, Enum):
@@ -44,7 +62,7 @@ class IndustryType(str, Enum):
     STARTUP = "startup"
 
 
-@dataclass
+@dataclass(slots=True)
 class QuestionMetadata:
     """Metadata for interview questions"""
     question_type: QuestionType
@@ -56,7 +74,7 @@ class QuestionMetadata:
     success_criteria: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratedQuestion:
     """A generated interview question with metadata"""
     question: str
@@ -68,6 +86,427 @@ class GeneratedQuestion:
     ideal_response_indicators: List[str] = field(default_factory=list)
 
 
+# Keyword tables for job/profile analysis, checked in priority order. All of
+# them are compiled into one trie-shaped regex (_KEYWORD_RE) below.
+_INDUSTRY_KEYWORDS: Tuple[Tuple[IndustryType, Tuple[str, ...]], ...] = (
+    (IndustryType.FINANCE, ("fintech", "banking", "financial", "trading", "investment")),
+    (IndustryType.STARTUP, ("startup", "scale-up", "early stage", "seed")),
+    (IndustryType.HEALTHCARE, ("healthcare", "medical", "hospital", "clinic")),
+    (IndustryType.RETAIL, ("retail", "e-commerce", "shopping", "consumer")),
+    (IndustryType.EDUCATION, ("education", "university", "school", "learning")),
+    (IndustryType.CONSULTING, ("consulting", "advisory", "strategy")),
+)
+
+_SENIORITY_KEYWORDS: Tuple[Tuple[int, Tuple[str, ...]], ...] = (
+    (2, ("senior", "lead", "principal", "architect", "director")),
+    (1, ("mid-level", "intermediate", "experienced")),
+)
+
+_COMPETENCY_KEYWORDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("Technical Proficiency", ("python", "javascript", "java", "react", "node", "aws")),
+    ("Leadership", ("lead", "mentor", "guide", "manage")),
+    ("System Design", ("architecture", "design", "system", "scalable")),
+    ("Problem Solving", ("problem", "solve", "troubleshoot", "debug")),
+    ("Communication", ("communicate", "collaborate", "team", "stakeholder")),
+    ("Project Management", ("agile", "scrum", "project", "delivery")),
+)
+
+
+# Structured-output schema for _generate_smart_question. Strict mode requires
+# every property to be listed and additionalProperties to be false.
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+_QUESTION_SCHEMA: Dict[str, Any] = {
+    "name": "interview_question",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "question": {"type": "string"},
+            "context": {"type": "string"},
+            "follow_up_questions": _STRING_LIST,
+            "evaluation_rubric": {
+                "type": "object",
+                "properties": {
+                    "excellent": {"type": "string"},
+                    "good": {"type": "string"},
+                    "poor": {"type": "string"},
+                },
+                "required": ["excellent", "good", "poor"],
+                "additionalProperties": False,
+            },
+            "red_flags": _STRING_LIST,
+            "ideal_response_indicators": _STRING_LIST,
+        },
+        "required": [
+            "question", "context", "follow_up_questions", "evaluation_rubric",
+            "red_flags", "ideal_response_indicators",
+        ],
+        "additionalProperties": False,
+    },
+}
+# ~350 tokens covers the schema for a typical answer; a response cut off at
+# the cap is retried once with the larger budget
+_QUESTION_MAX_TOKENS = 350
+_QUESTION_RETRY_MAX_TOKENS = 600
+# Past this, _generate_smart_question serves a template question instead
+_QUESTION_TIMEOUT_SECONDS = 20.0
+# Share of that deadline the semantic-cache embedding may spend
+_EMBED_TIMEOUT_SECONDS = 2.0
+# Speculative next-question tasks kept per engine, and how long one stays usable
+_PREFETCH_MAX = 256
+_PREFETCH_TTL_SECONDS = 600.0
+
+# Minimal per-type fallback questions - the LLM should generate most questions
+_FALLBACK_QUESTIONS: Mapping[QuestionType, Tuple[str, ...]] = MappingProxyType({
+    QuestionType.TECHNICAL: (
+        "Kariyerinizdeki en zorlu teknik problemi nasıl çözdünüz?",
+        "Hangi teknoloji kararından en çok öğrendiniz?",
+    ),
+    QuestionType.BEHAVIORAL: (
+        "İş hayatınızda karşılaştığınız en zor durumu nasıl aştınız?",
+        "Takım içinde anlaşmazlık yaşadığınız bir deneyiminizi anlatır mısınız?",
+    ),
+    QuestionType.SITUATIONAL: (
+        "Beklenmedik bir sorunla karşılaştığınızda nasıl yaklaşırsınız?",
+        "Priorileleri nasıl belirlersiniz?",
+    ),
+})
+
+# Template content for fallback questions. Each GeneratedQuestion gets its own
+# list/dict copy so callers can't mutate the shared constants.
+_GENERIC_FALLBACK_QUESTIONS = (
+    "Kariyerinizdeki en zorlu projeyi nasıl yönettiniz?",
+    "Takım içinde çatışma yaşadığınız bir durumu nasıl çözdünüz?",
+    "Başarısız olduğunuz bir deneyimden ne öğrendiniz?",
+)
+_FALLBACK_FOLLOW_UPS = (
+    "Bu durumda farklı ne yapabilirdiniz?",
+    "Sonuçları nasıl ölçtünüz?",
+    "Bu deneyimden hangi dersleri çıkardınız?",
+    "Benzer durumda ne farklı yaparsınız?",
+)
+_FALLBACK_RUBRIC = MappingProxyType({
+    "excellent": "Detaylı, yapılandırılmış, öz-farkındalık içeren cevap",
+    "good": "Net örnek, öğrenme çıkarımları mevcut",
+    "poor": "Belirsiz, sorumluluğu üstlenmeyen, yüzeysel cevap",
+})
+# Follow-up probes used when generate_follow_up_question can't reach the LLM
+_FALLBACK_PROBES = (
+    "Bu durumda farklı ne yapabilirdiniz?",
+    "Sonuçları nasıl ölçtünüz?",
+    "Bu deneyimden hangi dersleri çıkardınız?",
+    "Benzer bir durumla tekrar karşılaştığınızda ne yaparsınız?",
+    "Bu süreçte en zorlu kısım neydi ve nasıl aştınız?",
+)
+
+
+# Question types by interview phase (see generate_strategic_question)
+_EARLY_TYPES = (QuestionType.TECHNICAL, QuestionType.COMPETENCY)
+_MID_TYPES = (QuestionType.SITUATIONAL, QuestionType.PROBLEM_SOLVING)
+_LATE_TYPES = (QuestionType.CULTURE_FIT, QuestionType.LEADERSHIP)
+
+_YEARS_RE = re.compile(r"(\d+)\s*(?:years?|yıl)")
+
+
+def _trie_pattern(words: List[str]) -> str:
+    """Regex alternation for words, factored by shared prefixes."""
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def _emit(node: Dict[str, Any]) -> str:
+        branches = [re.escape(ch) + _emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        group = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            return "(?:" + group + ")?"
+        return group
+
+    return _emit(trie)
+
+
+def _build_keyword_matcher() -> Tuple["re.Pattern[str]", Dict[str, frozenset]]:
+    labels: Dict[str, set] = {}
+    for industry, keywords in _INDUSTRY_KEYWORDS:
+        for keyword in keywords:
+            labels.setdefault(keyword, set()).add(("industry", industry))
+    for score, keywords in _SENIORITY_KEYWORDS:
+        for keyword in keywords:
+            labels.setdefault(keyword, set()).add(("seniority", score))
+    for competency, keywords in _COMPETENCY_KEYWORDS:
+        for keyword in keywords:
+            labels.setdefault(keyword, set()).add(("competency", competency))
+    # The regex reports only the longest keyword starting at a position, so
+    # a hit also carries the labels of every keyword that prefixes it
+    # ("architecture" implies "architect").
+    closed = {
+        keyword: frozenset().union(*(labels[other] for other in labels if keyword.startswith(other)))
+        for keyword in labels
+    }
+    return re.compile(r"\b" + _trie_pattern(list(labels))), closed
+
+
+# Keywords match at the start of a word: "leadership", "systems" and "managed"
+# still count, while "exceed" (seed), "ecosystem" (system) or "steam" (team)
+# no longer do.
+_KEYWORD_RE, _KEYWORD_LABELS = _build_keyword_matcher()
+
+
+@functools.lru_cache(maxsize=128)
+def _job_hits(job_lower: str) -> frozenset:
+    """Labels of every keyword found in a lowercased job description (one regex pass)."""
+    return frozenset().union(*(_KEYWORD_LABELS[m] for m in _KEYWORD_RE.findall(job_lower)))
+
+
+def _industry_of(job_lower: str) -> IndustryType:
+    hits = _job_hits(job_lower)
+    for industry, _keywords in _INDUSTRY_KEYWORDS:
+        if ("industry", industry) in hits:
+            return industry
+    return IndustryType.TECH  # Default to tech
+
+
+def _difficulty_of(job_lower: str, resume_lower: str) -> DifficultyLevel:
+    # Check job level indicators
+    hits = _job_hits(job_lower)
+    job_score = next((score for score, _keywords in _SENIORITY_KEYWORDS if ("seniority", score) in hits), 0)
+
+    # Check experience indicators in resume
+    experience_score = 0
+    if "years experience" in resume_lower or "years of experience" in resume_lower:
+        years_match = _YEARS_RE.search(resume_lower)
+        if years_match:
+            years = int(years_match.group(1))
+            if years >= 8:
+                experience_score += 2
+            elif years >= 4:
+                experience_score += 1
+
+    total_score = job_score + experience_score
+
+    if total_score >= 3:
+        return DifficultyLevel.SENIOR
+    elif total_score >= 2:
+        return DifficultyLevel.MID
+    else:
+        return DifficultyLevel.JUNIOR
+
+
+def _competencies_of(job_lower: str) -> List[str]:
+    hits = _job_hits(job_lower)
+    return [label for label, _keywords in _COMPETENCY_KEYWORDS if ("competency", label) in hits]
+
+
+@functools.lru_cache(maxsize=128)
+def _analyze_profile(
+    job_description: str, resume_text: str
+) -> Tuple[IndustryType, DifficultyLevel, Tuple[str, ...]]:
+    """Keyword analysis of a job/resume pair; the same pair recurs on every turn of a session."""
+    job_lower = job_description.lower()
+    resume_lower = resume_text.lower()
+    return _industry_of(job_lower), _difficulty_of(job_lower, resume_lower), tuple(_competencies_of(job_lower))
+
+
+@functools.lru_cache(maxsize=128)
+def _situational_system_message(job_description: str) -> str:
+    """Static situational instructions plus the matched role's guidance block."""
+    role_block = PR_ROLE_BLOCK(job_description)
+    return SITUATIONAL_QUESTION_SYSTEM + ("\n" + role_block if role_block else "")
+
+
+def _prefetch_key(job_description: str, resume_text: str, question_count: int, focus: Optional[str]) -> str:
+    return prompt_key(f"{question_count}|{focus or ''}|{job_description}|{resume_text}")
+
+
+def _question_type_for(question_count: int) -> QuestionType:
+    """Question type for the next turn, given how many questions were already asked"""
+    if question_count == 0:
+        # Opening question - usually behavioral
+        return QuestionType.BEHAVIORAL
+    elif question_count <= 2:
+        # Early questions - mix of technical and competency
+        return _EARLY_TYPES[random.randrange(len(_EARLY_TYPES))]
+    elif question_count <= 4:
+        # Middle questions - situational and problem solving
+        return _MID_TYPES[random.randrange(len(_MID_TYPES))]
+    else:
+        # Later questions - culture fit and leadership
+        return _LATE_TYPES[random.randrange(len(_LATE_TYPES))]
+
+
+def _parse_question_json(content: str) -> Optional[Dict[str, Any]]:
+    """Parsed question object, or None for prose or malformed/truncated JSON."""
+    content = content.strip()
+    # Prose (e.g. the client's rule-based fallback text) is not worth parsing
+    if not content.startswith("{"):
+        return None
+    try:
+        result = orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return None
+    return result if isinstance(result, dict) else None
+
+
+def _is_question_json(content: str) -> bool:
+    """Whether content parses as a question object (the only replies worth caching)"""
+    return _parse_question_json(content) is not None
+
+
+def _consume_result(task: "asyncio.Future[Any]") -> None:
+    """Retrieve a detached task's outcome so failures aren't reported as never retrieved."""
+    if not task.cancelled():
+        task.exception()
+
+
+def _assistant_turns(conversation_history: List[Dict[str, Any]]) -> int:
+    return sum(1 for msg in conversation_history if msg.get("role") == "assistant")
+
+
+def _sampling(temperature: float, prompt: str) -> Dict[str, Any]:
+    """Sampling params for a request; LLM_DETERMINISTIC pins temperature 0 and a prompt-derived seed."""
+    if not settings.llm_deterministic:
+        return {"temperature": temperature}
+    return {"temperature": 0.0, "seed": int(prompt_key(prompt)[:8], 16)}
+
+
+def _request_key(request: LLMRequest) -> str:
+    """Hash of everything that changes the model's answer for a request."""
+    return prompt_key(
+        f"{request.model}|{request.temperature}|{request.seed}|{request.max_tokens}|{request.response_format}|"
+        f"{request.system_message}|{request.messages}|{request.prompt}"
+    )
+
+
+# In-flight result telling coalesced waiters the owning call was cancelled
+_RETRY: Any = object()
+
+
+class _LLMCache:
+    """Response cache for question generation: in-process LRU, then Redis.
+
+    Concurrent identical requests share one in-flight call. Rule-based
+    fallback responses, and responses a caller's validate rejects, are never
+    stored. Redis is optional; when REDIS_URL is not configured only the
+    local tier is used.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self._local = SemanticCache(maxsize=maxsize, ttl_seconds=settings.llm_cache_ttl_seconds)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._redis = None
+        if settings.redis_url:
+            try:
+                import redis.asyncio as aioredis  # type: ignore
+                self._redis = aioredis.from_url(settings.redis_url, encoding="utf-8", decode_responses=True)
+            except Exception:
+                self._redis = None
+
+    async def _remote_get(self, key: str) -> Optional[str]:
+        if self._redis is None:
+            return None
+        try:
+            return await self._redis.get(f"llmq:{key}")
+        except Exception:
+            return None
+
+    async def _remote_put(self, key: str, content: str) -> None:
+        if self._redis is None:
+            return
+        try:
+            await self._redis.set(f"llmq:{key}", content, ex=settings.llm_cache_ttl_seconds)
+        except Exception:
+            pass
+
+    async def get_or_set(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[LLMResponse]],
+        validate: Optional[Callable[[str], bool]] = None
+    ) -> str:
+        """Return cached content for key, calling factory at most once per miss.
+
+        With validate, content failing it is returned to the caller but not
+        stored, and a remote entry failing it is treated as a miss.
+        """
+        while True:
+            content = self._local.get(key)
+            if content is not None:
+                return content
+            pending = self._inflight.get(key)
+            if pending is None:
+                break
+            result = await asyncio.shield(pending)
+            if result is not _RETRY:
+                return result
+            # The owning call was cancelled; take over (or join whoever did)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            content = await self._remote_get(key)
+            if content is not None and validate is not None and not validate(content):
+                content = None
+            if content is None:
+                response = await factory()
+                content = response.content
+                if response.provider != LLMProvider.FALLBACK and (validate is None or validate(content)):
+                    await self._remote_put(key, content)
+                    self._local.put(key, content)
+            else:
+                self._local.put(key, content)
+            future.set_result(content)
+            return content
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark retrieved so an unawaited failure doesn't log a warning
+            future.exception()
+            raise
+        except BaseException:
+            # Cancellation belongs to the owning task only (e.g. an evicted
+            # prefetch); coalesced waiters retry instead of being cancelled
+            future.set_result(_RETRY)
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def get(self, key: str) -> Optional[str]:
+        """Locally cached content for key, or None (fallback responses are never stored)."""
+        return self._local.get(key)
+
+    def clear(self) -> None:
+        self._local.clear()
+
+
+_RESPONSE_CACHE = _LLMCache()
+_CACHEABLE_MAX_TEMPERATURE = 0.5
+
+
+# Questions reused across near-duplicate job descriptions
+_JOB_QUESTION_CACHE = PartitionedSemanticCache(ttl_seconds=settings.llm_cache_ttl_seconds)
+# Job description embeddings, so later turns of an interview skip the call
+_JOB_EMBEDDINGS = SemanticCache(maxsize=256, ttl_seconds=settings.llm_cache_ttl_seconds)
+
+
+async def _job_embedding(job_description: str, timeout: float) -> Optional[List[float]]:
+    """Embedding of the normalised job description; None if not ready within timeout"""
+    text = " ".join(job_description.split())[:1000]
+    key = prompt_key(text)
+    embedding = _JOB_EMBEDDINGS.get(key)
+    if embedding is not None:
+        return embedding
+    try:
+        embedding = await asyncio.wait_for(embed(text), timeout)
+    except asyncio.TimeoutError:
+        return None
+    if embedding:
+        _JOB_EMBEDDINGS.put(key, embedding)
+    return embedding
+
+
 class AdvancedQuestionEngine:
     """
     Advanced question generation with industry expertise and competency focus
@@ -75,152 +514,67 @@ class AdvancedQuestionEngine:
     
     def __init__(self):
         self.llm_client = get_llm_client()
-        self.fallback_questions = self._initialize_fallback_questions()
+        self._cache = _RESPONSE_CACHE
+        self.fallback_questions = _FALLBACK_QUESTIONS
+        # Speculatively generated next questions: key -> (started_at, task)
+        self._prefetch: "OrderedDict[str, Tuple[float, asyncio.Future]]" = OrderedDict()
+        # Rotate through fallbacks so back-to-back fallbacks never repeat
+        self._fallback_cycles = {qt: itertools.cycle(qs) for qt, qs in self.fallback_questions.items() if qs}
+        self._generic_fallback_cycle = itertools.cycle(_GENERIC_FALLBACK_QUESTIONS)
+        self._probe_cycle = itertools.cycle(_FALLBACK_PROBES)
     
-    def _initialize_fallback_questions(self) -> Dict[str, List[str]]:
-        """Initialize minimal fallback questions - LLM should generate most questions"""
-        return {
-            QuestionType.TECHNICAL.value: [
-                "Kariyerinizdeki en zorlu teknik problemi nasıl çözdünüz?",
-                "Hangi teknoloji kararından en çok öğrendiniz?"
-            ],
-            QuestionType.BEHAVIORAL.value: [
-                "İş hayatınızda karşılaştığınız en zor durumu nasıl aştınız?",
-                "Takım içinde anlaşmazlık yaşadığınız bir deneyiminizi anlatır mısınız?"
-            ],
-            QuestionType.SITUATIONAL.value: [
-                "Beklenmedik bir sorunla karşılaştığınızda nasıl yaklaşırsınız?",
-                "Priorileleri nasıl belirlersiniz?"
-            ]
-        }
+    async def _generate_with_deadline(
+        self,
+        request: LLMRequest,
+        key: Optional[str] = None,
+        timeout: float = _QUESTION_TIMEOUT_SECONDS,
+        validate: Optional[Callable[[str], bool]] = None
+    ) -> str:
+        """_cached_generate bounded by timeout (_QUESTION_TIMEOUT_SECONDS by default).
+
+        The deadline only bounds this caller's wait: a slow call keeps running
+        and still fills the cache for the next request.
+        """
+        call = asyncio.ensure_future(self._cached_generate(request, key, validate))
+        call.add_done_callback(_consume_result)
+        return await asyncio.wait_for(asyncio.shield(call), timeout)
+    
+    async def _cached_generate(
+        self,
+        request: LLMRequest,
+        key: Optional[str] = None,
+        validate: Optional[Callable[[str], bool]] = None
+    ) -> str:
+        """LLM content for request via the response cache.
+
+        Sampling above _CACHEABLE_MAX_TEMPERATURE is meant to vary between
+        calls, so those requests always go to the model.
+        """
+        if request.temperature > _CACHEABLE_MAX_TEMPERATURE:
+            return (await self.llm_client.generate(request)).content
+        return await self._cache.get_or_set(
+            key or _request_key(request), lambda: self.llm_client.generate(request), validate
+        )
     
     def _detect_industry_from_job(self, job_description: str) -> IndustryType:
         """Detect industry from job description"""
-        job_lower = job_description.lower()
-        
-        if any(keyword in job_lower for keyword in ["fintech", "banking", "financial", "trading", "investment"]):
-            return IndustryType.FINANCE
-        elif any(keyword in job_lower for keyword in ["startup", "scale-up", "early stage", "seed"]):
-            return IndustryType.STARTUP
-        elif any(keyword in job_lower for keyword in ["healthcare", "medical", "hospital", "clinic"]):
-            return IndustryType.HEALTHCARE
-        elif any(keyword in job_lower for keyword in ["retail", "e-commerce", "shopping", "consumer"]):
-            return IndustryType.RETAIL
-        elif any(keyword in job_lower for keyword in ["education", "university", "school", "learning"]):
-            return IndustryType.EDUCATION
-        elif any(keyword in job_lower for keyword in ["consulting", "advisory", "strategy"]):
-            return IndustryType.CONSULTING
-        else:
-            return IndustryType.TECH  # Default to tech
+        return _industry_of(job_description.lower())
     
     def _determine_difficulty_level(self, job_description: str, resume_text: str) -> DifficultyLevel:
         """Determine appropriate difficulty level based on job and candidate profile"""
-        job_lower = job_description.lower()
-        resume_lower = resume_text.lower()
-        
-        # Check job level indicators
-        job_score = 0
-        if any(keyword in job_lower for keyword in ["senior", "lead", "principal", "architect", "director"]):
-            job_score += 2
-        elif any(keyword in job_lower for keyword in ["mid-level", "intermediate", "experienced"]):
-            job_score += 1
-        
-        # Check experience indicators in resume
-        experience_score = 0
-        if "years experience" in resume_lower or "years of experience" in resume_lower:
-            import re
-            years_match = re.search(r"(\d+)\s*(?:years?|yıl)", resume_lower)
-            if years_match:
-                years = int(years_match.group(1))
-                if years >= 8:
-                    experience_score += 2
-                elif years >= 4:
-                    experience_score += 1
-        
-        total_score = job_score + experience_score
-        
-        if total_score >= 3:
-            return DifficultyLevel.SENIOR
-        elif total_score >= 2:
-            return DifficultyLevel.MID
-        else:
-            return DifficultyLevel.JUNIOR
+        return _difficulty_of(job_description.lower(), resume_text.lower())
     
     def _extract_key_competencies(self, job_description: str) -> List[str]:
         """Extract key competencies from job description"""
-        competencies = []
-        job_lower = job_description.lower()
-        
-        # Technical competencies
-        if any(tech in job_lower for tech in ["python", "javascript", "java", "react", "node", "aws"]):
-            competencies.append("Technical Proficiency")
-        
-        if any(keyword in job_lower for keyword in ["lead", "mentor", "guide", "manage"]):
-            competencies.append("Leadership")
-        
-        if any(keyword in job_lower for keyword in ["architecture", "design", "system", "scalable"]):
-            competencies.append("System Design")
-        
-        if any(keyword in job_lower for keyword in ["problem", "solve", "troubleshoot", "debug"]):
-            competencies.append("Problem Solving")
-        
-        if any(keyword in job_lower for keyword in ["communicate", "collaborate", "team", "stakeholder"]):
-            competencies.append("Communication")
-        
-        if any(keyword in job_lower for keyword in ["agile", "scrum", "project", "delivery"]):
-            competencies.append("Project Management")
-        
-        return competencies
+        return _competencies_of(job_description.lower())
+    
+    def _analyze_job(
+        self, job_description: str, resume_text: str
+    ) -> Tuple[IndustryType, DifficultyLevel, List[str]]:
+        """Industry, difficulty and competencies (memoised per job/resume pair)"""
+        industry, difficulty, competencies = _analyze_profile(job_description, resume_text)
+        return industry, difficulty, list(competencies)
     
-    def _build_situational_prompt(
-        self, 
-        industry: IndustryType, 
-        difficulty: DifficultyLevel,
-        job_description: str,
-        competencies: List[str],
-        conversation_history: List[Dict[str, Any]]
-    ) -> str:
-        """Build job-specific situational question prompt"""
-        return f"""Sen deneyimli bir İK uzmanısın. Aşağıdaki iş tanımını analiz et ve bu pozisyonda GERÇEKTEN yaşanabilecek spesifik durumu konu alan bir soru yaz.
-
-İŞ TANIMI:
-{job_description[:3000]}
-
-GÖREV: Bu işte çalışan birinin karşılaşacağı gerçekçi bir durum sorusu oluştur.
-
-ZORUNLU KURALLAR:
-1. Soru o işin GÜNLÜK GERÇEKLİĞİNDEN alınmalı (müşteri, takım, süreç, kriz durumları)
-2. Spesifik bir durumu betimle: "Bu pozisyonda [somut durum açıklaması]. Bu durumda nasıl hareket edersiniz?"
-3. Durum o sektör ve pozisyona özel olmalı (genel değil, özel!)
-4. Hedef yetkinlik test etsin: {', '.join(competencies)}
-
-YASAKLI SORULAR:
-❌ "Hangi iletişim yöntemlerini kullanırsınız?" (çok genel)
-❌ "E-posta dışında hangi araçları tercih edersiniz?" (anlamsız)
-❌ "Takım çalışması deneyiminiz nedir?" (özgeçmiş sorusu)
-❌ "Problem çözme yaklaşımınızı anlatın" (teorik)
-
-ÖRNEK KALİTE (Pozisyona göre):
-✅ Satış Danışmanı: "Müşteri beğendiği ürünün fiyatını çok yüksek bulduğunu belirtiyor ve mağazadan çıkmak istiyor. Bu durumda nasıl yaklaşırsınız?"
-✅ İK Uzmanı: "Şirketinize yeni katılan bir çalışan ilk haftasında takım arkadaşlarıyla uyum sorunu yaşıyor ve şikayet geliyor. Bu durumda nasıl müdahale edersiniz?"
-✅ Proje Yöneticisi: "Proje deadline'ına 1 hafta kala müşteriden major değişiklik talebi geliyor. Bu durumda nasıl yönetirsiniz?"
-
-JSON FORMAT:
-{{
-  "question": "Gerçekçi durum sorusu (Türkçe, spesifik, o işe özel)",
-  "context": "Bu sorunun test ettiği yetkinlikler ve STAR bileşenleri",
-  "follow_up_questions": [
-    "Bu durumda önceliğinizi nasıl belirlerdiniz?",
-    "Sonuçtan nasıl emin olurdunuz?",
-    "Bu yaklaşımınızın risklerini nasıl yönetirdiniz?"
-  ],
-  "evaluation_rubric": {{
-    "excellent": "Somut adımlar, risk analizi, sonuç odaklı yaklaşım",
-    "good": "Temel adımları bilme, uygun yaklaşım",
-    "poor": "Belirsiz cevap, adımları bilmeme"
-  }}
-}}"""
-
     async def _generate_smart_question(
         self, 
         question_type: QuestionType, 
@@ -228,42 +582,83 @@ JSON FORMAT:
         difficulty: DifficultyLevel,
         job_description: str,
         competencies: List[str],
-        conversation_history: List[Dict[str, Any]]
+        conversation_history: List[Dict[str, Any]],
+        question_count: Optional[int] = None
     ) -> GeneratedQuestion:
         """Generate a smart question using LLM that naturally extracts STAR components"""
+        if question_count is None:
+            question_count = _assistant_turns(conversation_history)
         
-        # Build context for question generation  
-        if question_type == QuestionType.SITUATIONAL:
-            # Special job-specific situational question logic (centralized)
-            role_block = PR_ROLE_BLOCK(job_description)
-            base = situational_prompt_base(job_description=job_description, competencies=competencies)
-            prompt = base + ("\n\n" + role_block if role_block else "")
+        # Static instructions go first as the system message so the provider's
+        # prefix cache covers them; only the per-job fields vary in the user turn
+        if question_type is QuestionType.SITUATIONAL:
+            # Special job-specific situational question logic (centralized).
+            # The role block depends only on the matched role, so it extends
+            # the cached system prefix instead of the per-job user turn.
+            system_message = _situational_system_message(job_description)
+            prompt = situational_user_message(job_description=job_description, competencies=competencies)
         else:
             # Generic prompt for other question types (centralized)
-            prompt = generic_question_prompt(
+            system_message = GENERIC_QUESTION_SYSTEM
+            prompt = generic_question_user_message(
                 industry=industry.value,
                 difficulty=difficulty.value,
                 question_type=question_type.value,
                 job_description=job_description,
                 competencies=competencies,
-                conversation_len=len(conversation_history),
+                conversation_len=question_count,
             )
 
+        request = LLMRequest(
+            prompt=prompt,
+            system_message=system_message,
+            max_tokens=_QUESTION_MAX_TOKENS,
+            **_sampling(0.3, prompt),
+            response_format={"type": "json_schema", "json_schema": _QUESTION_SCHEMA}
+        )
+        key = _request_key(request)
         try:
-            response = await self.llm_client.generate(LLMRequest(
-                prompt=prompt,
-                temperature=0.3,
-                response_format={"type": "json_object"}
-            ))
-            
-            result = json.loads(response.content)
+            content = None
+            embedding = None
+            partition = ""
+            started = time.monotonic()
+            if self._cache.get(key) is None and settings.openai_api_key:
+                partition = prompt_key(
+                    f"{question_type.value}|{difficulty.value}|{industry.value}|{question_count}|"
+                    + "|".join(sorted(competencies))
+                )
+                embedding = await _job_embedding(job_description, _EMBED_TIMEOUT_SECONDS)
+                if embedding:
+                    content = _JOB_QUESTION_CACHE.get_similar(partition, embedding)
+            if content is None:
+                # The embedding lookup and the retry share one deadline, and
+                # only parseable replies are cached
+                content = await self._generate_with_deadline(
+                    request, key, _QUESTION_TIMEOUT_SECONDS - (time.monotonic() - started), _is_question_json
+                )
+                result = _parse_question_json(content)
+                remaining = _QUESTION_TIMEOUT_SECONDS - (time.monotonic() - started)
+                if result is None and content.lstrip().startswith("{") and remaining > 0:
+                    # Cut off at the token cap: retry once with more room
+                    content = await self._generate_with_deadline(
+                        dataclasses.replace(request, max_tokens=_QUESTION_RETRY_MAX_TOKENS),
+                        timeout=remaining,
+                        validate=_is_question_json
+                    )
+                    result = _parse_question_json(content)
+                if result is not None and embedding:
+                    _JOB_QUESTION_CACHE.put(partition, key, content, embedding)
+            else:
+                result = _parse_question_json(content)
+            if result is None:
+                return self._get_fallback_question(question_type, industry, difficulty, competencies)
             
             metadata = QuestionMetadata(
                 question_type=question_type,
                 difficulty=difficulty,
                 industry=industry,
                 competencies=competencies,
-                time_estimate_minutes=4 if difficulty in [DifficultyLevel.SENIOR, DifficultyLevel.LEAD] else 3
+                time_estimate_minutes=4 if difficulty is DifficultyLevel.SENIOR or difficulty is DifficultyLevel.LEAD else 3
             )
             
             return GeneratedQuestion(
@@ -289,17 +684,7 @@ JSON FORMAT:
     ) -> GeneratedQuestion:
         """Get a fallback question when LLM generation fails"""
         
-        type_questions = self.fallback_questions.get(question_type.value, [])
-        
-        if not type_questions:
-            # Generic fallback questions
-            type_questions = [
-                "Kariyerinizdeki en zorlu projeyi nasıl yönettiniz?",
-                "Takım içinde çatışma yaşadığınız bir durumu nasıl çözdünüz?",
-                "Başarısız olduğunuz bir deneyimden ne öğrendiniz?"
-            ]
-        
-        question = random.choice(type_questions)
+        question = next(self._fallback_cycles.get(question_type, self._generic_fallback_cycle))
         
         metadata = QuestionMetadata(
             question_type=question_type,
@@ -312,17 +697,8 @@ JSON FORMAT:
             question=question,
             context=f"Bu soru {question_type.value} değerlendirmesi için tasarlandı",
             metadata=metadata,
-            follow_up_questions=[
-                "Bu durumda farklı ne yapabilirdiniz?",
-                "Sonuçları nasıl ölçtünüz?",
-                "Bu deneyimden hangi dersleri çıkardınız?",
-                "Benzer durumda ne farklı yaparsınız?"
-            ],
-            evaluation_rubric={
-                "excellent": "Detaylı, yapılandırılmış, öz-farkındalık içeren cevap",
-                "good": "Net örnek, öğrenme çıkarımları mevcut",
-                "poor": "Belirsiz, sorumluluğu üstlenmeyen, yüzeysel cevap"
-            }
+            follow_up_questions=list(_FALLBACK_FOLLOW_UPS),
+            evaluation_rubric=dict(_FALLBACK_RUBRIC)
         )
     
     async def generate_strategic_question(
@@ -330,47 +706,135 @@ JSON FORMAT:
         job_description: str,
         resume_text: str = "",
         conversation_history: Optional[List[Dict[str, Any]]] = None,
-        focus_competency: Optional[str] = None
+        focus_competency: Optional[str] = None,
+        assistant_turn_count: Optional[int] = None,
+        prefetch_next: bool = False
     ) -> GeneratedQuestion:
         """
         Generate strategic, high-quality interview question that naturally extracts STAR components
+
+        Callers that already track how many questions were asked can pass
+        assistant_turn_count to skip rescanning conversation_history. With
+        prefetch_next, the following turn's question is generated in the
+        background while the candidate answers; the next call for that turn
+        picks it up instead of waiting on the LLM.
         """
         if conversation_history is None:
             conversation_history = []
         
+        # Determine optimal question type based on conversation flow
+        question_count = assistant_turn_count
+        if question_count is None:
+            question_count = _assistant_turns(conversation_history)
+        
+        question = await self._take_prefetched(job_description, resume_text, question_count, focus_competency)
+        if question is None:
+            question = await self._strategic_question(
+                job_description, resume_text, question_count, focus_competency
+            )
+        if prefetch_next:
+            self._start_prefetch(job_description, resume_text, question_count + 1, focus_competency)
+        return question
+    
+    async def _strategic_question(
+        self,
+        job_description: str,
+        resume_text: str,
+        question_count: int,
+        focus_competency: Optional[str] = None
+    ) -> GeneratedQuestion:
         # Analyze context
-        industry = self._detect_industry_from_job(job_description)
-        difficulty = self._determine_difficulty_level(job_description, resume_text)
-        competencies = self._extract_key_competencies(job_description)
+        industry, difficulty, competencies = self._analyze_job(job_description, resume_text)
         
         if focus_competency:
             competencies = [focus_competency] + competencies
         
-        # Determine optimal question type based on conversation flow
-        question_count = len([msg for msg in conversation_history if msg.get("role") == "assistant"])
-        
-        if question_count == 0:
-            # Opening question - usually behavioral
-            question_type = QuestionType.BEHAVIORAL
-        elif question_count <= 2:
-            # Early questions - mix of technical and competency
-            question_type = random.choice([QuestionType.TECHNICAL, QuestionType.COMPETENCY])
-        elif question_count <= 4:
-            # Middle questions - situational and problem solving
-            question_type = random.choice([QuestionType.SITUATIONAL, QuestionType.PROBLEM_SOLVING])
-        else:
-            # Later questions - culture fit and leadership
-            question_type = random.choice([QuestionType.CULTURE_FIT, QuestionType.LEADERSHIP])
-        
         return await self._generate_smart_question(
-            question_type=question_type,
+            question_type=_question_type_for(question_count),
             industry=industry,
             difficulty=difficulty,
             job_description=job_description,
             competencies=competencies,
-            conversation_history=conversation_history
+            conversation_history=[],
+            question_count=question_count
         )
     
+    def _start_prefetch(
+        self,
+        job_description: str,
+        resume_text: str,
+        question_count: int,
+        focus_competency: Optional[str]
+    ) -> None:
+        # Keyed like _take_prefetched: a turn asking for a different focus
+        # misses and generates fresh rather than reusing the wrong question
+        key = _prefetch_key(job_description, resume_text, question_count, focus_competency)
+        if key in self._prefetch:
+            return
+        task = asyncio.ensure_future(
+            self._strategic_question(job_description, resume_text, question_count, focus_competency)
+        )
+        task.add_done_callback(_consume_result)
+        self._prefetch[key] = (time.monotonic(), task)
+        while len(self._prefetch) > _PREFETCH_MAX:
+            _, (_, stale) = self._prefetch.popitem(last=False)
+            stale.cancel()
+    
+    async def _take_prefetched(
+        self,
+        job_description: str,
+        resume_text: str,
+        question_count: int,
+        focus_competency: Optional[str]
+    ) -> Optional[GeneratedQuestion]:
+        entry = self._prefetch.pop(_prefetch_key(job_description, resume_text, question_count, focus_competency), None)
+        if entry is None:
+            return None
+        started, task = entry
+        if time.monotonic() - started > _PREFETCH_TTL_SECONDS or task.cancelled():
+            task.cancel()
+            return None
+        try:
+            return await task
+        except Exception:
+            return None
+    
+    async def generate_question_batch(
+        self,
+        job_description: str,
+        resume_text: str = "",
+        n_questions: int = 8,
+        focus_competencies: Optional[List[str]] = None,
+        start_turn: int = 0
+    ) -> List[GeneratedQuestion]:
+        """
+        Generate a question bank for a job concurrently (e.g. to pre-warm a session).
+
+        Question types follow the same per-turn plan as generate_strategic_question,
+        starting at start_turn; concurrent LLM calls are capped by
+        OPENAI_MAX_CONCURRENCY.
+        """
+        industry, difficulty, competencies = self._analyze_job(job_description, resume_text)
+        sem = asyncio.Semaphore(settings.openai_max_concurrency)
+
+        async def _one(index: int) -> GeneratedQuestion:
+            focus = competencies
+            if focus_competencies and index < len(focus_competencies) and focus_competencies[index]:
+                focus = [focus_competencies[index]] + competencies
+            turn = start_turn + index
+            async with sem:
+                return await self._generate_smart_question(
+                    question_type=_question_type_for(turn),
+                    industry=industry,
+                    difficulty=difficulty,
+                    job_description=job_description,
+                    competencies=focus,
+                    conversation_history=[],
+                    question_count=turn
+                )
+
+        return list(await asyncio.gather(*(_one(i) for i in range(n_questions))))
+    
     async def generate_follow_up_question(
         self,
         original_question: str,
@@ -402,25 +866,20 @@ FOLLOW-UP SORU KRİTERLERİ:
 
 Sadece follow-up sorusunu dön, başka açıklama yapma."""
 
+        request = LLMRequest(
+            prompt=prompt,
+            max_tokens=150,
+            **_sampling(0.4, prompt)
+        )
         try:
-            response = await self.llm_client.generate(LLMRequest(
-                prompt=prompt,
-                temperature=0.4,
-                max_tokens=150
-            ))
-            
-            return response.content.strip()
+            # Exact-prompt cache only: a near-duplicate answer may come from another
+            # candidate, and the follow-up can quote what they said
+            content = await self._cached_generate(request)
+            return content.strip()
             
         except Exception:
             # Fallback follow-up questions that naturally probe STAR components
-            fallbacks = [
-                "Bu durumda farklı ne yapabilirdiniz?",
-                "Sonuçları nasıl ölçtünüz?",
-                "Bu deneyimden hangi dersleri çıkardınız?",
-                "Benzer bir durumla tekrar karşılaştığınızda ne yaparsınız?",
-                "Bu süreçte en zorlu kısım neydi ve nasıl aştınız?"
-            ]
-            return random.choice(fallbacks)
+            return next(self._probe_cycle)
     
     def get_question_analytics(self, questions: List[GeneratedQuestion]) -> Dict[str, Any]:
         """Analyze generated questions for quality metrics"""
@@ -428,37 +887,37 @@ Sadece follow-up sorusunu dön, başka açıklama yapma."""
         if not questions:
             return {}
         
-        types_distribution = {}
-        difficulty_distribution = {}
-        industry_distribution = {}
+        types_distribution: Counter = Counter()
+        difficulty_distribution: Counter = Counter()
+        industry_distribution: Counter = Counter()
+        competency_coverage: set = set()
+        total_time = 0
         
         for q in questions:
-            # Type distribution
-            q_type = q.metadata.question_type.value
-            types_distribution[q_type] = types_distribution.get(q_type, 0) + 1
-            
-            # Difficulty distribution  
-            difficulty = q.metadata.difficulty.value
-            difficulty_distribution[difficulty] = difficulty_distribution.get(difficulty, 0) + 1
-            
-            # Industry distribution
-            if q.metadata.industry:
-                industry = q.metadata.industry.value
-                industry_distribution[industry] = industry_distribution.get(industry, 0) + 1
+            metadata = q.metadata
+            types_distribution[metadata.question_type] += 1
+            difficulty_distribution[metadata.difficulty] += 1
+            if metadata.industry:
+                industry_distribution[metadata.industry] += 1
+            competency_coverage.update(metadata.competencies)
+            total_time += metadata.time_estimate_minutes
         
         return {
             "total_questions": len(questions),
-            "type_distribution": types_distribution,
-            "difficulty_distribution": difficulty_distribution,
-            "industry_distribution": industry_distribution,
-            "avg_estimated_time": sum(q.metadata.time_estimate_minutes for q in questions) / len(questions),
-            "competency_coverage": list(set(
-                comp for q in questions for comp in q.metadata.competencies
-            ))
+            "type_distribution": {k.value: n for k, n in types_distribution.items()},
+            "difficulty_distribution": {k.value: n for k, n in difficulty_distribution.items()},
+            "industry_distribution": {k.value: n for k, n in industry_distribution.items()},
+            "avg_estimated_time": total_time / len(questions),
+            "competency_coverage": list(competency_coverage)
         }
 
 
 # Factory function
+@functools.lru_cache(maxsize=1)
 def create_advanced_question_engine() -> AdvancedQuestionEngine:
-    """Create AdvancedQuestionEngine instance"""
+    """Shared AdvancedQuestionEngine instance.
+
+    Its LLM cache and pending prefetches are process-wide and keyed by job,
+    resume, turn and focus, so concurrent interviews can share one engine.
+    """
     return AdvancedQuestionEngine()
\ No newline at end of file
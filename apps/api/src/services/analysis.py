@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import re
 from typing import List, Tuple, Dict, Any
+
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from src.db.models.interview import Interview
 from src.services.nlp import extract_cv_facts
 from src.db.models.job import Job
@@ -11,6 +16,45 @@ from src.db.models.conversation import ConversationMessage, InterviewAnalysis
 from src.db.models.interview import Interview
 
 
+# Keyword screens for the rule-based analysis (matched as substrings of lowercased answers)
+_FILLER_WORDS = ("şey", "hani", "yani", "ıı", "ee")
+_TECH_KEYWORDS = ("api", "database", "microservice", "docker", "aws")
+_CULTURE_KEYWORDS = ("takım", "iletişim", "liderlik", "uyum")
+
+# Most recent per-turn evidence items kept in technical_assessment
+_TURN_EVIDENCE_MAX = 200
+
+
+# Job-description tokenizer and stopwords for dialog-plan topics
+_JOB_TOKEN_SPLIT_RE = re.compile(r"[^a-zA-ZçğıöşüÇĞİÖŞÜ0-9+.#]+")
+_JOB_TOPIC_STOPWORDS = frozenset({
+    "ve","ile","için","gibi","olan","olarak","çok","az","bir","bu","şu","the","and","for","with","our","your",
+    "çalışma","ekip","takım","deneyim","deneyimi","sorumluluk","sorumluluklar","görev","pozisyon","çalışacak"
+})
+
+
+def _job_topics(text: str, max_items: int = 6) -> list[str]:
+    """Simple topic extraction from a job description: first unique non-stopword tokens."""
+    uniq: list[str] = []
+    seen: set[str] = set()
+    for t in _JOB_TOKEN_SPLIT_RE.split(text or ""):
+        if len(t) < 3:
+            continue
+        t = t.lower()
+        if t in _JOB_TOPIC_STOPWORDS or t in seen:
+            continue
+        seen.add(t)
+        uniq.append(t)
+        if len(uniq) >= max_items:
+            break
+    return uniq
+
+
+def _dumps(obj: Any) -> str:
+    """Encode a technical_assessment blob (orjson emits UTF-8, i.e. ensure_ascii=False)."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 async def generate_rule_based_analysis(session: AsyncSession, interview_id: int) -> InterviewAnalysis:
     """
     Generate a lightweight, rule-based analysis from conversation messages.
@@ -23,20 +67,28 @@ async def generate_rule_based_analysis(session: AsyncSession, interview_id: int)
     )
     messages: List[ConversationMessage] = list(result.scalars().all())
 
-    # Pull job description for context
-    job_desc = ""
-    job = (
+    # Job description and resume in one round-trip (LEFT OUTER JOINs on the
+    # single interview row; messages stay a separate query so the large text
+    # columns are not repeated per message)
+    from src.db.models.candidate_profile import CandidateProfile
+    context_row = (
         await session.execute(
-            select(Job)
-            .join(Interview, Interview.job_id == Job.id)
+            select(Job.description, CandidateProfile.resume_text)
+            .select_from(Interview)
+            .outerjoin(Job, Job.id == Interview.job_id)
+            .outerjoin(CandidateProfile, CandidateProfile.candidate_id == Interview.candidate_id)
             .where(Interview.id == interview_id)
         )
-    ).scalar_one_or_none()
-    if job and job.description:
-        job_desc = job.description
+    ).one_or_none()
+    job_desc, resume_text = context_row if context_row else (None, None)
+    job_desc = job_desc or ""
 
     # Initialize variables to avoid unbound warnings in later usage
+    question_count = 0
+    answer_count = 0
+    avg_user_len = 0.0
     filler_count = 0
+    found_keywords: set[str] = set()
     avg_ans_latency = None
     avg_q_gap = None
 
@@ -49,29 +101,57 @@ async def generate_rule_based_analysis(session: AsyncSession, interview_id: int)
         tech = 0.0
         culture = 0.0
     else:
-        assistant_msgs = [m for m in messages if m.role.value == "assistant"]
-        user_msgs = [m for m in messages if m.role.value == "user"]
+        # Single pass: lowercase/split each answer once and derive every aggregate from it
+        total_user_words = 0
+        tech_answers = 0
+        culture_answers = 0
+        first_q = ""
+        last_a = ""
+        q_times = []
+        # Answer latency pairs each question with the next answer after it;
+        # questions asked back-to-back wait here until that answer arrives
+        unanswered_q_times = []
+        ans_latencies: List[float] = []
+        for m in messages:
+            role = m.role.value
+            if role == "assistant":
+                if not question_count:
+                    first_q = m.content
+                question_count += 1
+                if m.timestamp:
+                    q_times.append(m.timestamp)
+                    unanswered_q_times.append(m.timestamp)
+            elif role == "user":
+                answer_count += 1
+                last_a = m.content
+                if m.timestamp:
+                    for asked_at in unanswered_q_times:
+                        delta = (m.timestamp - asked_at).total_seconds()
+                        if 0 <= delta <= 3600 * 3:
+                            ans_latencies.append(delta)
+                unanswered_q_times.clear()
+                lc = m.content.lower()
+                total_user_words += len(m.content.split())
+                filler_count += sum(1 for w in _FILLER_WORDS if w in lc)
+                tech_hits = {k for k in _TECH_KEYWORDS if k in lc}
+                culture_hits = {k for k in _CULTURE_KEYWORDS if k in lc}
+                tech_answers += bool(tech_hits)
+                culture_answers += bool(culture_hits)
+                found_keywords |= tech_hits | culture_hits
 
         # Simple heuristics
-        total_user_words = sum(len(m.content.split()) for m in user_msgs)
-        avg_user_len = total_user_words / max(1, len(user_msgs))
-        filler_words = ["şey", "hani", "yani", "ıı", "ee"]
-        filler_count = sum(sum(1 for w in filler_words if w in m.content.lower()) for m in user_msgs)
+        avg_user_len = total_user_words / max(1, answer_count)
 
         # Scores (0-100)
         communication_score = max(0.0, min(100.0, 60.0 + (avg_user_len * 2) - (filler_count * 5)))
-        _tech_kws = ["api", "database", "microservice", "docker", "aws"]
-        _culture_kws = ["takım", "iletişim", "liderlik", "uyum"]
-        technical_score = 50.0 + min(30.0, len([m for m in user_msgs if any(k in m.content.lower() for k in _tech_kws)]) * 10.0)
-        cultural_fit_score = 50.0 + min(30.0, len([m for m in user_msgs if any(k in m.content.lower() for k in _culture_kws)]) * 10.0)
+        technical_score = 50.0 + min(30.0, tech_answers * 10.0)
+        cultural_fit_score = 50.0 + min(30.0, culture_answers * 10.0)
         # Simple unweighted overall (average of available dimensions)
         overall = round((communication_score + technical_score + cultural_fit_score) / 3.0, 2)
 
         # Summary
-        first_q = assistant_msgs[0].content if assistant_msgs else ""
-        last_a = user_msgs[-1].content if user_msgs else ""
         summary = (
-            f"Interview contained {len(assistant_msgs)} questions and {len(user_msgs)} answers. "
+            f"Interview contained {question_count} questions and {answer_count} answers. "
             f"Average answer length was {avg_user_len:.1f} words. "
             f"Sample Q: '{first_q[:120]}...' Sample A: '{last_a[:120]}...'"
         )
@@ -100,98 +180,33 @@ async def generate_rule_based_analysis(session: AsyncSession, interview_id: int)
         tech = round(technical_score, 2)
         culture = round(cultural_fit_score, 2)
 
-        # Timing metrics (average seconds)
-        try:
-            from datetime import timedelta
-            ans_latencies: List[float] = []
-            for idx, m in enumerate(messages):
-                if m.role.value != "assistant":
-                    continue
-                # Find next user message after this assistant message
-                for j in range(idx + 1, len(messages)):
-                    mj = messages[j]
-                    if mj.role.value == "user":
-                        delta = (mj.timestamp - m.timestamp).total_seconds() if mj.timestamp and m.timestamp else None
-                        if isinstance(delta, (int, float)) and 0 <= delta <= 3600 * 3:
-                            ans_latencies.append(float(delta))
-                        break
-            q_times = [m.timestamp for m in messages if m.role.value == "assistant" and m.timestamp]
-            q_gaps: List[float] = []
-            for a, b in zip(q_times, q_times[1:]):
-                try:
-                    d = (b - a).total_seconds()
-                    if isinstance(d, (int, float)) and 0 <= d <= 3600 * 6:
-                        q_gaps.append(float(d))
-                except Exception:
-                    pass
-            avg_ans_latency = round(sum(ans_latencies) / len(ans_latencies), 1) if ans_latencies else None
-            avg_q_gap = round(sum(q_gaps) / len(q_gaps), 1) if q_gaps else None
-        except Exception:
-            avg_ans_latency = None
-            avg_q_gap = None
+        # Timing metrics (average seconds); q_times only holds set timestamps
+        q_gaps = [
+            d for a, b in zip(q_times, q_times[1:])
+            for d in ((b - a).total_seconds(),)
+            if 0 <= d <= 3600 * 6
+        ]
+        avg_ans_latency = round(sum(ans_latencies) / len(ans_latencies), 1) if ans_latencies else None
+        avg_q_gap = round(sum(q_gaps) / len(q_gaps), 1) if q_gaps else None
 
         # Removed requirements coverage
 
-    # Upsert analysis
-    existing = (
-        await session.execute(
-            select(InterviewAnalysis).where(InterviewAnalysis.interview_id == interview_id)
-        )
-    ).scalar_one_or_none()
-
     # Prepare competency JSON for technical_assessment
     cv_facts = {}
     try:
         # Try to include CV facts like military status for reliability in the report
-        from src.db.models.candidate import Candidate
-        from src.db.models.candidate_profile import CandidateProfile
-        cand = (
-            await session.execute(select(Candidate).join(Interview, Interview.candidate_id == Candidate.id).where(Interview.id == interview_id))
-        ).scalar_one_or_none()
-        if cand:
-            prof = (
-                await session.execute(select(CandidateProfile).where(CandidateProfile.candidate_id == cand.id))
-            ).scalar_one_or_none()
-            if prof and getattr(prof, "resume_text", None):
-                # Optionally extract facts only when text exists (gender-neutral; no display unless required)
-                cv_facts = await extract_cv_facts(prof.resume_text or "")
+        if resume_text:
+            # Optionally extract facts only when text exists (gender-neutral; no display unless required)
+            cv_facts = await extract_cv_facts(resume_text)
     except Exception:
         cv_facts = {}
     # Build meta stats for UI
     meta = {
-        "question_count": len([m for m in messages if m.role.value == "assistant"]),
-        "answer_count": len([m for m in messages if m.role.value == "user"]),
-        "avg_answer_length_words": round(
-            (
-                sum(len(m.content.split()) for m in messages if m.role.value == "user")
-                / max(1, len([m for m in messages if m.role.value == "user"]))
-            ),
-            1,
-        ),
+        "question_count": question_count,
+        "answer_count": answer_count,
+        "avg_answer_length_words": round(avg_user_len, 1),
         "filler_word_count": filler_count,
-        "top_keywords": sorted(
-            list(
-                {
-                    k
-                    for m in (messages or [])
-                    if m.role.value == "user"
-                    for k in (
-                        [
-                            "api",
-                            "database",
-                            "microservice",
-                            "docker",
-                            "aws",
-                            "takım",
-                            "iletişim",
-                            "liderlik",
-                            "uyum",
-                        ]
-                    )
-                    if k in m.content.lower()
-                }
-            )
-        ),
+        "top_keywords": sorted(found_keywords),
         "avg_answer_latency_seconds": avg_ans_latency,
         "avg_inter_question_gap_seconds": avg_q_gap,
     }
@@ -199,43 +214,35 @@ async def generate_rule_based_analysis(session: AsyncSession, interview_id: int)
     if cv_facts:
         competency_json["cv_facts"] = cv_facts
 
-    if existing:
-        existing.overall_score = overall
-        existing.summary = summary
-        existing.strengths = strengths
-        existing.weaknesses = weaknesses
-        existing.communication_score = comm
-        existing.technical_score = tech
-        existing.cultural_fit_score = culture
-        try:
-            import json
-            existing.technical_assessment = json.dumps(competency_json, ensure_ascii=False)
-        except Exception:
-            pass
-        await session.commit()
-        await session.refresh(existing)
-        return existing
-    else:
-        analysis = InterviewAnalysis(
-            interview_id=interview_id,
-            overall_score=overall,
-            summary=summary,
-            strengths=strengths,
-            weaknesses=weaknesses,
-            communication_score=comm,
-            technical_score=tech,
-            cultural_fit_score=culture,
-            model_used="rule-based-v1",
+    # Upsert in a single INSERT ... ON CONFLICT (interview_id is unique);
+    # model_used is only set on insert, as before
+    values: Dict[str, Any] = {
+        "overall_score": overall,
+        "summary": summary,
+        "strengths": strengths,
+        "weaknesses": weaknesses,
+        "communication_score": comm,
+        "technical_score": tech,
+        "cultural_fit_score": culture,
+    }
+    try:
+        values["technical_assessment"] = _dumps(competency_json)
+    except Exception:
+        pass
+    stmt = (
+        pg_insert(InterviewAnalysis)
+        .values(interview_id=interview_id, model_used="rule-based-v1", **values)
+        .on_conflict_do_update(
+            index_elements=[InterviewAnalysis.interview_id],
+            set_={**values, "updated_at": func.now()},
         )
-        try:
-            import json
-            analysis.technical_assessment = json.dumps(competency_json, ensure_ascii=False)
-        except Exception:
-            pass
-        session.add(analysis)
-        await session.commit()
-        await session.refresh(analysis)
-        return analysis
+        .returning(InterviewAnalysis)
+    )
+    analysis = (
+        await session.execute(stmt, execution_options={"populate_existing": True})
+    ).scalar_one()
+    await session.commit()
+    return analysis
 
 
 async def merge_enrichment_into_analysis(
@@ -255,11 +262,10 @@ async def merge_enrichment_into_analysis(
     if not analysis:
         analysis = await generate_rule_based_analysis(session, interview_id)
 
-    import json
     blob = {}
     try:
         if analysis.technical_assessment:
-            blob = json.loads(analysis.technical_assessment)
+            blob = orjson.loads(analysis.technical_assessment)
     except Exception:
         blob = {}
     # Merge keys conservatively; accept broader set used across the pipeline
@@ -273,9 +279,12 @@ async def merge_enrichment_into_analysis(
         "job_fit",
         "ai_opinion",
     )
+    # Re-encode only when the merge actually changes the blob
+    changed = False
     for k in mergeable_scalar_keys:
-        if k in enrichment and enrichment[k]:
+        if k in enrichment and enrichment[k] and blob.get(k) != enrichment[k]:
             blob[k] = enrichment[k]
+            changed = True
 
     # Turn-level evidence: append to a list for chronological inspection
     if "turn_evidence" in enrichment and enrichment["turn_evidence"]:
@@ -286,14 +295,18 @@ async def merge_enrichment_into_analysis(
             # Normalize single item vs list
             incoming = enrichment["turn_evidence"]
             if isinstance(incoming, list):
-                existing_list.extend([it for it in incoming if it])
+                existing_list.extend(it for it in incoming if it)
             else:
                 existing_list.append(incoming)
-            blob["turn_evidence"] = existing_list[-200:]  # cap to last N to avoid unbounded growth
+            # Cap to last N in place to avoid unbounded growth
+            del existing_list[:-_TURN_EVIDENCE_MAX]
+            blob["turn_evidence"] = existing_list
+            changed = True
         except Exception:
             # If anything goes wrong, skip silently to avoid blocking analysis merge
             pass
-    analysis.technical_assessment = json.dumps(blob, ensure_ascii=False)
+    if changed:
+        analysis.technical_assessment = _dumps(blob)
     await session.commit()
     await session.refresh(analysis)
     return analysis
@@ -377,15 +390,10 @@ async def generate_comprehensive_interview_analysis(session: AsyncSession, inter
             j = (
                 await session.execute(select(_Job).where(_Job.id == context.job_id))
             ).scalar_one_or_none()
-            import json as _json
             if j:
-                rubric_json = getattr(j, "rubric_json", None)
-                if isinstance(rubric_json, str) and rubric_json.strip():
-                    try:
-                        cfg = _json.loads(rubric_json)
-                    except Exception:
-                        cfg = {}
-                    items = cfg.get("criteria") if isinstance(cfg, dict) else None
+                cfg = getattr(j, "rubric_json", None)
+                if isinstance(cfg, dict) and cfg:
+                    items = cfg.get("criteria")
                     if isinstance(items, list) and items:
                         # Map labels to buckets
                         label_map = {"problem": ["problem"], "technical": ["teknik"], "communication": ["iletişim"], "culture": ["kültür"]}
@@ -433,8 +441,6 @@ async def generate_comprehensive_interview_analysis(session: AsyncSession, inter
         )
     ).scalar_one_or_none()
     
-    import json
-    
     if existing:
         existing.overall_score = overall_score
         existing.summary = summary or existing.summary
@@ -445,13 +451,13 @@ async def generate_comprehensive_interview_analysis(session: AsyncSession, inter
             base = {}
             if existing.technical_assessment:
                 try:
-                    base = json.loads(existing.technical_assessment)
+                    base = orjson.loads(existing.technical_assessment)
                 except Exception:
                     base = {}
             base.update(analysis_results)
-            existing.technical_assessment = json.dumps(base, ensure_ascii=False)
+            existing.technical_assessment = _dumps(base)
         except Exception:
-            existing.technical_assessment = json.dumps(analysis_results, ensure_ascii=False)
+            existing.technical_assessment = _dumps(analysis_results)
     else:
         analysis = InterviewAnalysis(
             interview_id=interview_id,
@@ -465,7 +471,7 @@ async def generate_comprehensive_interview_analysis(session: AsyncSession, inter
             model_used="comprehensive-v1",
         )
         try:
-            analysis.technical_assessment = json.dumps(analysis_results, ensure_ascii=False)
+            analysis.technical_assessment = _dumps(analysis_results)
         except Exception:
             pass
         session.add(analysis)
@@ -514,130 +520,108 @@ async def precompute_dialog_plan(session: AsyncSession, interview_id: int) -> di
     from src.db.models.candidate_profile import CandidateProfile
     from src.services.nlp import extract_resume_spotlights, make_targeted_question_from_spotlight, extract_requirements_spec
 
-    interview = (
-        await session.execute(_select(Interview).where(Interview.id == interview_id))
-    ).scalar_one_or_none()
-    if not interview:
+    # Interview, job, candidate, resume and company name in one round-trip
+    from src.db.models.user import User
+    row = (
+        await session.execute(
+            _select(Interview, Job.description, Candidate.name, CandidateProfile.resume_text, User.company_name)
+            .outerjoin(Job, Job.id == Interview.job_id)
+            .outerjoin(User, User.id == Job.user_id)
+            .outerjoin(Candidate, Candidate.id == Interview.candidate_id)
+            .outerjoin(CandidateProfile, CandidateProfile.candidate_id == Interview.candidate_id)
+            .where(Interview.id == interview_id)
+        )
+    ).one_or_none()
+    if not row:
         return {}
-
-    job = (
-        await session.execute(_select(Job).where(Job.id == interview.job_id))
-    ).scalar_one_or_none()
-    job_desc = (getattr(job, "description", None) or "").strip()
-
-    resume_text = ""
-    cand = None
-    try:
-        cand = (
-            await session.execute(_select(Candidate).where(Candidate.id == interview.candidate_id))
-        ).scalar_one_or_none()
-        if cand:
-            profile = (
-                await session.execute(_select(CandidateProfile).where(CandidateProfile.candidate_id == cand.id))
-            ).scalar_one_or_none()
-            if profile and profile.resume_text:
-                resume_text = profile.resume_text
-    except Exception:
-        resume_text = ""
-
-    # Simple topic extraction from job description
-    def _job_topics(text: str, max_items: int = 6) -> list[str]:
-        import re as _re
-        toks = [t.lower() for t in _re.split(r"[^a-zA-ZçğıöşüÇĞİÖŞÜ0-9\\+\\.#]+", text or "") if len(t) >= 3]
-        stop = {
-            "ve","ile","için","gibi","olan","olarak","çok","az","ile","bir","bu","şu","the","and","for","with","and","our","your",
-            "çalışma","ekip","takım","deneyim","deneyimi","sorumluluk","sorumluluklar","görev","pozisyon","çalışacak"
-        }
-        uniq: list[str] = []
-        seen: set[str] = set()
-        for t in toks:
-            if t in stop:
-                continue
-            if t in seen:
-                continue
-            seen.add(t)
-            uniq.append(t)
-            if len(uniq) >= max_items:
-                break
-        return uniq
+    interview, job_desc, candidate_name, resume_text, owner_company = row
+    job_desc = (job_desc or "").strip()
+    resume_text = resume_text or ""
 
     topics = _job_topics(job_desc)
-    # Extract normalized requirements spec from job description (best-effort)
-    try:
-        req_spec = await extract_requirements_spec(job_desc)
-    except Exception:
-        req_spec = {"items": []}
     spotlights = extract_resume_spotlights(resume_text, max_items=3) if resume_text else []
     targeted = [make_targeted_question_from_spotlight(s) for s in spotlights]
     first_seed = None
     if topics:
         first_seed = f"Öncelikle {topics[0]} ile ilgili somut bir örneğinizi STAR (Durum, Görev, Eylem, Sonuç) çerçevesinde paylaşır mısınız?"
 
-    # Build a 10-question pool guided by TR market context (best-effort)
-    question_pool: list[dict] = []
-    try:
-        from src.services.llm_client import generate_json as _gen_json
-        prompt = (
-            "Aşağıdaki iş ilanı ve özgeçmiş bilgilerine göre Türk iş piyasası beklentilerini de dikkate alarak "
-            "10-15 açık uçlu mülâkat sorusu üret. Sorular doğal, ölçülebilir sonuç (STAR) çıkarmaya yönelik olsun.\n\n"
-            "KATEGORİLER: Tanışma, Teknik, Davranışsal, Kültürel, Liderlik.\n"
-            "Her madde için JSON nesnesi döndür:\n"
-            "{\"question\":str, \"section\":str, \"type\":\"situational|behavioral|technical|culture_fit|leadership\", \"difficulty\":\"low|medium|high\", \"scenario\":str, \"constraints\":[str], \"skills\":[str], \"tags\":[str], \"follow_ups\":[str]}\n"
-            "Kurallar: Sorular soyut olmasın; her zaman kısa, gerçekçi bir durum (scenario) içersin. Senaryo kısıt/aktarılabilir metrik (SLA, bütçe, süre, ekip boyutu, müşteri etkisi) içersin.\n"
-            "Her ana soruya 3-5 kısa follow-up ekle (boşlukları kapatacak, STAR'ı tamamlayacak).\n\n"
-            "İş İlanı:\n" + (job_desc or "-")[:5000] + "\n\n"
-            "Özgeçmiş (metin):\n" + (resume_text or "-")[:5000] + "\n\n"
-            "Not: Sorular adayı rahatlatan doğal bir tonda olsun; teknik jargonu abartma."
-        )
-        pool_obj = await _gen_json(prompt, temperature=0.25)
-        # Accept either {items:[...]}, or a direct list
-        items_obj = []
+    # Extract normalized requirements spec from job description (best-effort)
+    async def _requirements_spec() -> dict:
         try:
-            if isinstance(pool_obj, dict) and isinstance(pool_obj.get("items"), list):
-                items_obj = pool_obj.get("items")  # type: ignore[assignment]
-            elif isinstance(pool_obj, list):
-                items_obj = pool_obj  # type: ignore[assignment]
+            return await extract_requirements_spec(job_desc)
         except Exception:
+            return {"items": []}
+
+    # Build a 10-question pool guided by TR market context (best-effort)
+    async def _llm_question_pool() -> list[dict]:
+        question_pool: list[dict] = []
+        try:
+            from src.services.llm_client import generate_json as _gen_json
+            prompt = (
+                "Aşağıdaki iş ilanı ve özgeçmiş bilgilerine göre Türk iş piyasası beklentilerini de dikkate alarak "
+                "10-15 açık uçlu mülâkat sorusu üret. Sorular doğal, ölçülebilir sonuç (STAR) çıkarmaya yönelik olsun.\n\n"
+                "KATEGORİLER: Tanışma, Teknik, Davranışsal, Kültürel, Liderlik.\n"
+                "Her madde için JSON nesnesi döndür:\n"
+                "{\"question\":str, \"section\":str, \"type\":\"situational|behavioral|technical|culture_fit|leadership\", \"difficulty\":\"low|medium|high\", \"scenario\":str, \"constraints\":[str], \"skills\":[str], \"tags\":[str], \"follow_ups\":[str]}\n"
+                "Kurallar: Sorular soyut olmasın; her zaman kısa, gerçekçi bir durum (scenario) içersin. Senaryo kısıt/aktarılabilir metrik (SLA, bütçe, süre, ekip boyutu, müşteri etkisi) içersin.\n"
+                "Her ana soruya 3-5 kısa follow-up ekle (boşlukları kapatacak, STAR'ı tamamlayacak).\n\n"
+                "İş İlanı:\n" + (job_desc or "-")[:5000] + "\n\n"
+                "Özgeçmiş (metin):\n" + (resume_text or "-")[:5000] + "\n\n"
+                "Not: Sorular adayı rahatlatan doğal bir tonda olsun; teknik jargonu abartma."
+            )
+            pool_obj = await _gen_json(prompt, temperature=0.25)
+            # Accept either {items:[...]}, or a direct list
             items_obj = []
-        if not isinstance(items_obj, list):
-            items_obj = []
-        # Normalize
-        for it in items_obj:
-            if not isinstance(it, dict):
-                continue
-            q = str(it.get("question", "")).strip()
-            if not q:
-                continue
-            section = str(it.get("section", "")).strip() or "Genel"
-            qtype = str(it.get("type", "")).strip() or ""
-            diff = str(it.get("difficulty", "")).strip().lower() or "medium"
-            scenario = str(it.get("scenario", "")).strip()
-            constraints = [str(c).strip() for c in (it.get("constraints") or []) if str(c).strip()]
-            skills = [str(s).strip() for s in (it.get("skills") or []) if str(s).strip()]
-            tags = [str(s).strip() for s in (it.get("tags") or []) if str(s).strip()]
-            fups_raw = it.get("follow_ups") or []
-            follow_ups = [str(f).strip() for f in fups_raw if isinstance(f, (str,)) and str(f).strip()]
-            # Fallback follow-ups enforcing STAR completion
-            if not follow_ups:
-                follow_ups = [
-                    "Bu örnekte durum ve bağlam neydi?",
-                    "Göreviniz tam olarak neydi?",
-                    "Hangi eylemleri adım adım uyguladınız?",
-                    "Elde edilen ölçülebilir sonuç neydi?",
-                ]
-            question_pool.append({
-                "question": q,
-                "section": section,
-                "type": qtype,
-                "difficulty": diff,
-                "scenario": scenario,
-                "constraints": constraints,
-                "skills": skills,
-                "tags": tags,
-                "follow_ups": follow_ups,
-            })
-    except Exception:
-        question_pool = []
+            try:
+                if isinstance(pool_obj, dict) and isinstance(pool_obj.get("items"), list):
+                    items_obj = pool_obj.get("items")  # type: ignore[assignment]
+                elif isinstance(pool_obj, list):
+                    items_obj = pool_obj  # type: ignore[assignment]
+            except Exception:
+                items_obj = []
+            if not isinstance(items_obj, list):
+                items_obj = []
+            # Normalize
+            for it in items_obj:
+                if not isinstance(it, dict):
+                    continue
+                q = str(it.get("question", "")).strip()
+                if not q:
+                    continue
+                section = str(it.get("section", "")).strip() or "Genel"
+                qtype = str(it.get("type", "")).strip() or ""
+                diff = str(it.get("difficulty", "")).strip().lower() or "medium"
+                scenario = str(it.get("scenario", "")).strip()
+                constraints = [str(c).strip() for c in (it.get("constraints") or []) if str(c).strip()]
+                skills = [str(s).strip() for s in (it.get("skills") or []) if str(s).strip()]
+                tags = [str(s).strip() for s in (it.get("tags") or []) if str(s).strip()]
+                fups_raw = it.get("follow_ups") or []
+                follow_ups = [str(f).strip() for f in fups_raw if isinstance(f, (str,)) and str(f).strip()]
+                # Fallback follow-ups enforcing STAR completion
+                if not follow_ups:
+                    follow_ups = [
+                        "Bu örnekte durum ve bağlam neydi?",
+                        "Göreviniz tam olarak neydi?",
+                        "Hangi eylemleri adım adım uyguladınız?",
+                        "Elde edilen ölçülebilir sonuç neydi?",
+                    ]
+                question_pool.append({
+                    "question": q,
+                    "section": section,
+                    "type": qtype,
+                    "difficulty": diff,
+                    "scenario": scenario,
+                    "constraints": constraints,
+                    "skills": skills,
+                    "tags": tags,
+                    "follow_ups": follow_ups,
+                })
+        except Exception:
+            question_pool = []
+        return question_pool
+
+    # Both are independent LLM calls; run them side by side
+    req_spec, question_pool = await asyncio.gather(_requirements_spec(), _llm_question_pool())
 
     # Fallback question pool from requirements if LLM failed
     if not question_pool:
@@ -714,40 +698,26 @@ async def precompute_dialog_plan(session: AsyncSession, interview_id: int) -> di
         ],
     }
 
-    await merge_enrichment_into_analysis(session, interview_id, {"dialog_plan": plan, "requirements_spec": req_spec})
-    # Also prepare a concrete first question and store on Interview
+    # Also prepare a concrete first question on the Interview loaded above;
+    # the merge below commits it together with the plan
     try:
         # Force the first question per product spec with personalized greeting
         # Build candidate first name
         first_name = None
         try:
-            if cand and getattr(cand, "name", None):
-                first_name = str(cand.name).strip().split()[0]
+            if candidate_name:
+                first_name = str(candidate_name).strip().split()[0]
         except Exception:
             first_name = None
-        # Build company name from job owner
-        company_name = None
-        try:
-            from src.db.models.user import User
-            if job:
-                user = (
-                    await session.execute(_select(User).where(User.id == job.user_id))
-                ).scalar_one_or_none()
-                if user and getattr(user, "company_name", None):
-                    company_name = str(user.company_name).strip()
-        except Exception:
-            company_name = None
+        # Company name from the job owner
+        company_name = str(owner_company).strip() if owner_company else None
         greet = f"Merhaba {first_name}" if first_name else "Merhaba"
         intro = f", ben {company_name} sirketinden Ece." if company_name else ", ben Ece."
         q = f"{greet} hosgeldiniz{intro} Mulakatimiza baslamadan once kendinizi tanitir misiniz?"
-        iv = (
-            await session.execute(_select(Interview).where(Interview.id == interview_id))
-        ).scalar_one_or_none()
-        if iv:
-            iv.prepared_first_question = q
-            await session.commit()
+        interview.prepared_first_question = q
     except Exception:
         pass
+    await merge_enrichment_into_analysis(session, interview_id, {"dialog_plan": plan, "requirements_spec": req_spec})
     return plan
 
 
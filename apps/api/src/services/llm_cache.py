@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import math
+import operator
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Sequence
+
+
+def prompt_key(text: str) -> str:
+    """Stable exact-match key for a prompt."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def normalize(vec: Sequence[float]) -> tuple[float, ...]:
+    norm = math.sqrt(sum(x * x for x in vec)) or 1.0
+    return tuple(x / norm for x in vec)
+
+
+class SemanticCache:
+    """In-process LRU cache of LLM results with exact and near-duplicate lookup.
+
+    Exact hits are keyed by prompt hash. Optionally, each entry also carries a
+    unit-length embedding; get_similar() returns the best entry whose cosine
+    similarity reaches the threshold. Values are deep-copied in and out so
+    callers may mutate what they get back.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl_seconds: float = 3600, threshold: float = 0.95) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.threshold = threshold
+        # key -> (expires_at, embedding or None, value)
+        self._entries: OrderedDict[str, tuple[float, Optional[tuple[float, ...]], Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(entry[2])
+
+    def get_similar(self, embedding: Sequence[float]) -> Optional[Any]:
+        query = normalize(embedding)
+        now = time.monotonic()
+        best_key, best_score = None, self.threshold
+        for key, (expires_at, vec, _value) in list(self._entries.items()):
+            if expires_at < now:
+                del self._entries[key]
+                continue
+            if vec is None or len(vec) != len(query):
+                continue
+            score = sum(map(operator.mul, vec, query))
+            if score >= best_score:
+                best_key, best_score = key, score
+        if best_key is None:
+            return None
+        return self.get(best_key)
+
+    def put(self, key: str, value: Any, embedding: Optional[Sequence[float]] = None) -> None:
+        vec = normalize(embedding) if embedding else None
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, vec, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class PartitionedSemanticCache:
+    """One small SemanticCache per partition key, LRU-bounded over partitions.
+
+    Similarity lookups never cross partitions, so callers scope reuse (per
+    interview, per question shape, ...) and each linear scan stays short.
+    """
+
+    def __init__(
+        self,
+        partitions: int = 256,
+        per_partition: int = 64,
+        ttl_seconds: float = 3600,
+        threshold: float = 0.92,
+    ) -> None:
+        self._partitions: OrderedDict[str, SemanticCache] = OrderedDict()
+        self._max_partitions = partitions
+        self._per_partition = per_partition
+        self._ttl_seconds = ttl_seconds
+        self._threshold = threshold
+
+    def get_similar(self, partition: str, embedding: Sequence[float]) -> Optional[Any]:
+        cache = self._partitions.get(partition)
+        if cache is None:
+            return None
+        self._partitions.move_to_end(partition)
+        return cache.get_similar(embedding)
+
+    def put(self, partition: str, key: str, value: Any, embedding: Optional[Sequence[float]]) -> None:
+        cache = self._partitions.get(partition)
+        if cache is None:
+            cache = self._partitions[partition] = SemanticCache(
+                maxsize=self._per_partition,
+                ttl_seconds=self._ttl_seconds,
+                threshold=self._threshold,
+            )
+            while len(self._partitions) > self._max_partitions:
+                self._partitions.popitem(last=False)
+        self._partitions.move_to_end(partition)
+        cache.put(key, value, embedding)
+
+
+__all__ = ["SemanticCache", "PartitionedSemanticCache", "prompt_key", "normalize"]
@@ -30,9 +30,10 @@ class LLMRequest:
     model: str = "gpt-4o-mini"
     temperature: float = 0.3
     max_tokens: Optional[int] = None
-    response_format: Optional[Dict[str, str]] = None
+    response_format: Optional[Dict[str, Any]] = None
     system_message: Optional[str] = None
     messages: Optional[List[Dict[str, str]]] = None
+    seed: Optional[int] = None
 
 
 @dataclass
@@ -83,7 +84,8 @@ class LLMClient:
             "model": request.model,
             "temperature": request.temperature,
             "system_message": request.system_message,
-            "response_format": request.response_format
+            "response_format": request.response_format,
+            "seed": request.seed
         }
         key_str = json.dumps(key_data, sort_keys=True)
         return hashlib.md5(key_str.encode()).hexdigest()
@@ -180,6 +182,9 @@ class LLMClient:
         if request.response_format:
             payload["response_format"] = request.response_format
         
+        if request.seed is not None:
+            payload["seed"] = request.seed
+        
         start_time = time.time()
         
         async with httpx.AsyncClient(timeout=30) as client:
@@ -26,7 +26,7 @@ def _extract_mentioned_technologies(texts: List[str], max_items: int = 12) -> Li
     return found
 
 
-def _build_rolling_summary(history: List[Dict[str, str]], max_last_pairs: int = 4, max_len: int = 400) -> str:
+def build_rolling_summary(history: List[Dict[str, str]], max_last_pairs: int = 4, max_len: int = 400) -> str:
     """Create a compact Turkish rolling summary from recent Q/A pairs.
 
     Prioritizes the last N assistant questions and user answers.
@@ -75,7 +75,7 @@ async def enrich_session_memory(interview_id: int, history: List[Dict[str, str]]
     """
     try:
         # Build rolling summary
-        summary = _build_rolling_summary(history)
+        summary = build_rolling_summary(history)
         if summary:
             session_memory.update_summary(interview_id, summary)
 
@@ -148,23 +148,17 @@ class PremiumInterviewService:
         # Load context
         context = await self._load_interview_context(interview_id)
         
-        # Generate questions strategically
-        questions = []
+        # Generate questions strategically (independent per turn, so in parallel)
+        asked = sum(1 for msg in context.conversation_history if msg.get("role") == "assistant")
+        questions = await self.question_engine.generate_question_batch(
+            job_description=context.job_description,
+            resume_text=context.resume_text,
+            n_questions=question_count,
+            focus_competencies=focus_competencies,
+            start_turn=asked
+        )
         
-        for i in range(question_count):
-            focus_competency = None
-            if focus_competencies and i < len(focus_competencies):
-                focus_competency = focus_competencies[i]
-            
-            question = await self.question_engine.generate_strategic_question(
-                job_description=context.job_description,
-                resume_text=context.resume_text,
-                conversation_history=context.conversation_history,
-                focus_competency=focus_competency
-            )
-            
-            questions.append(question)
-            
+        for question in questions:
             # Simulate adding this question to conversation for next question context
             context.conversation_history.append({
                 "role": "assistant",
@@ -221,15 +215,9 @@ class PremiumInterviewService:
                     "done": False
                 }
         
-        # Generate fresh strategic question
-        question = await self.question_engine.generate_strategic_question(
-            job_description=context.job_description,
-            resume_text=context.resume_text,
-            conversation_history=context.conversation_history
-        )
+        question_count = sum(1 for msg in context.conversation_history if msg.get("role") == "assistant")
         
-        # Check if interview should end
-        question_count = len([msg for msg in context.conversation_history if msg.get("role") == "assistant"])
+        # Check if interview should end (before spending an LLM call)
         max_questions = 7
         
         if question_count >= max_questions:
@@ -240,6 +228,16 @@ class PremiumInterviewService:
                 "total_questions_asked": question_count
             }
         
+        # Generate fresh strategic question; prefetch the next one while the
+        # candidate answers unless this is the last question
+        question = await self.question_engine.generate_strategic_question(
+            job_description=context.job_description,
+            resume_text=context.resume_text,
+            conversation_history=context.conversation_history,
+            assistant_turn_count=question_count,
+            prefetch_next=question_count + 1 < max_questions
+        )
+        
         return {
             "question": question.question,
             "context": question.context,
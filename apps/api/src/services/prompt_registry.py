@@ -37,33 +37,16 @@ RECRUITER_PERSONA = (
 )
 
 
-def generic_question_prompt(
-    *,
-    industry: str,
-    difficulty: str,
-    question_type: str,
-    job_description: str,
-    competencies: List[str],
-    conversation_len: int
-) -> str:
-    """Prompt for non-situational question generation (keeps STAR implicit)."""
-    return f"""Sen dünyaca ünlü bir mülakat uzmanısın. {industry} sektöründe, {difficulty} seviye için {question_type} tipinde bir mülakat sorusu oluştur.
+# Static system prefix for non-situational questions. Never interpolated so
+# providers can serve it from their prompt cache; per-call fields go in the
+# user message built by generic_question_user_message().
+GENERIC_QUESTION_SYSTEM = """Sen dünyaca ünlü bir mülakat uzmanısın. Kullanıcı mesajındaki CONTEXT'te verilen sektör, seviye ve soru tipi için bir mülakat sorusu oluştur.
 
 TEMEL PRENSIP: 
 - STAR metodunu adaya SÖYLEMEYECEKSİN
 - Sorun doğal olarak STAR bileşenlerini (Durum, Görev, Eylem, Sonuç) çıkaracak şekilde olmalı
 - Aday fark etmeden somut örnekler vermeye yönlendirilmeli
 
-CONTEXT:
-- Sektör: {industry}
-- Seviye: {difficulty} 
-- Soru tipi: {question_type}
-- Hedef yetkinlikler: {', '.join(competencies)}
-- Konuşma geçmişi: {conversation_len} soru soruldu
-
-İŞ TANIMI (Referans için):
-{job_description[:2000]}
-
 SORU ÖZELLİKLERİ:
 1. Somut durum/proje sorulsun ("en zorlu", "en başarılı", "kritik bir durumda")
 2. Süreç ve eylemler doğal olarak çıksın ("nasıl çözdünüz", "ne yaptınız", "hangi adımları")
@@ -77,7 +60,7 @@ SORU ÖZELLİKLERİ:
 - Problem Solving: "Beklenmedik sistem yavaşlığını nasıl analiz ettiniz?" (yaklaşımı çıkarır)
 
 ZORUNLU JSON FORMAT:
-{{
+{
   "question": "Ana mülakat sorusu (Türkçe, net ve doğal)",
   "context": "Bu sorunun amacı ve hangi STAR bileşenlerini çıkaracağı",
   "follow_up_questions": [
@@ -86,11 +69,11 @@ ZORUNLU JSON FORMAT:
     "Bu deneyimden hangi dersleri çıkardınız?",
     "Benzer durumda ne farklı yaparsınız?"
   ],
-  "evaluation_rubric": {{
+  "evaluation_rubric": {
     "excellent": "Detaylı durum, net eylemler, ölçülebilir sonuçlar, öz-değerlendirme",
     "good": "Somut örnek, temel eylemler, genel sonuçlar",
     "poor": "Belirsiz örnek, eksik detay, sonuçsuz anlatım"
-  }},
+  },
   "red_flags": [
     "Somut örnek verememe",
     "Sorumluluk almaktan kaçınma",
@@ -103,17 +86,55 @@ ZORUNLU JSON FORMAT:
     "Ölçülebilir sonuçlar",
     "Öğrenme ve gelişim farkındalığı"
   ]
-}}
+}
 
 ÖNEMLİ: STAR metodunu, Situation/Task/Action/Result kelimelerini kullanma. Sadece doğal sorularla bu bilgileri çıkar."""
 
 
-def situational_prompt_base(*, job_description: str, competencies: List[str]) -> str:
-    """Base prompt text for job-specific situational question."""
-    return f"""Sen deneyimli bir İK uzmanısın. Aşağıdaki iş tanımını analiz et ve bu pozisyonda GERÇEKTEN yaşanabilecek spesifik durumu konu alan bir soru yaz.
+def generic_question_user_message(
+    *,
+    industry: str,
+    difficulty: str,
+    question_type: str,
+    job_description: str,
+    competencies: List[str],
+    conversation_len: int
+) -> str:
+    """Per-call part of the non-situational question prompt (pairs with GENERIC_QUESTION_SYSTEM)."""
+    return f"""CONTEXT:
+- Sektör: {industry}
+- Seviye: {difficulty} 
+- Soru tipi: {question_type}
+- Hedef yetkinlikler: {', '.join(competencies)}
+- Konuşma geçmişi: {conversation_len} soru soruldu
 
-İŞ TANIMI:
-{job_description[:3000]}
+İŞ TANIMI (Referans için):
+{job_description[:2000]}"""
+
+
+def generic_question_prompt(
+    *,
+    industry: str,
+    difficulty: str,
+    question_type: str,
+    job_description: str,
+    competencies: List[str],
+    conversation_len: int
+) -> str:
+    """Prompt for non-situational question generation (keeps STAR implicit)."""
+    return GENERIC_QUESTION_SYSTEM + "\n\n" + generic_question_user_message(
+        industry=industry,
+        difficulty=difficulty,
+        question_type=question_type,
+        job_description=job_description,
+        competencies=competencies,
+        conversation_len=conversation_len,
+    )
+
+
+# Static system prefix for job-specific situational questions; the job text
+# and competencies go in situational_user_message().
+SITUATIONAL_QUESTION_SYSTEM = """Sen deneyimli bir İK uzmanısın. Kullanıcı mesajındaki iş tanımını analiz et ve bu pozisyonda GERÇEKTEN yaşanabilecek spesifik durumu konu alan bir soru yaz.
 
 GÖREV: Bu işte çalışan birinin karşılaşacağı gerçekçi bir durum sorusu oluştur.
 
@@ -121,16 +142,47 @@ ZORUNLU KURALLAR:
 1. Soru o işin GÜNLÜK GERÇEKLİĞİNDEN alınmalı (müşteri, takım, süreç, kriz durumları)
 2. Spesifik bir durumu betimle: "Bu pozisyonda [somut durum açıklaması]. Bu durumda nasıl hareket edersiniz?"
 3. Durum o sektör ve pozisyona özel olmalı (genel değil, özel!)
-4. Hedef yetkinlik test etsin: {', '.join(competencies)}
+4. Kullanıcı mesajında verilen hedef yetkinlikleri test etsin
 
 YASAKLI SORULAR:
 ❌ "Hangi iletişim yöntemlerini kullanırsınız?" (çok genel)
 ❌ "E-posta dışında hangi araçları tercih edersiniz?" (anlamsız)
 ❌ "Takım çalışması deneyiminiz nedir?" (özgeçmiş sorusu)
 ❌ "Problem çözme yaklaşımınızı anlatın" (teorik)
+
+JSON FORMAT:
+{
+  "question": "Gerçekçi durum sorusu (Türkçe, spesifik, o işe özel)",
+  "context": "Bu sorunun test ettiği yetkinlikler ve STAR bileşenleri",
+  "follow_up_questions": [
+    "Bu durumda önceliğinizi nasıl belirlerdiniz?",
+    "Sonuçtan nasıl emin olurdunuz?",
+    "Bu yaklaşımınızın risklerini nasıl yönetirdiniz?"
+  ],
+  "evaluation_rubric": {
+    "excellent": "Somut adımlar, risk analizi, sonuç odaklı yaklaşım",
+    "good": "Temel adımları bilme, uygun yaklaşım",
+    "poor": "Belirsiz cevap, adımları bilmeme"
+  }
+}
 """
 
 
+def situational_user_message(*, job_description: str, competencies: List[str]) -> str:
+    """Per-call part of the situational question prompt (pairs with SITUATIONAL_QUESTION_SYSTEM)."""
+    return f"""HEDEF YETKİNLİKLER: {', '.join(competencies)}
+
+İŞ TANIMI:
+{job_description[:3000]}"""
+
+
+def situational_prompt_base(*, job_description: str, competencies: List[str]) -> str:
+    """Base prompt text for job-specific situational question."""
+    return SITUATIONAL_QUESTION_SYSTEM + "\n" + situational_user_message(
+        job_description=job_description, competencies=competencies
+    ) + "\n"
+
+
 def job_scenarios_generation_prompt(job_desc: str) -> str:
     return f"""İş tanımını analiz et ve bu pozisyonda GERÇEKTEN yaşanabilecek spesifik durumları konu alan sorular oluştur.
 
@@ -14,7 +14,7 @@ from src.core.s3 import generate_presigned_get_url
 from src.db.models.interview import Interview
 from src.db.models.conversation import ConversationMessage
 from src.db.models.candidate import Candidate
-from src.db.session import async_session_factory
+from src.db.session import worker_session_factory
 from src.services.stt import transcribe_audio_batch
 from src.services.analysis import (
     generate_llm_full_analysis,
@@ -57,8 +57,9 @@ async def _maybe_complete_interview(session: AsyncSession, interview: Interview)
 async def process_interview(interview_id: int) -> None:
     """Main processing pipeline: transcribe (if needed) + analysis + enrichment.
 
-    Safe to call multiple times (idempotent-ish)."""
-    async with async_session_factory() as session:
+    Safe to call multiple times (idempotent-ish). Uses the NullPool worker
+    engine because callers may run it in a fresh event loop per job."""
+    async with worker_session_factory() as session:
         interview = (
             await session.execute(select(Interview).where(Interview.id == interview_id))
         ).scalar_one_or_none()
@@ -0,0 +1,40 @@
+import orjson
+import pytest
+
+import src.services.adaptive_questions as aq
+
+
+@pytest.mark.asyncio
+async def test_new_answer_gets_fresh_weakness_analysis(monkeypatch) -> None:
+    prompts = []
+
+    async def _post_chat(body, timeout):
+        prompts.append(body["messages"][1]["content"])
+        content = {"weak_areas": [{"area": "a", "evidence": f"answer {len(prompts)}"}]}
+        return {"choices": [{"message": {"content": orjson.dumps(content).decode()}}]}
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setattr(aq, "_post_chat", _post_chat)
+    history = [{"role": "assistant", "text": "Son projenizi anlatın"}, {"role": "user", "text": "Ödeme servisini yazdım"}]
+
+    first = await aq.analyze_response_weaknesses(history, "Fresh analysis role", interview_id=9001)
+    assert await aq.analyze_response_weaknesses(history, "Fresh analysis role", interview_id=9001) == first
+    assert len(prompts) == 1 and "Ödeme servisini yazdım" in prompts[0]
+
+    longer = history + [{"role": "assistant", "text": "Nasıl test ettiniz?"}, {"role": "user", "text": "Entegrasyon testleriyle"}]
+    second = await aq.analyze_response_weaknesses(longer, "Fresh analysis role", interview_id=9001)
+    assert second["weak_areas"][0]["evidence"] == "answer 2"
+    assert "Entegrasyon testleriyle" in prompts[1]
+
+def test_long_transcript_labels_its_summary(monkeypatch) -> None:
+    monkeypatch.setattr(aq, "MAX_CONV_TOKENS", 50)
+    history = []
+    for i in range(20):
+        history += [{"role": "assistant", "text": f"Soru {i} " * 5}, {"role": "user", "text": f"Cevap {i} " * 5}]
+    text = aq._conversation_text(history, None)
+    label = text.partition("] ")[0]
+    start = int(label.split("-")[1].split(",")[0])
+    assert label == f"[Turn 1-{start}, last {aq._SUMMARY_PAIRS} Q/A pairs"
+    # Older exchanges than the last _SUMMARY_PAIRS of the prefix are dropped
+    assert start > 2 * aq._SUMMARY_PAIRS and "Soru 0 " not in text
+    assert f"[Turn {start + 1}]" in text and "Cevap 19" in text
@@ -0,0 +1,266 @@
+import asyncio
+import inspect
+import time
+
+import pytest
+
+from src.services import advanced_question_engine as aqe
+from src.services.advanced_question_engine import (
+    AdvancedQuestionEngine,
+    DifficultyLevel,
+    IndustryType,
+    QuestionType,
+    _LLMCache,
+)
+from src.services.llm_client import LLMProvider, LLMRequest, LLMResponse
+
+
+@pytest.fixture
+def make_engine(monkeypatch):
+    """Build engines whose LLM answers with respond(request), isolated from the shared caches"""
+    monkeypatch.setattr(aqe, "_JOB_QUESTION_CACHE", aqe.PartitionedSemanticCache())
+    monkeypatch.setattr(aqe, "_JOB_EMBEDDINGS", aqe.SemanticCache(maxsize=8))
+
+    def _make(respond):
+        class _Client:
+            async def generate(self, request):
+                content = respond(request)
+                if inspect.isawaitable(content):
+                    content = await content
+                return LLMResponse(content=content, provider=LLMProvider.OPENAI, model="m")
+
+        engine = AdvancedQuestionEngine()
+        engine.llm_client = _Client()
+        engine._cache = _LLMCache(maxsize=8)
+        return engine
+
+    return _make
+
+
+@pytest.mark.asyncio
+async def test_response_cache_coalesces_and_skips_fallback() -> None:
+    cache = _LLMCache(maxsize=8)
+    calls = 0
+
+    async def _call() -> LLMResponse:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return LLMResponse(content="q", provider=LLMProvider.OPENAI, model="m")
+
+    results = await asyncio.gather(*[cache.get_or_set("k", _call) for _ in range(5)])
+    assert results == ["q"] * 5
+    assert await cache.get_or_set("k", _call) == "q"
+    assert calls == 1
+
+    async def _fallback() -> LLMResponse:
+        nonlocal calls
+        calls += 1
+        return LLMResponse(content="f", provider=LLMProvider.FALLBACK, model="rule-based")
+
+    await cache.get_or_set("f", _fallback)
+    await cache.get_or_set("f", _fallback)
+    assert calls == 3
+
+
+def test_job_keyword_analysis() -> None:
+    engine = AdvancedQuestionEngine()
+    jd = "Senior Python engineer for a fintech startup; mentor the team and debug scalable systems"
+    assert engine._detect_industry_from_job(jd) == IndustryType.FINANCE
+    assert engine._extract_key_competencies(jd) == [
+        "Technical Proficiency", "Leadership", "System Design", "Problem Solving", "Communication",
+    ]
+    assert engine._determine_difficulty_level(jd, "") == DifficultyLevel.MID
+    assert engine._determine_difficulty_level(jd, "10 years of experience") == DifficultyLevel.SENIOR
+    assert engine._determine_difficulty_level("Support role", "") == DifficultyLevel.JUNIOR
+    assert engine._detect_industry_from_job("Backend role") == IndustryType.TECH
+
+
+@pytest.mark.asyncio
+async def test_question_batch_plans_types_per_turn(make_engine) -> None:
+    engine = make_engine(lambda request: '{"question": "q"}')
+    questions = await engine.generate_question_batch("Batch test role for retail stores", n_questions=6)
+    assert len(questions) == 6
+    assert questions[0].metadata.question_type == QuestionType.BEHAVIORAL
+    assert {q.metadata.question_type for q in questions[1:3]} <= {QuestionType.TECHNICAL, QuestionType.COMPETENCY}
+    assert questions[5].metadata.question_type in {QuestionType.CULTURE_FIT, QuestionType.LEADERSHIP}
+    assert all(q.metadata.industry == IndustryType.RETAIL for q in questions)
+
+
+def test_question_analytics_single_pass() -> None:
+    engine = AdvancedQuestionEngine()
+    questions = [
+        engine._get_fallback_question(QuestionType.TECHNICAL, IndustryType.TECH, DifficultyLevel.MID, ["A"]),
+        engine._get_fallback_question(QuestionType.TECHNICAL, IndustryType.FINANCE, DifficultyLevel.SENIOR, ["A", "B"]),
+    ]
+    analytics = engine.get_question_analytics(questions)
+    assert analytics["type_distribution"] == {"technical": 2}
+    assert analytics["difficulty_distribution"] == {"mid": 1, "senior": 1}
+    assert analytics["industry_distribution"] == {"tech": 1, "finance": 1}
+    assert analytics["avg_estimated_time"] == 3
+    assert sorted(analytics["competency_coverage"]) == ["A", "B"]
+    assert engine.get_question_analytics([]) == {}
+
+
+def test_job_keywords_match_at_word_start() -> None:
+    engine = AdvancedQuestionEngine()
+    assert engine._detect_industry_from_job("We exceed targets across the ecosystem") == IndustryType.TECH
+    assert engine._extract_key_competencies("We exceed targets across the ecosystem") == []
+    # "architecture" implies the "architect" seniority keyword as well
+    assert engine._extract_key_competencies("Own the architecture of our teams") == ["System Design", "Communication"]
+    assert engine._determine_difficulty_level("Own the architecture", "") == DifficultyLevel.MID
+
+
+@pytest.mark.asyncio
+async def test_high_temperature_requests_bypass_cache(make_engine) -> None:
+    calls = 0
+
+    def _respond(request):
+        nonlocal calls
+        calls += 1
+        return str(calls)
+
+    engine = make_engine(_respond)
+    hot = LLMRequest(prompt="bypass", temperature=0.9)
+    assert await engine._cached_generate(hot) == "1"
+    assert await engine._cached_generate(hot) == "2"
+    cool = LLMRequest(prompt="bypass", temperature=0.3)
+    assert await engine._cached_generate(cool) == "3"
+    assert await engine._cached_generate(cool) == "3"
+
+
+@pytest.mark.asyncio
+async def test_slow_generation_falls_back_but_fills_cache(make_engine, monkeypatch) -> None:
+    release = asyncio.Event()
+
+    async def _respond(request):
+        await release.wait()
+        return '{"question": "slow"}'
+
+    monkeypatch.setattr(aqe, "_QUESTION_TIMEOUT_SECONDS", 0.01)
+    engine = make_engine(_respond)
+    args = (QuestionType.TECHNICAL, IndustryType.TECH, DifficultyLevel.MID, "Timeout test role", ["A"], [])
+    first = await engine._generate_smart_question(*args)
+    assert first.question != "slow"
+    release.set()
+    await asyncio.sleep(0.01)
+    assert (await engine._generate_smart_question(*args)).question == "slow"
+
+
+@pytest.mark.asyncio
+async def test_truncated_json_retries_with_larger_budget(make_engine) -> None:
+    budgets = []
+
+    def _respond(request):
+        budgets.append(request.max_tokens)
+        return '{"question": "cut' if request.max_tokens < 600 else '{"question": "full"}'
+
+    engine = make_engine(_respond)
+    args = (QuestionType.TECHNICAL, IndustryType.TECH, DifficultyLevel.MID, "Truncation test role", ["A"], [])
+    assert (await engine._generate_smart_question(*args)).question == "full"
+    assert budgets == [350, 600]
+    # The truncated reply was not cached; the retried one was
+    assert (await engine._generate_smart_question(*args)).question == "full"
+    assert budgets == [350, 600, 350]
+
+
+@pytest.mark.asyncio
+async def test_truncated_then_slow_retry_stays_within_deadline(make_engine, monkeypatch) -> None:
+    async def _respond(request):
+        if request.max_tokens < 600:
+            await asyncio.sleep(0.1)
+            return '{"question": "cut'
+        await asyncio.sleep(1)
+        return '{"question": "full"}'
+
+    monkeypatch.setattr(aqe, "_QUESTION_TIMEOUT_SECONDS", 0.2)
+    engine = make_engine(_respond)
+    args = (QuestionType.TECHNICAL, IndustryType.TECH, DifficultyLevel.MID, "Retry deadline test role", ["A"], [])
+    started = time.monotonic()
+    question = await engine._generate_smart_question(*args)
+    assert time.monotonic() - started < 0.2 + 0.05
+    assert question.question != "full"
+
+
+def test_fallback_questions_rotate() -> None:
+    engine = AdvancedQuestionEngine()
+    args = (IndustryType.TECH, DifficultyLevel.MID, [])
+    technical = [engine._get_fallback_question(QuestionType.TECHNICAL, *args).question for _ in range(4)]
+    assert technical[0] != technical[1] and technical[:2] == technical[2:]
+    generic = {engine._get_fallback_question(QuestionType.LEADERSHIP, *args).question for _ in range(3)}
+    assert len(generic) == 3
+
+
+@pytest.mark.asyncio
+async def test_prefetched_next_question_is_reused(make_engine) -> None:
+    calls = 0
+
+    def _respond(request):
+        nonlocal calls
+        calls += 1
+        return f'{{"question": "q{calls}"}}'
+
+    engine = make_engine(_respond)
+    jd = "Prefetch test role for logistics"
+    first = await engine.generate_strategic_question(jd, assistant_turn_count=0, prefetch_next=True)
+    (_, task), = engine._prefetch.values()
+    await task
+    assert calls == 2
+    second = await engine.generate_strategic_question(jd, assistant_turn_count=1)
+    assert calls == 2
+    assert {first.question, second.question} == {"q1", "q2"}
+    assert not engine._prefetch
+
+
+@pytest.mark.asyncio
+async def test_prefetch_is_keyed_by_focus_competency(make_engine) -> None:
+    engine = make_engine(lambda request: '{"question": "q"}')
+    jd = "Focused prefetch test role for retail"
+    await engine.generate_strategic_question(jd, focus_competency="Ownership", assistant_turn_count=0, prefetch_next=True)
+    (_, task), = engine._prefetch.values()
+    await task
+    await engine.generate_strategic_question(jd, focus_competency="Teamwork", assistant_turn_count=1)
+    assert len(engine._prefetch) == 1
+    await engine.generate_strategic_question(jd, focus_competency="Ownership", assistant_turn_count=1)
+    assert not engine._prefetch
+
+
+@pytest.mark.asyncio
+async def test_cancelled_owner_does_not_cancel_coalesced_waiters() -> None:
+    cache = _LLMCache(maxsize=8)
+    started = asyncio.Event()
+    calls = 0
+
+    async def _call() -> LLMResponse:
+        nonlocal calls
+        calls += 1
+        started.set()
+        await asyncio.sleep(0.01)
+        return LLMResponse(content="q", provider=LLMProvider.OPENAI, model="m")
+
+    owner = asyncio.ensure_future(cache.get_or_set("k", _call))
+    await started.wait()
+    waiter = asyncio.ensure_future(cache.get_or_set("k", _call))
+    await asyncio.sleep(0)
+    owner.cancel()
+    assert await waiter == "q"
+    assert owner.cancelled()
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_job_embedding_is_memoised_and_bounded(monkeypatch) -> None:
+    calls = []
+
+    async def embed(text):
+        calls.append(text)
+        if text.startswith("slow"):
+            await asyncio.sleep(1)
+        return [1.0, 0.0]
+
+    monkeypatch.setattr(aqe, "embed", embed)
+    monkeypatch.setattr(aqe, "_JOB_EMBEDDINGS", aqe.SemanticCache(maxsize=8))
+    assert await aqe._job_embedding("Data  engineer\nrole", 1.0) == [1.0, 0.0]
+    assert await aqe._job_embedding("Data engineer role", 1.0) == [1.0, 0.0]
+    assert calls == ["Data engineer role"]
+    assert await aqe._job_embedding("slow role", 0.01) is None
@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import orjson
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.services.analysis import _job_topics, generate_rule_based_analysis
+
+
+def test_job_topics_skips_stopwords_and_duplicates() -> None:
+    text = "Backend geliştirici ve Python, python; Node.js ile C# / C++ deneyimi, Docker"
+    assert _job_topics(text) == ["backend", "geliştirici", "python", "node.js", "c++", "docker"]
+    assert _job_topics(text, max_items=2) == ["backend", "geliştirici"]
+    assert _job_topics("") == []
+
+
+def test_job_topics_splits_on_backslash() -> None:
+    assert _job_topics(r"react\redux") == ["react", "redux"]
+
+
+class _Result:
+    def __init__(self, value):
+        self.value = value
+
+    def scalars(self):
+        return SimpleNamespace(all=lambda: self.value)
+
+    def one_or_none(self):
+        return self.value
+
+    def scalar_one(self):
+        return self.value
+
+
+class _Session:
+    """Answers the messages query, the job/resume query, then captures the upsert"""
+
+    def __init__(self, messages, context_row):
+        self._results = [messages, context_row]
+        self.upsert_params = None
+
+    async def execute(self, stmt, execution_options=None):
+        if self._results:
+            return _Result(self._results.pop(0))
+        self.upsert_params = stmt.compile(dialect=postgresql.dialect()).params
+        return _Result("analysis")
+
+    async def commit(self):
+        pass
+
+
+def _message(role, content, timestamp):
+    return SimpleNamespace(role=SimpleNamespace(value=role), content=content, timestamp=timestamp)
+
+
+@pytest.mark.asyncio
+async def test_rule_based_analysis_matches_baseline_metrics() -> None:
+    t0 = datetime(2024, 1, 1, 10, 0, 0)
+    messages = [
+        _message("assistant", "Kendinizi tanıtın", t0),
+        _message("user", "Yani ben API ve Docker ile çalıştım", t0 + timedelta(seconds=30)),
+        # Two questions back-to-back are both answered by the next user turn
+        _message("assistant", "Takımınızdan bahsedin", t0 + timedelta(seconds=60)),
+        _message("assistant", "Bir örnek verin", t0 + timedelta(seconds=90)),
+        _message("user", "Takım içinde iletişim önemlidir", t0 + timedelta(seconds=150)),
+        # Over the 6 h cap, so this gap is ignored; the untimed answer adds no latency
+        _message("assistant", "Son soru", t0 + timedelta(hours=8)),
+        _message("user", "Hayır", None),
+    ]
+    session = _Session(messages, ("Backend developer", None))
+
+    assert await generate_rule_based_analysis(session, 7) == "analysis"
+    params = session.upsert_params
+    assert params["interview_id"] == 7
+    assert (params["communication_score"], params["technical_score"], params["cultural_fit_score"]) == (63.0, 60.0, 60.0)
+    assert params["overall_score"] == 61.0
+    assert params["summary"].startswith("Interview contained 4 questions and 3 answers. Average answer length was 4.0 words.")
+    assert params["summary"].endswith("Job context: 'Backend developer...'")
+    assert orjson.loads(params["technical_assessment"])["meta"] == {
+        "question_count": 4,
+        "answer_count": 3,
+        "avg_answer_length_words": 4.0,
+        "filler_word_count": 1,
+        "top_keywords": ["api", "docker", "iletişim", "takım"],
+        "avg_answer_latency_seconds": 60.0,
+        "avg_inter_question_gap_seconds": 45.0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_rule_based_analysis_without_messages() -> None:
+    session = _Session([], None)
+    await generate_rule_based_analysis(session, 7)
+    assert session.upsert_params["overall_score"] == 0.0
+    assert session.upsert_params["summary"] == "No conversation captured."
+    assert orjson.loads(session.upsert_params["technical_assessment"])["meta"]["question_count"] == 0
@@ -0,0 +1,42 @@
+from src.services.llm_cache import PartitionedSemanticCache, SemanticCache, prompt_key
+
+
+def test_exact_hit_returns_copy() -> None:
+    cache = SemanticCache(maxsize=4)
+    key = prompt_key("prompt")
+    cache.put(key, {"weak_areas": [{"area": "x"}]})
+    got = cache.get(key)
+    assert got == {"weak_areas": [{"area": "x"}]}
+    got["weak_areas"].clear()
+    assert cache.get(key) == {"weak_areas": [{"area": "x"}]}
+    assert cache.get(prompt_key("other")) is None
+
+
+def test_similar_hit_respects_threshold() -> None:
+    cache = SemanticCache(maxsize=4, threshold=0.95)
+    cache.put(prompt_key("a"), {"v": 1}, [1.0, 0.0, 0.0])
+    assert cache.get_similar([0.99, 0.05, 0.0]) == {"v": 1}
+    assert cache.get_similar([0.0, 1.0, 0.0]) is None
+
+
+def test_lru_eviction_and_ttl() -> None:
+    cache = SemanticCache(maxsize=2)
+    for name in ("a", "b", "c"):
+        cache.put(prompt_key(name), name)
+    assert len(cache) == 2
+    assert cache.get(prompt_key("a")) is None
+
+    expired = SemanticCache(ttl_seconds=-1)
+    expired.put(prompt_key("a"), "a", [1.0])
+    assert expired.get(prompt_key("a")) is None
+    assert expired.get_similar([1.0]) is None
+
+
+def test_partitioned_semantic_cache_isolates_partitions() -> None:
+    cache = PartitionedSemanticCache(partitions=2, per_partition=4, threshold=0.9)
+    cache.put("technical|mid", "k1", "q1", [1.0, 0.0])
+    assert cache.get_similar("technical|mid", [0.98, 0.1]) == "q1"
+    assert cache.get_similar("behavioral|mid", [1.0, 0.0]) is None
+    cache.put("b", "k2", "q2", [1.0, 0.0])
+    cache.put("c", "k3", "q3", [1.0, 0.0])
+    assert cache.get_similar("technical|mid", [1.0, 0.0]) is None
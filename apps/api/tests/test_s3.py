@@ -0,0 +1,18 @@
+from botocore.exceptions import (
+    ClientError,
+    EndpointConnectionError,
+    NoCredentialsError,
+    ParamValidationError,
+    ReadTimeoutError,
+)
+
+from src.core.s3 import _retryable
+
+
+def test_only_transport_and_throttling_errors_are_retried() -> None:
+    assert _retryable(EndpointConnectionError(endpoint_url="https://s3"))
+    assert _retryable(ReadTimeoutError(endpoint_url="https://s3"))
+    assert _retryable(ClientError({"Error": {"Code": "SlowDown"}}, "PutObject"))
+    assert not _retryable(NoCredentialsError())
+    assert not _retryable(ParamValidationError(report="bad key"))
+    assert not _retryable(ClientError({"Error": {"Code": "AccessDenied"}, "ResponseMetadata": {"HTTPStatusCode": 403}}, "PutObject"))
@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.auth.user_cache import UserCache, mark_users_changed
+
+
+class _Redis:
+    def __init__(self) -> None:
+        self.store: dict = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+
+def test_secret_columns_are_not_cached() -> None:
+    assert "hashed_password" not in UserCache()._columns
+
+
+@pytest.mark.asyncio
+async def test_bypass_skips_cached_rows() -> None:
+    cache = UserCache()
+    cache._redis = _Redis()
+    cache._redis.store["u:1"] = '{"id": 1}'
+    assert await cache.get(1) == {"id": 1}
+    with cache.bypass():
+        assert await cache.get(1) is None
+    assert await cache.get(1) == {"id": 1}
+
+
+def test_mark_users_changed_queues_invalidation() -> None:
+    class _Session:
+        def __init__(self) -> None:
+            self.info: dict = {}
+
+    session = _Session()
+    mark_users_changed(session, [3, 4])
+    assert session.info["changed_user_ids"] == {3, 4}
+
+
+@pytest.mark.asyncio
+async def test_scheduled_invalidation_hides_row_until_done() -> None:
+    cache = UserCache()
+    cache._redis = _Redis()
+    cache._redis.store["u:1"] = '{"id": 1}'
+
+    async def delete(key):
+        cache._redis.store.pop(key, None)
+
+    cache._redis.delete = delete
+    cache.invalidate_later(asyncio.get_running_loop(), 1)
+    assert cache._tasks and await cache.get(1) is None
+    await asyncio.gather(*cache._tasks)
+    assert not cache._tasks and not cache._pending
+    assert "u:1" not in cache._redis.store
+
+
+def test_to_user_merges_into_existing_identity() -> None:
+    cache = UserCache()
+    session = Session()
+    first = cache.to_user({"id": 5, "email": "a@example.com"}, session)
+    assert cache.to_user({"id": 5, "email": "a@example.com"}, session) is first
+    assert first in session and not session.dirty